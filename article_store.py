@@ -0,0 +1,147 @@
+"""
+Article store module for the sqlite output format.
+Upserts articles into a single indexed SQLite database, so articles can
+be queried by feed, time or link instead of scanning output files.
+"""
+
+import json
+import os
+import sqlite3
+from typing import Dict, List
+
+from logger_utils import NewsLogger, ConfigError
+from seen_index import article_key
+
+
+# Upserts need SQLite 3.24
+MIN_SQLITE_VERSION = (3, 24, 0)
+
+COLUMNS = [
+    'article_key', 'feed_name', 'title', 'link', 'canonical_link', 'guid',
+    'summary', 'published', 'author', 'categories', 'duplicates', 'fetched_at'
+]
+
+SCHEMA = [
+    """CREATE TABLE IF NOT EXISTS articles (
+        id INTEGER PRIMARY KEY,
+        article_key TEXT NOT NULL UNIQUE,
+        feed_name TEXT NOT NULL,
+        title TEXT,
+        link TEXT,
+        canonical_link TEXT,
+        guid TEXT,
+        summary TEXT,
+        published TEXT,
+        author TEXT,
+        categories TEXT,
+        duplicates TEXT,
+        fetched_at TEXT NOT NULL
+    )""",
+    "CREATE INDEX IF NOT EXISTS articles_feed_published ON articles (feed_name, published)",
+    "CREATE INDEX IF NOT EXISTS articles_canonical_link ON articles (canonical_link)",
+    "CREATE INDEX IF NOT EXISTS articles_fetched_at ON articles (fetched_at)",
+]
+
+# One statement, prepared once and reused for every row of a batch. A
+# re-fetched article keeps its row id and first fetch time.
+UPSERT = (
+    f"INSERT INTO articles ({', '.join(COLUMNS)}) "
+    f"VALUES ({', '.join('?' * len(COLUMNS))}) "
+    f"ON CONFLICT (article_key) DO UPDATE SET "
+    + ', '.join(
+        f"{column} = excluded.{column}"
+        for column in COLUMNS if column not in ('article_key', 'fetched_at')
+    )
+)
+
+
+class ArticleStore:
+    """SQLite database of articles, upserted by article identity."""
+
+    def __init__(self, db_file: str, logger: NewsLogger, batch_size: int = 1000):
+        """
+        Open the database, creating its tables and indexes if needed.
+
+        Args:
+            db_file: Path to the SQLite database
+            logger: Logger instance for logging
+            batch_size: Articles written per transaction
+
+        Raises:
+            ConfigError: If SQLite is too old or the database cannot be opened
+        """
+        if sqlite3.sqlite_version_info < MIN_SQLITE_VERSION:
+            raise ConfigError(
+                f"The sqlite output format requires SQLite 3.24 or newer "
+                f"(found {sqlite3.sqlite_version})"
+            )
+
+        self.db_file = db_file
+        self.logger = logger
+        self.batch_size = max(1, batch_size)
+
+        directory = os.path.dirname(db_file)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        try:
+            self._db = sqlite3.connect(db_file)
+            # WAL lets readers query the database while a run writes to it
+            self._db.execute("PRAGMA journal_mode = WAL")
+            self._db.execute("PRAGMA synchronous = NORMAL")
+            with self._db:
+                for statement in SCHEMA:
+                    self._db.execute(statement)
+        except sqlite3.Error as e:
+            raise ConfigError(f"Cannot open article database {db_file}: {str(e)}")
+
+    @staticmethod
+    def row(article: Dict) -> tuple:
+        """
+        Convert an article to the column values of its row.
+
+        Args:
+            article: Article dictionary
+
+        Returns:
+            Values in COLUMNS order; lists are stored as JSON
+        """
+        key = article_key(article) or f"{article.get('feed_name', '')}\n{article.get('title', '')}"
+        return (
+            key,
+            article.get('feed_name', ''),
+            article.get('title'),
+            article.get('link'),
+            article.get('canonical_link', article.get('link')),
+            article.get('guid'),
+            article.get('summary'),
+            article.get('published'),
+            article.get('author'),
+            json.dumps(article.get('categories', []), ensure_ascii=False),
+            json.dumps(article.get('duplicates', []), ensure_ascii=False),
+            article.get('fetched_at', '')
+        )
+
+    def upsert(self, articles: List[Dict]) -> int:
+        """
+        Insert articles, updating those already stored.
+
+        Args:
+            articles: Articles to store
+
+        Returns:
+            Number of articles written
+
+        Raises:
+            sqlite3.Error: If a batch could not be written; earlier
+                batches stay committed
+        """
+        for start in range(0, len(articles), self.batch_size):
+            batch = articles[start:start + self.batch_size]
+            with self._db:
+                self._db.executemany(UPSERT, map(self.row, batch))
+        return len(articles)
+
+    def close(self):
+        """Close the database."""
+        self._db.close()
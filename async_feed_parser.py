@@ -0,0 +1,278 @@
+"""
+Asyncio feed fetching module.
+Fetches feeds concurrently on a single event loop using aiohttp.
+"""
+
+import asyncio
+from contextlib import nullcontext
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+
+import feedparser
+
+from feed_parser import FeedParser, RETRY_STATUSES, parse_retry_after
+from body_reader import CHUNK_SIZE, ACCEPT_ENCODING
+from logger_utils import (
+    NewsLogger, NetworkError, ParseError, ConfigError, RetryableError, RetryLater,
+    DeadlineExceeded
+)
+
+try:
+    import aiohttp
+except ImportError:  # optional dependency, only needed for the asyncio backend
+    aiohttp = None
+
+
+class AsyncFeedParser:
+    """Asyncio counterpart of FeedParser.fetch_feed built on aiohttp."""
+
+    def __init__(self, parser: FeedParser, logger: NewsLogger):
+        """
+        Initialize the async feed parser.
+
+        Args:
+            parser: Feed parser providing network settings and feed parsing
+            logger: Logger instance for logging
+
+        Raises:
+            ConfigError: If aiohttp is not installed
+        """
+        if aiohttp is None:
+            raise ConfigError(
+                "The asyncio fetch backend requires aiohttp "
+                "(pip install -r requirements-optional.txt)"
+            )
+
+        self.parser = parser
+        self.logger = logger
+        self.session = None
+        self._new_connections = 0
+        self._reused_connections = 0
+
+    def get_session(self) -> "aiohttp.ClientSession":
+        """
+        Return the shared HTTP session, creating it on first use.
+
+        The session must be used from the event loop it was created on;
+        NewsFetcher keeps one loop alive so connections survive between runs.
+
+        Returns:
+            aiohttp client session
+        """
+        if self.session is None or self.session.closed:
+            trace_config = aiohttp.TraceConfig()
+            trace_config.on_connection_create_end.append(self._on_connection_create)
+            trace_config.on_connection_reuseconn.append(self._on_connection_reuse)
+
+            # aiohttp only supports one limit for every host, so the
+            # largest configured per-host pool size is used
+            per_host = max(
+                [self.parser.pool_maxsize, *self.parser.host_pool_sizes.values()]
+            )
+            connector = aiohttp.TCPConnector(limit=0, limit_per_host=per_host)
+
+            # Bodies are decompressed by BodyReader as they stream in
+            self.session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.parser.timeout),
+                headers={'User-Agent': 'NewsFetcher/1.0',
+                         'Accept-Encoding': ACCEPT_ENCODING},
+                auto_decompress=False,
+                trace_configs=[trace_config]
+            )
+        return self.session
+
+    async def _on_connection_create(self, session, context, params):
+        self._new_connections += 1
+
+    async def _on_connection_reuse(self, session, context, params):
+        self._reused_connections += 1
+
+    def connection_stats(self) -> Tuple[int, int]:
+        """
+        Count connections opened and reused since the previous call.
+
+        Returns:
+            Tuple of (new_connections, reused_connections)
+        """
+        stats = (self._new_connections, self._reused_connections)
+        self._new_connections = 0
+        self._reused_connections = 0
+        return stats
+
+    async def close(self):
+        """Close the HTTP session and its pooled connections."""
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+        self.session = None
+
+    async def fetch_feed(self, feed_url: str,
+                         cutoff_time: Optional[datetime] = None) -> Optional[feedparser.FeedParserDict]:
+        """
+        Fetch and parse a feed with retry logic without blocking the loop.
+
+        Args:
+            feed_url: URL of the RSS/Atom feed
+            cutoff_time: Start of the time window, enables early termination
+
+        Returns:
+            Parsed feed dictionary or None if failed
+        """
+        download = await self.download_feed(feed_url, incremental=True,
+                                            cutoff_time=cutoff_time)
+
+        if download is None:
+            return None
+
+        return self.parser.parse_download(feed_url, download, cutoff_time)
+
+    def request_slot(self, feed_url: str, deadline: Optional[float] = None):
+        """
+        Wait for the rate limiter before requesting a feed.
+
+        Args:
+            feed_url: URL of the RSS/Atom feed
+            deadline: time.monotonic() value the wait must end by
+
+        Returns:
+            Async context manager holding the host's connection slot
+        """
+        if self.parser.rate_limiter is None:
+            return nullcontext()
+        return self.parser.rate_limiter.async_slot(feed_url, deadline)
+
+    async def download_feed(self, feed_url: str, attempt: int = 1,
+                            wait: bool = True,
+                            deadline: Optional[float] = None,
+                            incremental: bool = False,
+                            cutoff_time: Optional[datetime] = None) -> Optional[Dict]:
+        """
+        Download a feed body with retry logic without blocking the loop.
+
+        Args:
+            feed_url: URL of the RSS/Atom feed
+            attempt: Number of the first attempt (for resumed retries)
+            wait: Sleep through the backoff delay; if False, RetryLater is
+                raised instead so the caller can schedule the retry
+            deadline: time.monotonic() value by which the download,
+                retries included, must be done (None for no limit)
+            incremental: Parse the body while it downloads
+            cutoff_time: Start of the time window for the incremental parse
+
+        Returns:
+            Download dictionary as returned by FeedParser.download_feed,
+            or None if failed
+
+        Raises:
+            NetworkError: If the feed could not be downloaded
+            RetryLater: If wait is False and the download must be retried
+            DeadlineExceeded: If the deadline passes first
+        """
+        while attempt <= self.parser.max_retries:
+            try:
+                return await self.download_attempt(feed_url, attempt, deadline,
+                                                   incremental, cutoff_time)
+            except RetryableError as e:
+                delay = self.parser.next_retry_delay(feed_url, attempt, e, deadline)
+                attempt += 1
+                if not wait:
+                    raise RetryLater(delay, attempt, deadline)
+                await asyncio.sleep(delay)
+
+        return None
+
+    async def download_attempt(self, feed_url: str, attempt: int,
+                               deadline: Optional[float] = None,
+                               incremental: bool = False,
+                               cutoff_time: Optional[datetime] = None) -> Dict:
+        """
+        Make a single download attempt.
+
+        Args:
+            feed_url: URL of the RSS/Atom feed
+            attempt: Number of this attempt
+            deadline: time.monotonic() value the request must finish by
+            incremental: Parse the body while it downloads
+            cutoff_time: Start of the time window for the incremental parse
+
+        Returns:
+            Download dictionary as returned by FeedParser.download_feed
+
+        Raises:
+            RetryableError: If the failure is worth retrying
+            NetworkError: If the download failed for good
+            DeadlineExceeded: If the deadline has passed
+        """
+        session = self.get_session()
+
+        try:
+            self.logger.debug(
+                f"Fetching feed (attempt {attempt}/{self.parser.max_retries}): {feed_url}"
+            )
+
+            # The timeout only counts from when the host's slot is granted
+            async with self.request_slot(feed_url, deadline), session.get(
+                feed_url,
+                headers=self.parser.conditional_headers(feed_url),
+                timeout=aiohttp.ClientTimeout(total=self.parser.request_timeout(deadline))
+            ) as response:
+                if response.status == 304:
+                    self.logger.debug(f"Feed not modified: {feed_url}")
+                    return {'status': 304, 'headers': self.parser.cache_headers(response.headers)}
+
+                if response.status in RETRY_STATUSES:
+                    self.logger.warning(
+                        f"HTTP {response.status} (attempt {attempt}): {feed_url}"
+                    )
+                    raise RetryableError(
+                        f"HTTP {response.status}",
+                        retry_after=parse_retry_after(response.headers.get('Retry-After'))
+                    )
+
+                response.raise_for_status()
+
+                body = self.parser.body_reader(feed_url, response.headers,
+                                               incremental, cutoff_time)
+                async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+                    body.feed_raw(chunk)
+                content = body.close()
+
+            self.logger.debug(f"Successfully fetched feed: {feed_url}")
+            return self.parser.check_download(
+                feed_url, response.status, content, response.headers,
+                body.body_hash, body.feed
+            )
+
+        except asyncio.TimeoutError:
+            self.logger.warning(
+                f"Timeout fetching feed (attempt {attempt}): {feed_url}"
+            )
+            raise RetryableError("Timeout")
+
+        except aiohttp.ClientConnectionError as e:
+            self.logger.warning(
+                f"Connection error (attempt {attempt}): {feed_url} - {str(e)}"
+            )
+            raise RetryableError("Connection failed")
+
+        except aiohttp.ClientResponseError as e:
+            self.logger.error(
+                f"HTTP error fetching feed: {feed_url} - {str(e)}"
+            )
+            raise NetworkError(f"HTTP error: {str(e)}")
+
+        except aiohttp.ClientError as e:
+            self.logger.error(
+                f"Request error fetching feed: {feed_url} - {str(e)}"
+            )
+            raise NetworkError(f"Request error: {str(e)}")
+
+        except (NetworkError, ParseError, DeadlineExceeded):
+            raise
+
+        except Exception as e:
+            self.logger.error(
+                f"Unexpected error fetching feed: {feed_url} - {str(e)}",
+                exc_info=True
+            )
+            raise
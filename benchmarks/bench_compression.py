@@ -0,0 +1,131 @@
+"""
+Benchmark of write throughput against compression ratio per output codec.
+
+Writes a corpus of saved articles as json and ndjson through every codec
+and level, the way save_news does, and reports throughput (of the
+uncompressed output) and compression ratio. The corpus is the newest
+news_*.json or news_*.ndjson file in downloaded_news/ unless one is given;
+save one first with:
+
+    python news_fetcher.py
+"""
+
+import argparse
+import glob
+import gzip
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from ndjson_writer import NdjsonWriter
+from output_compression import SUFFIXES, open_output, zstandard
+
+CODECS = [
+    ('none', None),
+    ('gzip', 1), ('gzip', 6), ('gzip', 9),
+    ('zstd', 1), ('zstd', 3), ('zstd', 9), ('zstd', 19)
+]
+
+
+def find_corpus(directory: str) -> str:
+    """Return the newest json or ndjson output file in a directory."""
+    candidates = [
+        path for pattern in ('news_*.json*', 'news_*.ndjson*')
+        for path in glob.glob(os.path.join(directory, pattern))
+    ]
+    return max(candidates, key=os.path.getmtime) if candidates else ''
+
+
+def load_articles(path: str) -> list:
+    """Read the articles of a json or ndjson output file, compressed or not."""
+    if path.endswith('.gz'):
+        f = gzip.open(path, 'rt', encoding='utf-8')
+    elif path.endswith('.zst'):
+        f = zstandard.open(path, 'rt', encoding='utf-8')
+    else:
+        f = open(path, 'r', encoding='utf-8')
+
+    with f:
+        if '.ndjson' in os.path.basename(path):
+            return [json.loads(line) for line in f if line.strip()]
+        return json.load(f)
+
+
+def write_json(path: str, articles: list, codec: str, level):
+    with open_output(path, codec, level) as f:
+        json.dump(articles, f, indent=2, ensure_ascii=False)
+
+
+def write_ndjson(path: str, articles: list, codec: str, level):
+    writer = NdjsonWriter(path, logging.getLogger('bench'), fsync_interval=0,
+                          compression=codec, compression_level=level)
+    try:
+        writer.write_many(articles)
+    finally:
+        writer.close()
+
+
+def time_write(write, path: str, articles: list, codec: str, level,
+               rounds: int) -> float:
+    """Return the best time in seconds of writing the corpus."""
+    best = float('inf')
+    for _ in range(rounds):
+        start = time.perf_counter()
+        write(path, articles, codec, level)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run_benchmark(articles: list, rounds: int):
+    """Write the corpus with every codec and print a comparison table."""
+    codecs = CODECS
+    if zstandard is None:
+        print("zstandard is not installed; skipping zstd")
+        codecs = [codec for codec in CODECS if codec[0] != 'zstd']
+
+    print(f"{'format':<7} {'codec':<5} {'level':>5} {'KiB':>9} "
+          f"{'MB/s':>8} {'ratio':>6}")
+
+    with tempfile.TemporaryDirectory() as directory:
+        for extension, write in (('json', write_json), ('ndjson', write_ndjson)):
+            raw_size = None
+            for codec, level in codecs:
+                path = os.path.join(directory, f'news.{extension}{SUFFIXES[codec]}')
+                seconds = time_write(write, path, articles, codec, level, rounds)
+                size = os.path.getsize(path)
+                if raw_size is None:
+                    # The uncompressed run comes first
+                    raw_size = size
+
+                print(f"{extension:<7} {codec:<5} {level if level is not None else '-':>5} "
+                      f"{size / 1024:>9.1f} {raw_size / seconds / 1e6:>8.1f} "
+                      f"{raw_size / size:>6.2f}")
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument('corpus', nargs='?',
+                            help='json or ndjson output file of the fetcher '
+                                 '(default: newest in downloaded_news/)')
+    arg_parser.add_argument('--rounds', type=int, default=5)
+    args = arg_parser.parse_args()
+
+    corpus = args.corpus or find_corpus(os.path.join(REPO_ROOT, 'downloaded_news'))
+    if not corpus:
+        print("No news_*.json or news_*.ndjson file in downloaded_news/; "
+              "run news_fetcher.py first or pass a corpus file")
+        return
+
+    articles = load_articles(corpus)
+    print(f"Corpus: {corpus} ({len(articles)} articles)")
+    run_benchmark(articles, args.rounds)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,143 @@
+"""
+Benchmark of the fast-path parser against feedparser.
+
+Runs both parsers over the feeds saved in benchmarks/fixtures/, plus a
+built-in feed of unsafe HTML, reports the mean parse time per feed and
+warns where the entries of the two parsers differ. Save fresh fixtures
+from the feed file with:
+
+    python benchmarks/bench_parsers.py --download
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+import feedparser
+import requests
+
+import fast_parser
+
+FIXTURE_DIR = os.path.join(REPO_ROOT, 'benchmarks', 'fixtures')
+
+# Entry fields compared between the parsers
+PARITY_FIELDS = ('title', 'link', 'id', 'summary', 'published_parsed')
+
+# Scripts, event handlers and embedded frames the sanitizer must strip
+UNSAFE_HTML_FEED = b'''<?xml version="1.0" encoding="utf-8"?>
+<rss version="2.0" xmlns:content="http://purl.org/rss/1.0/modules/content/">
+<channel><title>Unsafe HTML</title>
+<item><title>Script</title><link>http://example.com/1</link>
+<description>&lt;p onclick="alert(1)"&gt;Text&lt;/p&gt;&lt;script&gt;alert(2)&lt;/script&gt;</description>
+<pubDate>Mon, 02 Jan 2023 10:00:00 +0000</pubDate></item>
+<item><title>Content</title><link>http://example.com/2</link>
+<content:encoded><![CDATA[<div onmouseover="x()">Body<iframe src="http://example.com/"></iframe></div>
+<img src="http://example.com/i.png" onerror="x()">]]></content:encoded>
+<pubDate>Mon, 02 Jan 2023 09:00:00 +0000</pubDate></item>
+</channel></rss>'''
+
+
+def download_fixtures(feed_file: str):
+    """Save the current body of every feed in the feed file as a fixture."""
+    os.makedirs(FIXTURE_DIR, exist_ok=True)
+
+    with open(feed_file, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith('#') or ',' not in line:
+                continue
+
+            name, url = (part.strip() for part in line.split(',', 1))
+            slug = re.sub(r'[^a-z0-9]+', '_', name.lower()).strip('_')
+            response = requests.get(
+                url, timeout=30, headers={'User-Agent': 'NewsFetcher/1.0'}
+            )
+            response.raise_for_status()
+
+            path = os.path.join(FIXTURE_DIR, f'{slug}.xml')
+            with open(path, 'wb') as out:
+                out.write(response.content)
+            print(f"Saved {name}: {len(response.content)} bytes -> {path}")
+
+
+def time_parser(parse, content: bytes, rounds: int) -> float:
+    """Return the mean time in milliseconds of one parse."""
+    start = time.perf_counter()
+    for _ in range(rounds):
+        parse(content)
+    return (time.perf_counter() - start) * 1000 / rounds
+
+
+def load_fixtures() -> list:
+    """Return (name, body) of the built-in feed and every saved fixture."""
+    fixtures = [('unsafe_html (built-in)', UNSAFE_HTML_FEED)]
+    if not os.path.isdir(FIXTURE_DIR):
+        print(f"No fixtures in {FIXTURE_DIR}; run with --download to add them")
+        return fixtures
+
+    for fixture in sorted(f for f in os.listdir(FIXTURE_DIR) if f.endswith('.xml')):
+        with open(os.path.join(FIXTURE_DIR, fixture), 'rb') as f:
+            fixtures.append((fixture, f.read()))
+    return fixtures
+
+
+def compare_entries(fixture: str, fast, reference):
+    """Warn about entries whose fields differ between the parsers."""
+    if len(fast.entries) != len(reference.entries):
+        print(f"  warning: {fixture} has {len(fast.entries)} entries with the "
+              f"fast parser, {len(reference.entries)} with feedparser")
+
+    for index, (entry, expected) in enumerate(zip(fast.entries, reference.entries)):
+        for field in PARITY_FIELDS:
+            if entry.get(field) != expected.get(field):
+                print(f"  warning: {fixture} entry {index} {field} differs: "
+                      f"{entry.get(field)!r} != {expected.get(field)!r}")
+
+
+def run_benchmark(rounds: int):
+    """Parse every fixture with both parsers and print a comparison table."""
+    fixtures = load_fixtures()
+    print(f"{'fixture':<24} {'KiB':>7} {'entries':>8} "
+          f"{'feedparser ms':>14} {'fast ms':>9} {'speedup':>8}")
+
+    for fixture, content in fixtures:
+        reference = feedparser.parse(content)
+        feedparser_ms = time_parser(feedparser.parse, content, rounds)
+
+        try:
+            fast = fast_parser.parse(content)
+        except fast_parser.FallbackRequired as e:
+            print(f"{fixture:<24} {len(content) / 1024:>7.1f} "
+                  f"{len(reference.entries):>8} {feedparser_ms:>14.2f} "
+                  f"{'fallback':>9}  ({str(e)})")
+            continue
+
+        compare_entries(fixture, fast, reference)
+
+        fast_ms = time_parser(fast_parser.parse, content, rounds)
+        print(f"{fixture:<24} {len(content) / 1024:>7.1f} "
+              f"{len(reference.entries):>8} {feedparser_ms:>14.2f} "
+              f"{fast_ms:>9.2f} {feedparser_ms / fast_ms:>7.1f}x")
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument('--download', action='store_true',
+                            help='refresh the fixtures from the feed file first')
+    arg_parser.add_argument('--feed-file',
+                            default=os.path.join(REPO_ROOT, 'news_feeds.txt'))
+    arg_parser.add_argument('--rounds', type=int, default=20)
+    args = arg_parser.parse_args()
+
+    if args.download:
+        download_fixtures(args.feed_file)
+    run_benchmark(args.rounds)
+
+
+if __name__ == '__main__':
+    main()
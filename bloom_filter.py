@@ -0,0 +1,230 @@
+"""
+Bloom filter module for memory-bounded membership tests.
+Provides memory-mapped Bloom filters and a rotating set of them whose
+old generations expire, used by the seen-article index at large scale.
+"""
+
+import glob
+import hashlib
+import math
+import mmap
+import os
+import struct
+import time
+from typing import List
+
+from logger_utils import NewsLogger
+
+
+# Magic, bits, hash functions, items, created and last-add times
+HEADER = struct.Struct('<8sQIQdd')
+HEADER_SIZE = 64
+MAGIC = b'NFBLOOM1'
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter stored in a memory-mapped file."""
+
+    def __init__(self, path: str, capacity: int = 1000000,
+                 error_rate: float = 0.001):
+        """
+        Open a filter file, creating it if needed.
+
+        The size of a new filter is derived from the capacity and error
+        rate; an existing file keeps the size it was created with.
+
+        Args:
+            path: Path to the filter file
+            capacity: Items the filter holds at the given error rate
+            error_rate: False-positive rate when filled to capacity
+
+        Raises:
+            ValueError: If the file is not a Bloom filter
+        """
+        self.path = path
+        self.capacity = capacity
+
+        if not os.path.exists(path):
+            self._create(path, capacity, error_rate)
+
+        self._file = open(path, 'r+b')
+        self._map = mmap.mmap(self._file.fileno(), 0)
+
+        if len(self._map) >= HEADER_SIZE:
+            magic, self.num_bits, self.num_hashes, _, self.created_at, _ = \
+                HEADER.unpack_from(self._map)
+        if (len(self._map) < HEADER_SIZE or magic != MAGIC
+                or len(self._map) < HEADER_SIZE + (self.num_bits + 7) // 8):
+            self.close()
+            raise ValueError(f"Not a Bloom filter file: {path}")
+
+    @staticmethod
+    def _create(path: str, capacity: int, error_rate: float):
+        """Write an empty filter sized for the capacity and error rate."""
+        num_bits = max(8, math.ceil(
+            -capacity * math.log(error_rate) / math.log(2) ** 2
+        ))
+        num_hashes = max(1, round(num_bits / capacity * math.log(2)))
+
+        temp_path = f"{path}.tmp"
+        with open(temp_path, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, num_bits, num_hashes, 0, time.time(), 0.0)
+                    .ljust(HEADER_SIZE, b'\0'))
+            f.truncate(HEADER_SIZE + (num_bits + 7) // 8)
+        os.replace(temp_path, path)
+
+    @property
+    def count(self) -> int:
+        """Number of items added."""
+        return HEADER.unpack_from(self._map)[3]
+
+    @property
+    def last_add(self) -> float:
+        """time.time() of the latest add (0 if empty)."""
+        return HEADER.unpack_from(self._map)[5]
+
+    def _positions(self, key: bytes) -> List[int]:
+        """Bit positions of a key, by double hashing one digest."""
+        digest = hashlib.blake2b(key, digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return [(h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
+
+    def add(self, key: bytes):
+        """
+        Add a key to the filter.
+
+        Args:
+            key: Key bytes
+        """
+        for position in self._positions(key):
+            index = HEADER_SIZE + (position >> 3)
+            self._map[index] |= 1 << (position & 7)
+
+        magic, num_bits, num_hashes, count, created_at, _ = HEADER.unpack_from(self._map)
+        HEADER.pack_into(self._map, 0, magic, num_bits, num_hashes, count + 1,
+                         created_at, time.time())
+
+    def __contains__(self, key: bytes) -> bool:
+        return all(
+            self._map[HEADER_SIZE + (position >> 3)] & (1 << (position & 7))
+            for position in self._positions(key)
+        )
+
+    def flush(self):
+        """Write changed pages back to the file."""
+        self._map.flush()
+
+    def close(self):
+        """Flush and unmap the filter."""
+        if not self._map.closed:
+            self._map.flush()
+            self._map.close()
+        self._file.close()
+
+
+class RotatingBloomFilter:
+    """
+    Scalable Bloom filter made of generations that expire over time.
+
+    New keys go to the newest generation. A new generation is started when
+    the newest one is full or older than half the retention period, and a
+    generation is deleted once nothing was added to it for the retention
+    period. Lookups check every generation, so memory and the error rate
+    stay bounded however many keys pass through.
+    """
+
+    def __init__(self, path_prefix: str, logger: NewsLogger,
+                 capacity: int = 1000000, error_rate: float = 0.001,
+                 retention_seconds: float = 7 * 86400):
+        """
+        Open the generations found on disk.
+
+        Args:
+            path_prefix: Generation files are named <path_prefix>.<n>.bloom
+            logger: Logger instance for logging
+            capacity: Keys per generation
+            error_rate: False-positive rate of a full generation
+            retention_seconds: Time after the last add a generation is kept
+        """
+        self.path_prefix = path_prefix
+        self.logger = logger
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.retention_seconds = retention_seconds
+
+        self.generations: List[BloomFilter] = []
+        for path in sorted(glob.glob(f"{glob.escape(path_prefix)}.*.bloom"),
+                           key=self._generation_number):
+            try:
+                self.generations.append(BloomFilter(path))
+            except (OSError, ValueError) as e:
+                # Keys only missing from the filter are found as new, so
+                # a lost generation can cause duplicates but no data loss
+                self.logger.warning(f"Ignoring unreadable Bloom filter {path}: {str(e)}")
+
+        self.expire()
+
+    @staticmethod
+    def _generation_number(path: str) -> int:
+        """Sequence number in a generation file name."""
+        try:
+            return int(path.rsplit('.', 2)[1])
+        except (IndexError, ValueError):
+            return -1
+
+    def _current(self) -> BloomFilter:
+        """Get the generation new keys go to, starting one if needed."""
+        if self.generations:
+            newest = self.generations[-1]
+            young = time.time() - newest.created_at < self.retention_seconds / 2
+            if newest.count < self.capacity and young:
+                return newest
+
+        number = self._generation_number(self.generations[-1].path) + 1 if self.generations else 0
+        generation = BloomFilter(
+            f"{self.path_prefix}.{number}.bloom", self.capacity, self.error_rate
+        )
+        self.generations.append(generation)
+        self.logger.debug(f"Started Bloom filter generation {generation.path}")
+        return generation
+
+    def add(self, key: bytes):
+        """
+        Add a key to the newest generation.
+
+        Keys already in the newest generation are not counted again.
+
+        Args:
+            key: Key bytes
+        """
+        current = self._current()
+        if key not in current:
+            current.add(key)
+
+    def __contains__(self, key: bytes) -> bool:
+        return any(key in generation for generation in reversed(self.generations))
+
+    def expire(self):
+        """Delete generations nothing was added to for the retention period."""
+        expiry = time.time() - self.retention_seconds
+        live = []
+        for generation in self.generations:
+            if generation.last_add and generation.last_add < expiry:
+                generation.close()
+                os.remove(generation.path)
+                self.logger.debug(f"Deleted expired Bloom filter {generation.path}")
+            else:
+                live.append(generation)
+        self.generations = live
+
+    def flush(self):
+        """Write every generation back to disk."""
+        for generation in self.generations:
+            generation.flush()
+
+    def close(self):
+        """Flush and unmap every generation."""
+        for generation in self.generations:
+            generation.close()
+        self.generations = []
@@ -0,0 +1,203 @@
+"""
+Response body module for streaming feed downloads.
+Decompresses a response body chunk by chunk, enforces a size limit,
+hashes the body and optionally feeds it to the streaming parser.
+"""
+
+import hashlib
+import zlib
+from typing import Optional
+
+import feedparser
+
+from logger_utils import NetworkError
+from fast_parser import StreamingFeedParser, FallbackRequired
+
+try:
+    import brotli
+except ImportError:  # optional dependency, without it br is not requested
+    brotli = None
+
+if brotli is not None and not hasattr(brotli.Decompressor, 'can_accept_more_data'):
+    # Before brotli 1.2 the output of a decompression step is unbounded
+    brotli = None
+
+
+# Size of the network reads and the most output one decompression step
+# may produce, which keeps compression bombs from ballooning in memory
+CHUNK_SIZE = 64 * 1024
+
+ACCEPT_ENCODING = 'gzip, deflate, br' if brotli is not None else 'gzip, deflate'
+
+
+class BodyTooLarge(NetworkError):
+    """Exception raised when a response body exceeds the size limit."""
+    pass
+
+
+class BodyReader:
+    """Incremental decoder of a single response body."""
+
+    def __init__(self, content_encoding: Optional[str], max_bytes: int = 0,
+                 parser: Optional[StreamingFeedParser] = None):
+        """
+        Initialize the reader.
+
+        Args:
+            content_encoding: Content-Encoding header of the response
+            max_bytes: Largest accepted body, compressed or not (0 = no limit)
+            parser: Streaming parser fed with the decoded body (optional)
+
+        Raises:
+            NetworkError: If the content encoding is not supported
+        """
+        self.max_bytes = max_bytes
+        self.parser = parser
+        self.feed: Optional[feedparser.FeedParserDict] = None
+
+        self._encoding = (content_encoding or 'identity').strip().lower()
+        self._decoder = self._create_decoder(self._encoding)
+        self._started = False
+        self._chunks = []
+        self._size = 0
+        self._received = 0
+        self._hash = hashlib.blake2b(digest_size=16)
+
+    @staticmethod
+    def _create_decoder(encoding: str):
+        """Create the decompressor of a content encoding (None for identity)."""
+        if encoding in ('identity', ''):
+            return None
+        if encoding in ('gzip', 'x-gzip'):
+            return zlib.decompressobj(16 + zlib.MAX_WBITS)
+        if encoding == 'deflate':
+            return zlib.decompressobj()
+        if encoding == 'br' and brotli is not None:
+            return brotli.Decompressor()
+        raise NetworkError(f"Unsupported content encoding: {encoding}")
+
+    def check_length(self, content_length: Optional[str]):
+        """
+        Reject a body from its announced length before reading it.
+
+        Args:
+            content_length: Content-Length header of the response
+
+        Raises:
+            BodyTooLarge: If the announced length exceeds the limit
+        """
+        if self.max_bytes and content_length and content_length.isdigit():
+            if int(content_length) > self.max_bytes:
+                raise BodyTooLarge(
+                    f"Body of {content_length} bytes exceeds the "
+                    f"{self.max_bytes} byte limit"
+                )
+
+    def feed_raw(self, chunk: bytes):
+        """
+        Add a chunk of the body as received from the network.
+
+        Args:
+            chunk: Raw, possibly compressed, bytes
+
+        Raises:
+            BodyTooLarge: If the body exceeds the size limit
+            NetworkError: If the body cannot be decompressed
+        """
+        self._received += len(chunk)
+        self._check_size(self._received)
+
+        if self._decoder is None:
+            self._add(chunk)
+            return
+
+        if self._encoding == 'br':
+            try:
+                # Steps of bounded output; the decoder keeps the rest of the
+                # output and input until drained with empty input
+                data = self._decoder.process(chunk, output_buffer_limit=CHUNK_SIZE)
+                while data or not self._decoder.can_accept_more_data():
+                    self._add(data)
+                    data = self._decoder.process(b'', output_buffer_limit=CHUNK_SIZE)
+            except brotli.error as e:
+                raise NetworkError(f"Invalid br body: {str(e)}")
+            return
+
+        try:
+            data = self._decompress(chunk)
+            while data:
+                self._add(data)
+                tail = self._decoder.unconsumed_tail
+                data = self._decompress(tail) if tail else b''
+        except zlib.error as e:
+            raise NetworkError(f"Invalid {self._encoding} body: {str(e)}")
+
+    def _decompress(self, data: bytes) -> bytes:
+        """Run one zlib decompression step of bounded output."""
+        if self._encoding == 'deflate' and not self._started:
+            self._started = True
+            try:
+                return self._decoder.decompress(data, CHUNK_SIZE)
+            except zlib.error:
+                # Some servers send raw deflate data without the zlib header
+                self._decoder = zlib.decompressobj(-zlib.MAX_WBITS)
+        return self._decoder.decompress(data, CHUNK_SIZE)
+
+    def _add(self, data: bytes):
+        """Store, hash and parse a chunk of the decoded body."""
+        if not data:
+            return
+
+        self._size += len(data)
+        self._check_size(self._size)
+
+        self._chunks.append(data)
+        self._hash.update(data)
+
+        if self.parser is not None:
+            try:
+                self.parser.feed(data)
+            except FallbackRequired:
+                # The body is still collected for the full parser
+                self.parser = None
+
+    def _check_size(self, size: int):
+        """Abort once the body grows beyond the limit."""
+        if self.max_bytes and size > self.max_bytes:
+            raise BodyTooLarge(
+                f"Body exceeds the {self.max_bytes} byte limit"
+            )
+
+    def close(self) -> bytes:
+        """
+        Finish the body.
+
+        Returns:
+            Decoded body; the streamed parse result, if any, is in ``feed``
+
+        Raises:
+            BodyTooLarge: If the body exceeds the size limit
+            NetworkError: If the compressed body is truncated
+        """
+        if self._decoder is not None:
+            if self._encoding == 'br':
+                if not self._decoder.is_finished():
+                    raise NetworkError("Truncated br body")
+            else:
+                self._add(self._decoder.flush())
+                if not self._decoder.eof:
+                    raise NetworkError(f"Truncated {self._encoding} body")
+
+        if self.parser is not None:
+            try:
+                self.feed = self.parser.close()
+            except FallbackRequired:
+                self.feed = None
+            self.parser = None
+
+        return b''.join(self._chunks)
+
+    @property
+    def body_hash(self) -> str:
+        """Hex digest of the decoded body, as FeedParser.hash_content."""
+        return self._hash.hexdigest()
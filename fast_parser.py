@@ -0,0 +1,424 @@
+"""
+Fast-path feed parser module.
+Incrementally parses RSS 2.0, RSS 1.0 and Atom feeds with the standard
+library, extracting only the fields used by FeedParser.extract_entry_data.
+"""
+
+import time
+import xml.etree.ElementTree as ET
+from datetime import datetime, timezone
+from email.utils import parsedate_tz, mktime_tz
+from typing import List, Optional
+
+import feedparser
+from feedparser.sanitizer import _sanitize_html
+
+
+ATOM_NS = 'http://www.w3.org/2005/Atom'
+RSS10_NS = 'http://purl.org/rss/1.0/'
+RDF_NS = 'http://www.w3.org/1999/02/22-rdf-syntax-ns#'
+DC_NS = 'http://purl.org/dc/elements/1.1/'
+CONTENT_NS = 'http://purl.org/rss/1.0/modules/content/'
+SY_NS = 'http://purl.org/rss/1.0/modules/syndication/'
+
+# Namespaces whose elements are read as plain RSS elements
+RSS_NAMESPACES = ('', RSS10_NS)
+
+# Atom text construct types holding HTML; the default type is plain text
+ATOM_HTML_TYPES = ('html', 'text/html')
+
+
+class FallbackRequired(Exception):
+    """Raised when the input needs the full feedparser implementation."""
+    pass
+
+
+def split_tag(tag: str):
+    """
+    Split an ElementTree tag into its namespace and local name.
+
+    Args:
+        tag: Tag in ``{namespace}local`` notation
+
+    Returns:
+        Tuple of (namespace, local_name)
+    """
+    if tag.startswith('{'):
+        namespace, _, local = tag[1:].partition('}')
+        return namespace, local
+    return '', tag
+
+
+def parse_date(value: str) -> time.struct_time:
+    """
+    Parse an RFC 822 or ISO 8601 date into a UTC struct_time.
+
+    Args:
+        value: Date string from the feed
+
+    Returns:
+        UTC time tuple, like feedparser's ``*_parsed`` fields
+
+    Raises:
+        FallbackRequired: If the date format is not recognised
+    """
+    parsed = parsedate_tz(value)
+    if parsed is not None:
+        # Without an explicit zone the offset is ambiguous
+        if parsed[9] is None:
+            raise FallbackRequired(f"Date without timezone: {value}")
+        return time.gmtime(mktime_tz(parsed))
+
+    try:
+        dt = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        raise FallbackRequired(f"Unrecognised date: {value}")
+
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.utctimetuple()
+
+
+def element_text(element: ET.Element) -> str:
+    """
+    Get the stripped text of a leaf element.
+
+    Args:
+        element: XML element
+
+    Returns:
+        Text content
+
+    Raises:
+        FallbackRequired: If the element contains markup (inline XHTML)
+    """
+    if len(element):
+        raise FallbackRequired(f"Markup inside <{split_tag(element.tag)[1]}>")
+    return (element.text or '').strip()
+
+
+def sanitize_html(value: str) -> str:
+    """
+    Strip unsafe markup from embedded HTML.
+
+    Uses feedparser's sanitizer, so scripts, event handler attributes and
+    other elements outside its allow-list are removed as feedparser.parse
+    removes them.
+
+    Args:
+        value: HTML text of a summary or content element
+
+    Returns:
+        Sanitized HTML
+    """
+    return _sanitize_html(value, 'utf-8', 'text/html')
+
+
+class StreamingFeedParser:
+    """
+    Incremental RSS/Atom parser producing feedparser-compatible results.
+
+    Data is pushed with feed() as it arrives and the result is returned by
+    close(). Anything unusual raises FallbackRequired so the caller can hand
+    the document to feedparser instead.
+
+    When a cutoff is given, parsing stops once ``stop_after_old`` consecutive
+    entries are older than the cutoff, as long as every entry seen so far
+    was in reverse-chronological order. The result is then flagged as
+    ``truncated``.
+    """
+
+    def __init__(self, cutoff_time: Optional[datetime] = None,
+                 stop_after_old: int = 0):
+        """
+        Initialize the parser.
+
+        Args:
+            cutoff_time: Entries published before this time are old
+            stop_after_old: Consecutive old entries that end parsing
+                (0 disables early termination)
+        """
+        self._parser = ET.XMLPullParser(events=('start', 'end'))
+        self._stack: List[str] = []
+        self.version: Optional[str] = None
+        self.entries: List[feedparser.FeedParserDict] = []
+        self.feed_info = feedparser.FeedParserDict()
+
+        self.cutoff_time = cutoff_time
+        self.stop_after_old = stop_after_old if cutoff_time else 0
+        self.truncated = False
+        self._last_date: Optional[datetime] = None
+        self._in_order = True
+        self._old_in_a_row = 0
+
+    def feed(self, data: bytes):
+        """
+        Push a chunk of the document.
+
+        Args:
+            data: Next chunk of the raw feed body
+
+        Raises:
+            FallbackRequired: If the document is malformed or unsupported
+        """
+        if self.truncated:
+            return
+
+        try:
+            self._parser.feed(data)
+            self._process_events()
+        except ET.ParseError as e:
+            raise FallbackRequired(f"XML error: {str(e)}")
+
+    def close(self) -> feedparser.FeedParserDict:
+        """
+        Finish parsing and build the result.
+
+        Returns:
+            Parsed feed dictionary
+
+        Raises:
+            FallbackRequired: If the document is malformed or unsupported
+        """
+        # The rest of a truncated document is never read, so it cannot be
+        # checked for well-formedness
+        if not self.truncated:
+            try:
+                self._parser.close()
+                self._process_events()
+            except ET.ParseError as e:
+                raise FallbackRequired(f"XML error: {str(e)}")
+
+        if self.version is None:
+            raise FallbackRequired("Empty document")
+
+        return feedparser.FeedParserDict(
+            bozo=False,
+            truncated=self.truncated,
+            version=self.version,
+            feed=self.feed_info,
+            entries=self.entries
+        )
+
+    def _process_events(self):
+        """Consume the events produced by the pull parser so far."""
+        for event, element in self._parser.read_events():
+            namespace, local = split_tag(element.tag)
+
+            if event == 'start':
+                if not self._stack:
+                    self._detect_version(namespace, local, element)
+                self._stack.append(local)
+                continue
+
+            self._stack.pop()
+
+            if local == 'item' and namespace in RSS_NAMESPACES:
+                self._add_entry(self._rss_entry(element))
+                element.clear()
+            elif local == 'entry' and namespace == ATOM_NS:
+                self._add_entry(self._atom_entry(element))
+                element.clear()
+            elif self._stack[-1:] == [self._channel_tag()]:
+                self._channel_field(namespace, local, element)
+
+            if self.truncated:
+                return
+
+    def _detect_version(self, namespace: str, local: str, element: ET.Element):
+        """
+        Identify the feed format from its root element.
+
+        Raises:
+            FallbackRequired: If the format is not supported
+        """
+        if local == 'rss' and namespace == '':
+            self.version = 'rss' + element.get('version', '2.0').replace('.', '')
+        elif local == 'RDF' and namespace == RDF_NS:
+            self.version = 'rss10'
+        elif local == 'feed' and namespace == ATOM_NS:
+            self.version = 'atom10'
+        else:
+            raise FallbackRequired(f"Unsupported root element: {local}")
+
+    def _channel_tag(self) -> str:
+        """Local name of the element holding feed-level metadata."""
+        return 'feed' if self.version == 'atom10' else 'channel'
+
+    def _channel_field(self, namespace: str, local: str, element: ET.Element):
+        """Store the feed-level fields used for titles and scheduling."""
+        if local == 'title' and namespace in (*RSS_NAMESPACES, ATOM_NS):
+            self.feed_info['title'] = element_text(element)
+        elif local == 'ttl' and namespace == '':
+            self.feed_info['ttl'] = element_text(element)
+        elif namespace == SY_NS and local in ('updatePeriod', 'updateFrequency'):
+            self.feed_info[f'sy_{local.lower()}'] = element_text(element)
+
+    def _add_entry(self, entry: feedparser.FeedParserDict):
+        """Store a completed entry and decide whether to stop parsing."""
+        self.entries.append(entry)
+
+        if not self.stop_after_old:
+            return
+
+        parsed = entry.get('published_parsed') or entry.get('updated_parsed')
+        if not parsed:
+            self._old_in_a_row = 0
+            return
+
+        pub_date = datetime(*parsed[:6])
+        if self._last_date is not None and pub_date > self._last_date:
+            self._in_order = False
+        self._last_date = pub_date
+
+        if pub_date < self.cutoff_time:
+            self._old_in_a_row += 1
+        else:
+            self._old_in_a_row = 0
+
+        if self._in_order and self._old_in_a_row >= self.stop_after_old:
+            self.truncated = True
+
+    def _rss_entry(self, element: ET.Element) -> feedparser.FeedParserDict:
+        """
+        Extract the fields of an RSS <item>.
+
+        Args:
+            element: Completed item element
+
+        Returns:
+            Entry dictionary
+        """
+        entry = feedparser.FeedParserDict()
+        tags = []
+
+        for child in element:
+            namespace, local = split_tag(child.tag)
+
+            if namespace in RSS_NAMESPACES:
+                if local == 'title':
+                    entry['title'] = element_text(child)
+                elif local == 'link':
+                    entry['link'] = element_text(child)
+                elif local == 'description':
+                    entry['summary'] = sanitize_html(element_text(child))
+                elif local == 'pubDate':
+                    entry['published'] = element_text(child)
+                elif local == 'author':
+                    entry['author'] = element_text(child)
+                elif local == 'category':
+                    tags.append(self._tag(element_text(child), child.get('domain')))
+                elif local == 'guid':
+                    entry['id'] = element_text(child)
+            elif namespace == DC_NS:
+                if local == 'creator':
+                    entry.setdefault('author', element_text(child))
+                elif local == 'date':
+                    entry['updated'] = element_text(child)
+                elif local == 'subject':
+                    tags.append(self._tag(element_text(child)))
+            elif namespace == CONTENT_NS and local == 'encoded':
+                entry['content_encoded'] = sanitize_html(element_text(child))
+
+        # Like feedparser, fall back to the full content for the summary
+        content = entry.pop('content_encoded', None)
+        if 'summary' not in entry and content is not None:
+            entry['summary'] = content
+
+        return self._finish_entry(entry, tags)
+
+    def _atom_entry(self, element: ET.Element) -> feedparser.FeedParserDict:
+        """
+        Extract the fields of an Atom <entry>.
+
+        Args:
+            element: Completed entry element
+
+        Returns:
+            Entry dictionary
+        """
+        entry = feedparser.FeedParserDict()
+        tags = []
+        content = None
+
+        for child in element:
+            namespace, local = split_tag(child.tag)
+            if namespace != ATOM_NS:
+                continue
+
+            if child.get('type') == 'xhtml':
+                raise FallbackRequired("Inline XHTML content")
+
+            if local == 'title':
+                entry['title'] = element_text(child)
+            elif local == 'link':
+                if child.get('rel', 'alternate') == 'alternate' and 'link' not in entry:
+                    entry['link'] = child.get('href', '')
+            elif local == 'summary':
+                entry['summary'] = self._atom_text(child)
+            elif local == 'content':
+                content = self._atom_text(child)
+            elif local in ('published', 'issued'):
+                entry['published'] = element_text(child)
+            elif local in ('updated', 'modified'):
+                entry['updated'] = element_text(child)
+            elif local == 'author':
+                name = child.find(f'{{{ATOM_NS}}}name')
+                if name is not None:
+                    entry['author'] = (name.text or '').strip()
+            elif local == 'category':
+                tags.append(self._tag(child.get('term', ''), child.get('scheme'),
+                                      child.get('label')))
+            elif local == 'id':
+                entry['id'] = element_text(child)
+
+        if 'summary' not in entry and content is not None:
+            entry['summary'] = content
+
+        return self._finish_entry(entry, tags)
+
+    @staticmethod
+    def _atom_text(element: ET.Element) -> str:
+        """Get the text of an Atom text construct, sanitized if it is HTML."""
+        text = element_text(element)
+        if element.get('type', 'text').lower() in ATOM_HTML_TYPES:
+            return sanitize_html(text)
+        return text
+
+    @staticmethod
+    def _tag(term: str, scheme: Optional[str] = None,
+             label: Optional[str] = None) -> feedparser.FeedParserDict:
+        """Build a feedparser-style tag dictionary."""
+        return feedparser.FeedParserDict(term=term, scheme=scheme, label=label)
+
+    @staticmethod
+    def _finish_entry(entry: feedparser.FeedParserDict,
+                      tags: List[feedparser.FeedParserDict]) -> feedparser.FeedParserDict:
+        """Parse the entry dates and attach its tags."""
+        for field in ('published', 'updated'):
+            if entry.get(field):
+                entry[f'{field}_parsed'] = parse_date(entry[field])
+        if tags:
+            entry['tags'] = tags
+        return entry
+
+
+def parse(content: bytes, cutoff_time: Optional[datetime] = None,
+          stop_after_old: int = 0) -> feedparser.FeedParserDict:
+    """
+    Parse a complete feed body with the fast path.
+
+    Args:
+        content: Raw feed body
+        cutoff_time: Entries published before this time are old
+        stop_after_old: Consecutive old entries that end parsing
+
+    Returns:
+        Parsed feed dictionary
+
+    Raises:
+        FallbackRequired: If the feed needs feedparser
+    """
+    parser = StreamingFeedParser(cutoff_time, stop_after_old)
+    parser.feed(content)
+    return parser.close()
@@ -0,0 +1,206 @@
+"""
+Feed health module for tracking failing feeds.
+Keeps per-feed health statistics and a circuit breaker that skips feeds
+which keep failing, persisted in the feed state store.
+"""
+
+import threading
+import time
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from logger_utils import NewsLogger
+from feed_state import FeedStateStore
+
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half-open'
+
+
+class FeedHealthTracker:
+    """
+    Per-feed circuit breaker with health statistics.
+
+    A closed circuit lets every fetch through. After ``failure_threshold``
+    consecutive failures it opens and the feed is skipped for a backoff
+    period, which doubles every time the circuit reopens. Once the period
+    has passed the circuit is half-open: one probe fetch is let through,
+    closing the circuit if it succeeds and reopening it if it fails.
+    """
+
+    def __init__(self, logger: NewsLogger, failure_threshold: int = 5,
+                 open_seconds: float = 1800, max_open_seconds: float = 86400,
+                 state_store: Optional[FeedStateStore] = None):
+        """
+        Initialize the tracker.
+
+        Args:
+            logger: Logger instance for logging
+            failure_threshold: Consecutive failures that open the circuit
+                (0 disables the circuit breaker, health is still tracked)
+            open_seconds: First backoff period of an open circuit
+            max_open_seconds: Longest backoff period
+            state_store: Store used to keep health across runs (optional)
+        """
+        self.logger = logger
+        self.failure_threshold = failure_threshold
+        self.open_seconds = open_seconds
+        self.max_open_seconds = max_open_seconds
+        self.state_store = state_store
+
+        self._lock = threading.Lock()
+        self._health: Dict[str, Dict] = {}
+
+    def get(self, feed_url: str) -> Dict:
+        """
+        Get a copy of the health record of a feed.
+
+        Args:
+            feed_url: URL of the feed
+
+        Returns:
+            Health record with the circuit ``state``, ``failures`` in a row,
+            ``trips`` of the circuit, ``open_until``, ``successes``,
+            ``last_success``, ``last_error`` and ``mean_latency``
+        """
+        with self._lock:
+            return dict(self._record(feed_url))
+
+    def _record(self, feed_url: str) -> Dict:
+        """Get the live health record of a feed, loading it on first use."""
+        if feed_url not in self._health:
+            stored = self.state_store.get(feed_url) if self.state_store else {}
+            self._health[feed_url] = {
+                'state': CLOSED,
+                'failures': 0,
+                'trips': 0,
+                'successes': 0,
+                **stored.get('health', {})
+            }
+        return self._health[feed_url]
+
+    def _persist(self, feed_url: str, record: Dict):
+        """Copy a health record to the state store."""
+        if self.state_store is not None:
+            self.state_store.update(feed_url, health=dict(record))
+
+    def allow(self, feed_name: str, feed_url: str) -> bool:
+        """
+        Check whether a feed may be fetched.
+
+        An open circuit whose backoff has passed turns half-open and lets
+        this fetch through as the probe.
+
+        Args:
+            feed_name: Name of the feed source
+            feed_url: URL of the feed
+
+        Returns:
+            False if the feed must be skipped
+        """
+        with self._lock:
+            record = self._record(feed_url)
+            if record['state'] != OPEN:
+                return True
+
+            if time.time() < record.get('open_until', 0):
+                retry_at = datetime.fromtimestamp(record['open_until'])
+                self.logger.info(
+                    f"Skipping {feed_name}: circuit open after "
+                    f"{record['failures']} failures, next probe at "
+                    f"{retry_at.strftime('%Y-%m-%d %H:%M:%S')}"
+                )
+                return False
+
+            record['state'] = HALF_OPEN
+            self._persist(feed_url, record)
+
+        self.logger.info(f"Probing {feed_name} (circuit half-open)")
+        return True
+
+    def record_success(self, feed_name: str, feed_url: str, latency: float):
+        """
+        Record a successful fetch and close the feed's circuit.
+
+        Args:
+            feed_name: Name of the feed source
+            feed_url: URL of the feed
+            latency: Download time in seconds
+        """
+        with self._lock:
+            record = self._record(feed_url)
+            recovered = record['state'] != CLOSED
+
+            record['successes'] += 1
+            mean = record.get('mean_latency', 0.0)
+            record['mean_latency'] = round(
+                mean + (latency - mean) / record['successes'], 3
+            )
+            record['last_success'] = datetime.now().isoformat(timespec='seconds')
+            record.update(state=CLOSED, failures=0, trips=0)
+            record.pop('open_until', None)
+            self._persist(feed_url, record)
+
+        if recovered:
+            self.logger.info(f"Circuit closed for {feed_name}: feed recovered")
+
+    def record_failure(self, feed_name: str, feed_url: str, error: Exception):
+        """
+        Record a failed fetch, opening the feed's circuit if needed.
+
+        Args:
+            feed_name: Name of the feed source
+            feed_url: URL of the feed
+            error: Exception that failed the fetch
+        """
+        with self._lock:
+            record = self._record(feed_url)
+            record['failures'] += 1
+            record['last_error'] = str(error)
+
+            opens = bool(self.failure_threshold) and (
+                record['state'] == HALF_OPEN
+                or record['failures'] >= self.failure_threshold
+            )
+            if opens:
+                record['trips'] += 1
+                backoff = min(self.max_open_seconds,
+                              self.open_seconds * 2 ** (record['trips'] - 1))
+                record['state'] = OPEN
+                record['open_until'] = round(time.time() + backoff, 1)
+            self._persist(feed_url, record)
+
+        if opens:
+            self.logger.warning(
+                f"Circuit opened for {feed_name} after {record['failures']} "
+                f"consecutive failures, skipping it for {backoff:.0f}s"
+            )
+
+    def summary(self, feeds: List[Tuple[str, str]]) -> List[str]:
+        """
+        Format the health of the given feeds as a table.
+
+        Args:
+            feeds: Feeds as (feed_name, feed_url)
+
+        Returns:
+            Table lines, header first
+        """
+        rows = [('Feed', 'Circuit', 'Failures', 'Last success', 'Mean latency')]
+        for feed_name, feed_url in feeds:
+            record = self.get(feed_url)
+            latency = record.get('mean_latency')
+            rows.append((
+                feed_name,
+                record['state'],
+                str(record['failures']),
+                (record.get('last_success') or 'never').replace('T', ' '),
+                f"{latency:.2f}s" if latency is not None else '-'
+            ))
+
+        widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+        return [
+            '  '.join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip()
+            for row in rows
+        ]
@@ -5,19 +5,85 @@ Handles network requests, parsing, and time-based filtering.
 
 import feedparser
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import HTTPError as Urllib3Error, ReadTimeoutError
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional, Tuple
 from urllib.parse import urlparse
 import time
+import hashlib
+import logging
+import random
+from email.utils import parsedate_to_datetime
+from contextlib import nullcontext
 
-from logger_utils import NewsLogger, NetworkError, ParseError
+from logger_utils import (
+    NewsLogger, NetworkError, ParseError, RetryableError, RetryLater, DeadlineExceeded
+)
+from feed_state import FeedStateStore
+from rate_limiter import HostRateLimiter
+from body_reader import BodyReader, CHUNK_SIZE, ACCEPT_ENCODING
+from url_canonicalizer import UrlCanonicalizer
+import fast_parser
+
+
+# Length in seconds of the sy:updatePeriod values
+UPDATE_PERIODS = {
+    'hourly': 3600,
+    'daily': 86400,
+    'weekly': 7 * 86400,
+    'monthly': 30 * 86400,
+    'yearly': 365 * 86400
+}
+
+# HTTP statuses that mean "try again later" rather than a broken feed
+RETRY_STATUSES = {429, 503}
+
+# State fields that make the next fetch skip a feed that did not change
+VALIDATOR_FIELDS = ('etag', 'last_modified', 'content_hash')
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header.
+    
+    Args:
+        value: Header value, in seconds or as an HTTP date
+        
+    Returns:
+        Seconds to wait, or None if missing or invalid
+    """
+    if not value:
+        return None
+    
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        return None
+    return max(0.0, (retry_at - datetime.now(retry_at.tzinfo)).total_seconds())
 
 
 class FeedParser:
     """Handles fetching and parsing of RSS/Atom feeds."""
     
     def __init__(self, logger: NewsLogger, timeout: int = 30, 
-                 max_retries: int = 3, retry_delay: int = 5):
+                 max_retries: int = 3, retry_delay: float = 5,
+                 max_retry_delay: float = 60,
+                 pool_connections: int = 10, pool_maxsize: int = 10,
+                 host_pool_sizes: Optional[Dict[str, int]] = None,
+                 state_store: Optional[FeedStateStore] = None,
+                 content_hash: bool = True,
+                 parser_engine: str = 'auto',
+                 early_stop_entries: int = 0,
+                 rate_limiter: Optional[HostRateLimiter] = None,
+                 max_body_bytes: int = 0,
+                 url_canonicalizer: Optional[UrlCanonicalizer] = None):
         """
         Initialize the feed parser.
         
@@ -25,12 +91,107 @@ class FeedParser:
             logger: Logger instance for logging
             timeout: Network timeout in seconds
             max_retries: Maximum number of retry attempts
-            retry_delay: Delay between retries in seconds
+            retry_delay: Base delay between retries in seconds, doubled
+                after every failed attempt
+            max_retry_delay: Longest delay between retries in seconds
+            pool_connections: Number of per-host connection pools to keep
+            pool_maxsize: Connections kept alive per host
+            host_pool_sizes: Per-host overrides of pool_maxsize
+            state_store: Store for conditional GET validators and
+                content hashes (optional)
+            content_hash: Skip parsing bodies identical to the last fetch
+            parser_engine: 'auto' to try the fast parser before feedparser,
+                'feedparser' to always use feedparser
+            early_stop_entries: Stop parsing feeds known to be in
+                reverse-chronological order after this many consecutive
+                entries older than the time window (0 disables)
+            rate_limiter: Per-host rate and connection limiter every
+                request waits for (optional)
+            max_body_bytes: Abort downloads of bodies larger than this,
+                compressed or decompressed (0 = no limit)
+            url_canonicalizer: Canonicalizer for the ``canonical_link`` of
+                articles (optional, the link is used as is without it)
         """
         self.logger = logger
         self.timeout = timeout
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.max_retry_delay = max_retry_delay
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.host_pool_sizes = host_pool_sizes or {}
+        self.state_store = state_store
+        self.content_hash = content_hash and state_store is not None
+        self.parser_engine = parser_engine
+        self.early_stop_entries = early_stop_entries if state_store else 0
+        self.rate_limiter = rate_limiter
+        self.max_body_bytes = max_body_bytes
+        self.url_canonicalizer = url_canonicalizer
+        
+        # Shared session so connections are kept alive across feeds,
+        # retries and polling cycles
+        self.session = self._create_session()
+        self._connection_snapshot = (0, 0)
+    
+    def _create_session(self) -> requests.Session:
+        """
+        Create the pooled HTTP session used for all feed requests.
+        
+        Returns:
+            Configured requests session
+        """
+        session = requests.Session()
+        session.headers['User-Agent'] = 'NewsFetcher/1.0'
+        # Bodies are decompressed by BodyReader, so only encodings it
+        # supports are requested
+        session.headers['Accept-Encoding'] = ACCEPT_ENCODING
+        
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize
+        )
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        
+        # Requests picks the longest matching prefix, so these win over
+        # the default adapter for their host
+        for host, size in self.host_pool_sizes.items():
+            host_adapter = HTTPAdapter(pool_connections=1, pool_maxsize=size)
+            session.mount(f'http://{host}/', host_adapter)
+            session.mount(f'https://{host}/', host_adapter)
+            self.logger.debug(f"Connection pool for {host}: {size} connections")
+        
+        return session
+    
+    def connection_stats(self) -> Tuple[int, int]:
+        """
+        Count connections opened and reused since the previous call.
+        
+        Returns:
+            Tuple of (new_connections, reused_connections)
+        """
+        opened = 0
+        requests_sent = 0
+        
+        for adapter in {id(a): a for a in self.session.adapters.values()}.values():
+            pools = adapter.poolmanager.pools
+            for key in list(pools.keys()):
+                pool = pools.get(key)
+                if pool is None:
+                    continue
+                opened += pool.num_connections
+                requests_sent += pool.num_requests
+        
+        last_opened, last_requests = self._connection_snapshot
+        self._connection_snapshot = (opened, requests_sent)
+        
+        new = max(0, opened - last_opened)
+        reused = max(0, (requests_sent - last_requests) - new)
+        return new, reused
+    
+    def close(self):
+        """Close the HTTP session and its pooled connections."""
+        self.session.close()
     
     def read_feed_file(self, feed_file: str) -> List[Tuple[str, str]]:
         """
@@ -85,81 +246,609 @@ class FeedParser:
             self.logger.error(f"Error reading feed file: {str(e)}", exc_info=True)
             raise ParseError(f"Failed to read feed file: {str(e)}")
     
-    def fetch_feed(self, feed_url: str) -> Optional[feedparser.FeedParserDict]:
+    def fetch_feed(self, feed_url: str,
+                   cutoff_time: Optional[datetime] = None) -> Optional[feedparser.FeedParserDict]:
         """
         Fetch and parse a feed with retry logic.
         
         Args:
             feed_url: URL of the RSS/Atom feed
+            cutoff_time: Start of the time window, enables early termination
             
         Returns:
             Parsed feed dictionary or None if failed
         """
-        for attempt in range(1, self.max_retries + 1):
+        download = self.download_feed(feed_url, incremental=True,
+                                      cutoff_time=cutoff_time)
+        
+        if download is None:
+            return None
+        
+        return self.parse_download(feed_url, download, cutoff_time)
+    
+    def request_slot(self, feed_url: str, deadline: Optional[float] = None):
+        """
+        Wait for the rate limiter before requesting a feed.
+        
+        Args:
+            feed_url: URL of the RSS/Atom feed
+            deadline: time.monotonic() value the wait must end by
+            
+        Returns:
+            Context manager holding the host's connection slot
+        """
+        if self.rate_limiter is None:
+            return nullcontext()
+        return self.rate_limiter.slot(feed_url, deadline)
+    
+    def download_feed(self, feed_url: str, attempt: int = 1,
+                      wait: bool = True,
+                      deadline: Optional[float] = None,
+                      incremental: bool = False,
+                      cutoff_time: Optional[datetime] = None) -> Optional[Dict]:
+        """
+        Download a feed body with retry logic.
+        
+        Timeouts, connection errors and HTTP 429/503 responses are retried
+        with exponential backoff (see backoff_delay).
+        
+        Args:
+            feed_url: URL of the RSS/Atom feed
+            attempt: Number of the first attempt (for resumed retries)
+            wait: Sleep through the backoff delay; if False, RetryLater is
+                raised instead so the caller can schedule the retry
+            deadline: time.monotonic() value by which the download,
+                retries included, must be done (None for no limit)
+            incremental: Parse the body with the streaming parser while
+                it downloads (only with the 'auto' parser engine)
+            cutoff_time: Start of the time window, enables early
+                termination of the incremental parse
+            
+        Returns:
+            Download dictionary with the HTTP ``status`` and either the
+            ``content``, ``headers`` and ``body_hash`` of a new body, plus
+            the parsed ``feed`` if the incremental parse succeeded, or an
+            ``unchanged`` flag; None if failed
+            
+        Raises:
+            NetworkError: If the feed could not be downloaded
+            RetryLater: If wait is False and the download must be retried
+            DeadlineExceeded: If the deadline passes first
+        """
+        while attempt <= self.max_retries:
             try:
-                self.logger.debug(
-                    f"Fetching feed (attempt {attempt}/{self.max_retries}): {feed_url}"
-                )
-                
-                # Fetch feed with timeout
-                response = requests.get(
-                    feed_url,
-                    timeout=self.timeout,
-                    headers={'User-Agent': 'NewsFetcher/1.0'}
-                )
-                response.raise_for_status()
-                
-                # Parse feed
-                feed = feedparser.parse(response.content)
-                
-                # Check if parsing was successful
-                if feed.bozo:
-                    if hasattr(feed, 'bozo_exception'):
-                        raise ParseError(
-                            f"Feed parsing error: {str(feed.bozo_exception)}"
-                        )
+                return self.download_attempt(feed_url, attempt, deadline,
+                                             incremental, cutoff_time)
+            except RetryableError as e:
+                delay = self.next_retry_delay(feed_url, attempt, e, deadline)
+                attempt += 1
+                if not wait:
+                    raise RetryLater(delay, attempt, deadline)
+                time.sleep(delay)
+        
+        return None
+    
+    def download_attempt(self, feed_url: str, attempt: int,
+                         deadline: Optional[float] = None,
+                         incremental: bool = False,
+                         cutoff_time: Optional[datetime] = None) -> Dict:
+        """
+        Make a single download attempt.
+        
+        Args:
+            feed_url: URL of the RSS/Atom feed
+            attempt: Number of this attempt
+            deadline: time.monotonic() value the request must finish by
+            incremental: Parse the body while it downloads
+            cutoff_time: Start of the time window for the incremental parse
+            
+        Returns:
+            Download dictionary as returned by download_feed
+            
+        Raises:
+            RetryableError: If the failure is worth retrying
+            NetworkError: If the download failed for good
+            DeadlineExceeded: If the deadline has passed
+        """
+        try:
+            self.logger.debug(
+                f"Fetching feed (attempt {attempt}/{self.max_retries}): {feed_url}"
+            )
+            
+            # Fetch feed with timeout, holding a slot of the host's
+            # limiter until the body has been read; the timeout only
+            # counts from when the slot is granted
+            with self.request_slot(feed_url, deadline), self.session.get(
+                feed_url,
+                timeout=self.request_timeout(deadline),
+                headers=self.conditional_headers(feed_url),
+                stream=True
+            ) as response:
+                if response.status_code == 304:
+                    self.logger.debug(f"Feed not modified: {feed_url}")
+                    return {'status': 304, 'headers': self.cache_headers(response.headers)}
                 
-                self.logger.debug(f"Successfully fetched feed: {feed_url}")
-                return feed
+                if response.status_code in RETRY_STATUSES:
+                    self.logger.warning(
+                        f"HTTP {response.status_code} (attempt {attempt}): {feed_url}"
+                    )
+                    raise RetryableError(
+                        f"HTTP {response.status_code}",
+                        retry_after=parse_retry_after(response.headers.get('Retry-After'))
+                    )
                 
-            except requests.exceptions.Timeout:
-                self.logger.warning(
-                    f"Timeout fetching feed (attempt {attempt}): {feed_url}"
-                )
-                if attempt < self.max_retries:
-                    time.sleep(self.retry_delay)
-                else:
-                    raise NetworkError(f"Timeout after {self.max_retries} attempts")
-                    
-            except requests.exceptions.ConnectionError as e:
-                self.logger.warning(
-                    f"Connection error (attempt {attempt}): {feed_url} - {str(e)}"
-                )
-                if attempt < self.max_retries:
-                    time.sleep(self.retry_delay)
-                else:
-                    raise NetworkError(f"Connection failed after {self.max_retries} attempts")
-                    
-            except requests.exceptions.HTTPError as e:
-                self.logger.error(
-                    f"HTTP error fetching feed: {feed_url} - {str(e)}"
-                )
-                raise NetworkError(f"HTTP error: {str(e)}")
+                response.raise_for_status()
                 
-            except requests.exceptions.RequestException as e:
-                self.logger.error(
-                    f"Request error fetching feed: {feed_url} - {str(e)}"
+                body = self.body_reader(feed_url, response.headers,
+                                        incremental, cutoff_time)
+                try:
+                    for chunk in response.raw.stream(CHUNK_SIZE, decode_content=False):
+                        body.feed_raw(chunk)
+                        self.request_timeout(deadline)
+                except ReadTimeoutError:
+                    raise requests.exceptions.Timeout()
+                except Urllib3Error as e:
+                    raise requests.exceptions.ConnectionError(str(e))
+                content = body.close()
+            
+            self.logger.debug(f"Successfully fetched feed: {feed_url}")
+            return self.check_download(
+                feed_url, response.status_code, content, response.headers,
+                body.body_hash, body.feed
+            )
+            
+        except requests.exceptions.Timeout:
+            self.logger.warning(
+                f"Timeout fetching feed (attempt {attempt}): {feed_url}"
+            )
+            raise RetryableError("Timeout")
+            
+        except requests.exceptions.ConnectionError as e:
+            self.logger.warning(
+                f"Connection error (attempt {attempt}): {feed_url} - {str(e)}"
+            )
+            raise RetryableError("Connection failed")
+            
+        except requests.exceptions.HTTPError as e:
+            self.logger.error(
+                f"HTTP error fetching feed: {feed_url} - {str(e)}"
+            )
+            raise NetworkError(f"HTTP error: {str(e)}")
+            
+        except requests.exceptions.RequestException as e:
+            self.logger.error(
+                f"Request error fetching feed: {feed_url} - {str(e)}"
+            )
+            raise NetworkError(f"Request error: {str(e)}")
+            
+        except (NetworkError, DeadlineExceeded):
+            raise
+            
+        except Exception as e:
+            self.logger.error(
+                f"Unexpected error fetching feed: {feed_url} - {str(e)}",
+                exc_info=True
+            )
+            raise
+    
+    def body_reader(self, feed_url: str, headers, incremental: bool = False,
+                    cutoff_time: Optional[datetime] = None) -> BodyReader:
+        """
+        Create the reader of a response body.
+        
+        Args:
+            feed_url: URL of the RSS/Atom feed
+            headers: Response headers (case-insensitive mapping)
+            incremental: Attach a streaming parser to the reader
+            cutoff_time: Start of the time window for the streaming parser
+            
+        Returns:
+            Body reader enforcing max_body_bytes
+            
+        Raises:
+            BodyTooLarge: If the announced Content-Length exceeds the limit
+            NetworkError: If the content encoding is not supported
+        """
+        parser = None
+        if incremental and self.parser_engine == 'auto':
+            parser = fast_parser.StreamingFeedParser(
+                cutoff_time, self.early_stop_limit(feed_url)
+            )
+        
+        body = BodyReader(headers.get('Content-Encoding'), self.max_body_bytes, parser)
+        body.check_length(headers.get('Content-Length'))
+        return body
+    
+    def request_timeout(self, deadline: Optional[float] = None) -> float:
+        """
+        Get the timeout of the next request, shortened to fit a deadline.
+        
+        Args:
+            deadline: time.monotonic() value the request must finish by
+            
+        Returns:
+            Timeout in seconds
+            
+        Raises:
+            DeadlineExceeded: If the deadline has passed
+        """
+        if deadline is None:
+            return self.timeout
+        
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise DeadlineExceeded("Time budget exhausted")
+        return min(self.timeout, remaining)
+    
+    def backoff_delay(self, attempt: int) -> float:
+        """
+        Get the delay before retrying after a failed attempt.
+        
+        Uses exponential backoff with full jitter: a random delay between
+        zero and retry_delay * 2^(attempt - 1), capped at max_retry_delay,
+        so feeds failing together do not retry in lockstep.
+        
+        Args:
+            attempt: Number of the failed attempt
+            
+        Returns:
+            Delay in seconds
+        """
+        ceiling = min(self.max_retry_delay, self.retry_delay * 2 ** (attempt - 1))
+        return random.uniform(0, ceiling)
+    
+    def next_retry_delay(self, feed_url: str, attempt: int,
+                         error: RetryableError,
+                         deadline: Optional[float] = None) -> float:
+        """
+        Decide whether a failed attempt is retried, and when.
+        
+        Args:
+            feed_url: URL of the RSS/Atom feed
+            attempt: Number of the failed attempt
+            error: Failure of the attempt
+            deadline: time.monotonic() value the retry must start before
+            
+        Returns:
+            Delay in seconds before the next attempt
+            
+        Raises:
+            NetworkError: If no attempts are left or the server asks to
+                wait longer than max_retry_delay
+            DeadlineExceeded: If the retry would start after the deadline
+        """
+        if attempt >= self.max_retries:
+            raise NetworkError(f"{error} after {self.max_retries} attempts")
+        
+        if error.retry_after is not None:
+            if error.retry_after > self.max_retry_delay:
+                raise NetworkError(
+                    f"{error}, Retry-After of {error.retry_after:.0f}s exceeds "
+                    f"the {self.max_retry_delay:.0f}s limit"
                 )
-                raise NetworkError(f"Request error: {str(e)}")
-                
-            except Exception as e:
-                self.logger.error(
-                    f"Unexpected error fetching feed: {feed_url} - {str(e)}",
-                    exc_info=True
+            delay = error.retry_after
+        else:
+            delay = self.backoff_delay(attempt)
+        
+        if deadline is not None and time.monotonic() + delay >= deadline:
+            raise DeadlineExceeded(f"{error}, no time left for a retry")
+        
+        self.logger.debug(f"Retrying in {delay:.1f}s: {feed_url}")
+        return delay
+    
+    def check_download(self, feed_url: str, status: int, content: bytes,
+                       headers, body_hash: Optional[str] = None,
+                       feed: Optional[feedparser.FeedParserDict] = None) -> Dict:
+        """
+        Build the download dictionary of a successful response.
+        
+        Args:
+            feed_url: URL of the RSS/Atom feed
+            status: HTTP status code
+            content: Raw feed body
+            headers: Response headers (case-insensitive mapping)
+            body_hash: Hash of the body if already computed while reading it
+            feed: Result of an incremental parse of the body, if any
+            
+        Returns:
+            Download dictionary, flagged as unchanged if the body is
+            identical to the last parsed one
+        """
+        # Some servers ignore conditional requests, so compare bodies
+        if body_hash is None:
+            body_hash = self.hash_content(content)
+        if self.is_unchanged(feed_url, body_hash):
+            self.logger.debug(f"Feed content unchanged: {feed_url}")
+            self.remember_validators(feed_url, headers)
+            return {
+                'status': status,
+                'unchanged': True,
+                'headers': self.cache_headers(headers)
+            }
+        
+        download = {
+            'status': status,
+            'content': content,
+            'headers': self.cache_headers(headers),
+            'body_hash': body_hash
+        }
+        if feed is not None:
+            download['feed'] = feed
+        return download
+    
+    @staticmethod
+    def cache_headers(headers) -> Dict[str, Optional[str]]:
+        """
+        Keep the response headers used for validation and scheduling.
+        
+        Args:
+            headers: Response headers (case-insensitive mapping)
+            
+        Returns:
+            Plain dictionary of the relevant headers
+        """
+        return {
+            name: headers.get(name)
+            for name in ('ETag', 'Last-Modified', 'Cache-Control', 'Expires', 'Date')
+        }
+    
+    def parse_download(self, feed_url: str, download: Dict,
+                       cutoff_time: Optional[datetime] = None) -> feedparser.FeedParserDict:
+        """
+        Parse the result of download_feed.
+        
+        Args:
+            feed_url: URL of the RSS/Atom feed
+            download: Download dictionary
+            cutoff_time: Start of the time window, enables early termination
+            
+        Returns:
+            Parsed feed dictionary
+            
+        Raises:
+            ParseError: If the feed is malformed
+        """
+        if download['status'] == 304:
+            return self.not_modified_feed()
+        if download.get('unchanged'):
+            return self.unchanged_feed()
+        
+        feed = self.parse_feed_content(download['content'], feed_url, cutoff_time,
+                                       parsed=download.get('feed'))
+        self.remember_validators(feed_url, download['headers'], download['body_hash'])
+        return feed
+    
+    def conditional_headers(self, feed_url: str) -> Dict[str, str]:
+        """
+        Build conditional GET headers from the validators of the last fetch.
+        
+        Args:
+            feed_url: URL of the RSS/Atom feed
+            
+        Returns:
+            Request headers (empty if no validators are known)
+        """
+        headers = {}
+        
+        if self.state_store is None:
+            return headers
+        
+        state = self.state_store.get(feed_url)
+        if state.get('etag'):
+            headers['If-None-Match'] = state['etag']
+        if state.get('last_modified'):
+            headers['If-Modified-Since'] = state['last_modified']
+        
+        return headers
+    
+    def remember_validators(self, feed_url: str, headers,
+                            body_hash: Optional[str] = None) -> None:
+        """
+        Store the ETag and Last-Modified validators of a successful fetch.
+        
+        Args:
+            feed_url: URL of the RSS/Atom feed
+            headers: Response headers (case-insensitive mapping)
+            body_hash: Hash of the parsed body, if it changed
+        """
+        if self.state_store is None:
+            return
+        
+        fields = {
+            'etag': headers.get('ETag'),
+            'last_modified': headers.get('Last-Modified')
+        }
+        if body_hash and self.content_hash:
+            fields['content_hash'] = body_hash
+        
+        self.state_store.update(feed_url, **fields)
+    
+    @staticmethod
+    def hash_content(content: bytes) -> str:
+        """
+        Hash a feed body for change detection.
+        
+        Args:
+            content: Raw feed body
+            
+        Returns:
+            Hex digest of the body
+        """
+        return hashlib.blake2b(content, digest_size=16).hexdigest()
+    
+    def is_unchanged(self, feed_url: str, body_hash: str) -> bool:
+        """
+        Check whether a feed body is identical to the last parsed one.
+        
+        Args:
+            feed_url: URL of the RSS/Atom feed
+            body_hash: Hash of the downloaded body
+            
+        Returns:
+            True if the body was seen on the previous fetch
+        """
+        if not self.content_hash:
+            return False
+        return self.state_store.get(feed_url).get('content_hash') == body_hash
+    
+    @staticmethod
+    def unchanged_feed() -> feedparser.FeedParserDict:
+        """
+        Build the result of a fetch whose body did not change.
+        
+        Returns:
+            Feed dictionary flagged as unchanged with no entries
+        """
+        return feedparser.FeedParserDict(
+            status=200,
+            unchanged=True,
+            bozo=False,
+            entries=[],
+            feed=feedparser.FeedParserDict()
+        )
+    
+    @staticmethod
+    def not_modified_feed() -> feedparser.FeedParserDict:
+        """
+        Build the result of a fetch answered with 304 Not Modified.
+        
+        Returns:
+            Feed dictionary with status 304 and no entries
+        """
+        return feedparser.FeedParserDict(
+            status=304,
+            bozo=False,
+            entries=[],
+            feed=feedparser.FeedParserDict()
+        )
+    
+    def parse_feed_content(self, content: bytes, feed_url: Optional[str] = None,
+                           cutoff_time: Optional[datetime] = None,
+                           parsed: Optional[feedparser.FeedParserDict] = None) -> feedparser.FeedParserDict:
+        """
+        Parse a downloaded feed body.
+        
+        Plain RSS/Atom documents go through the fast parser; anything it
+        does not handle is parsed by feedparser instead. The fast parser
+        stops early on feeds known to be in reverse-chronological order.
+        
+        Args:
+            content: Raw feed body
+            feed_url: URL of the feed, used to look up its ordering state
+            cutoff_time: Start of the time window, enables early termination
+            parsed: Result of an incremental parse during the download,
+                used instead of parsing the body again
+            
+        Returns:
+            Parsed feed dictionary
+            
+        Raises:
+            ParseError: If the feed is malformed
+        """
+        feed = parsed
+        if feed is None:
+            feed = self.parse_body(content, cutoff_time, self.early_stop_limit(feed_url))
+        
+        if feed.get('truncated'):
+            self.logger.debug(
+                f"Stopped parsing after {len(feed.entries)} entries: {feed_url}"
+            )
+        
+        self.record_ordering(feed_url, self.entries_in_order(feed.get('entries', [])))
+        return feed
+    
+    def parse_body(self, content: bytes, cutoff_time: Optional[datetime] = None,
+                   stop_after_old: int = 0) -> feedparser.FeedParserDict:
+        """
+        Parse a feed body without touching any per-feed state.
+        
+        Args:
+            content: Raw feed body
+            cutoff_time: Start of the time window
+            stop_after_old: Consecutive old entries that end parsing
+                (0 disables early termination)
+            
+        Returns:
+            Parsed feed dictionary
+            
+        Raises:
+            ParseError: If the feed is malformed
+        """
+        if self.parser_engine == 'auto':
+            try:
+                return fast_parser.parse(content, cutoff_time, stop_after_old)
+            except fast_parser.FallbackRequired as e:
+                self.logger.debug(f"Falling back to feedparser: {str(e)}")
+        
+        feed = feedparser.parse(content)
+        
+        # Check if parsing was successful
+        if feed.bozo:
+            if hasattr(feed, 'bozo_exception'):
+                raise ParseError(
+                    f"Feed parsing error: {str(feed.bozo_exception)}"
                 )
-                raise
         
-        return None
+        return feed
+    
+    def early_stop_limit(self, feed_url: Optional[str]) -> int:
+        """
+        Get the early termination threshold for a feed.
+        
+        Args:
+            feed_url: URL of the RSS/Atom feed
+            
+        Returns:
+            Consecutive old entries that end parsing (0 disables)
+        """
+        if not self.early_stop_entries or feed_url is None:
+            return 0
+        if self.state_store.get(feed_url).get('ordered') is not True:
+            return 0
+        return self.early_stop_entries
+    
+    def entries_in_order(self, entries: List[Dict]) -> Optional[bool]:
+        """
+        Check whether entries are listed newest first.
+        
+        Args:
+            entries: Parsed entries in document order
+            
+        Returns:
+            True or False, or None if fewer than two entries have a date
+        """
+        dates = [d for d in (self.parse_entry_date(e) for e in entries) if d]
+        if len(dates) < 2:
+            return None
+        return all(a >= b for a, b in zip(dates, dates[1:]))
+    
+    def record_ordering(self, feed_url: Optional[str], in_order: Optional[bool]):
+        """
+        Remember whether a feed lists its entries newest first.
+        
+        A feed is marked ordered after its first in-order parse and the
+        early termination shortcut is disabled for good once it is seen
+        out of order.
+        
+        Args:
+            feed_url: URL of the RSS/Atom feed
+            in_order: Result of entries_in_order for the latest parse
+        """
+        if not self.early_stop_entries or feed_url is None or in_order is None:
+            return
+        
+        ordered = self.state_store.get(feed_url).get('ordered')
+        if ordered is False:
+            return
+        
+        if not in_order:
+            self.logger.info(
+                f"Entries are not in reverse-chronological order, "
+                f"disabling early termination: {feed_url}"
+            )
+            self.state_store.update(feed_url, ordered=False)
+        elif ordered is None:
+            self.state_store.update(feed_url, ordered=True)
     
     def parse_entry_date(self, entry: Dict) -> Optional[datetime]:
         """
@@ -186,6 +875,85 @@ class FeedParser:
             self.logger.debug(f"Error parsing entry date: {str(e)}")
             return None
     
+    def extract_articles(self, feed: feedparser.FeedParserDict, feed_name: str,
+                         time_window_minutes: int) -> Dict:
+        """
+        Filter the entries of a parsed feed and extract article data.
+        
+        Args:
+            feed: Parsed feed dictionary
+            feed_name: Name of the feed source
+            time_window_minutes: Time window in minutes
+            
+        Returns:
+            Dictionary with the extracted ``articles`` and the
+            ``entry_count``, ``filtered_count`` and ``truncated`` flag
+        """
+        entries = feed.get('entries', [])
+        
+        # Filter by time window
+        filtered_entries = self.filter_entries_by_time(entries, time_window_minutes)
+        
+        # Extract data from each entry
+        articles = []
+        for entry in filtered_entries:
+            try:
+                article_data = self.extract_entry_data(entry, feed_name)
+                articles.append(article_data)
+                self.logger.debug(
+                    f"Extracted article: {article_data['title']}"
+                )
+            except ParseError as e:
+                self.logger.error(
+                    f"Error parsing entry from {feed_name}: {str(e)}"
+                )
+                continue
+            except Exception as e:
+                self.logger.error(
+                    f"Unexpected error parsing entry from {feed_name}: {str(e)}",
+                    exc_info=True
+                )
+                continue
+        
+        return {
+            'articles': articles,
+            'entry_count': len(entries),
+            'filtered_count': len(filtered_entries),
+            'truncated': bool(feed.get('truncated')),
+            'schedule_hints': self.schedule_hints(feed)
+        }
+    
+    def schedule_hints(self, feed: feedparser.FeedParserDict) -> Dict:
+        """
+        Collect the data used to plan the next poll of a feed.
+        
+        Args:
+            feed: Parsed feed dictionary
+            
+        Returns:
+            Dictionary with the ``entry_dates`` of the entries and, when the
+            feed declares them, its ``ttl`` and ``update_period`` in seconds
+        """
+        info = feed.get('feed', {})
+        hints = {
+            'entry_dates': [
+                d for d in (self.parse_entry_date(e) for e in feed.get('entries', [])) if d
+            ]
+        }
+        
+        try:
+            if info.get('ttl'):
+                hints['ttl'] = int(info['ttl']) * 60
+            
+            period = UPDATE_PERIODS.get(str(info.get('sy_updateperiod', '')).strip().lower())
+            if period:
+                frequency = int(info.get('sy_updatefrequency') or 1)
+                hints['update_period'] = period / max(1, frequency)
+        except (TypeError, ValueError):
+            self.logger.debug(f"Ignoring invalid update hints: {dict(info)}")
+        
+        return hints
+    
     def filter_entries_by_time(self, entries: List[Dict], 
                                 time_window_minutes: int) -> List[Dict]:
         """
@@ -249,11 +1017,15 @@ class FeedParser:
         """
         try:
             pub_date = self.parse_entry_date(entry)
+            link = entry.get('link', '')
             
             data = {
                 'feed_name': feed_name,
                 'title': entry.get('title', 'No title'),
-                'link': entry.get('link', ''),
+                'link': link,
+                'canonical_link': (self.url_canonicalizer.canonicalize(link)
+                                   if self.url_canonicalizer and link else link),
+                'guid': entry.get('id', ''),
                 'summary': entry.get('summary', entry.get('description', '')),
                 'published': pub_date.isoformat() if pub_date else None,
                 'author': entry.get('author', ''),
@@ -269,3 +1041,52 @@ class FeedParser:
                 exc_info=True
             )
             raise ParseError(f"Failed to extract entry data: {str(e)}")
+
+
+# Parser owned by each worker process of the parse process pool
+_worker_parser: Optional[FeedParser] = None
+
+
+def init_parse_worker(parser_engine: str,
+                      url_canonicalizer: Optional[UrlCanonicalizer] = None):
+    """
+    Initialize a parse worker process.
+    
+    Args:
+        parser_engine: Parsing engine, as for FeedParser
+        url_canonicalizer: Canonicalizer for article links, as for FeedParser
+    """
+    global _worker_parser
+    _worker_parser = FeedParser(
+        logger=logging.getLogger("NewsFetcher"),
+        parser_engine=parser_engine,
+        url_canonicalizer=url_canonicalizer
+    )
+
+
+def parse_and_extract(feed_name: str, content: bytes,
+                      cutoff_time: Optional[datetime], stop_after_old: int,
+                      time_window_minutes: int) -> Dict:
+    """
+    Parse a feed body and extract its articles in a worker process.
+    
+    Only the compact article dictionaries are sent back to the parent, never
+    the parsed feed itself.
+    
+    Args:
+        feed_name: Name of the feed source
+        content: Raw feed body
+        cutoff_time: Start of the time window
+        stop_after_old: Consecutive old entries that end parsing
+        time_window_minutes: Time window in minutes
+        
+    Returns:
+        Result of FeedParser.extract_articles plus the ``in_order`` flag
+        
+    Raises:
+        ParseError: If the feed is malformed
+    """
+    feed = _worker_parser.parse_body(content, cutoff_time, stop_after_old)
+    result = _worker_parser.extract_articles(feed, feed_name, time_window_minutes)
+    result['in_order'] = _worker_parser.entries_in_order(feed.get('entries', []))
+    return result
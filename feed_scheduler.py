@@ -0,0 +1,233 @@
+"""
+Feed scheduler module for adaptive polling.
+Keeps a priority queue of feeds keyed by their next due time and adapts
+each feed's polling interval to its publish rate and caching hints.
+"""
+
+import heapq
+import re
+import statistics
+import threading
+import time
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+from typing import Dict, List, Optional, Tuple
+
+from logger_utils import NewsLogger
+from feed_state import FeedStateStore
+
+
+# Weight of the newest observation in the smoothed interval
+SMOOTHING = 0.5
+
+# Growth of the interval after a poll that brought nothing new
+IDLE_BACKOFF = 1.25
+
+# Number of most recent entries used to estimate the publish rate
+RATE_SAMPLE = 10
+
+MAX_AGE_PATTERN = re.compile(r'(?:^|,)\s*(?:s-)?max-age\s*=\s*"?(\d+)', re.IGNORECASE)
+
+
+def http_cache_seconds(headers: Optional[Dict]) -> Optional[float]:
+    """
+    Get the freshness lifetime from Cache-Control or Expires headers.
+
+    Args:
+        headers: Response headers
+
+    Returns:
+        Seconds the response stays fresh, or None if not specified
+    """
+    if not headers:
+        return None
+
+    cache_control = headers.get('Cache-Control') or ''
+    if 'no-cache' in cache_control.lower() or 'no-store' in cache_control.lower():
+        return None
+
+    match = MAX_AGE_PATTERN.search(cache_control)
+    if match:
+        return float(match.group(1))
+
+    if headers.get('Expires'):
+        try:
+            expires = parsedate_to_datetime(headers['Expires'])
+            date = parsedate_to_datetime(headers['Date']) if headers.get('Date') else None
+        except (TypeError, ValueError):
+            return None
+        if expires.tzinfo is None:
+            return None
+        now = date if date and date.tzinfo else datetime.now(expires.tzinfo)
+        return max(0.0, (expires - now).total_seconds())
+
+    return None
+
+
+class FeedScheduler:
+    """Thread-safe priority queue of feeds ordered by next due time."""
+
+    def __init__(self, logger: NewsLogger, min_interval: float = 60,
+                 max_interval: float = 3600, default_interval: float = 300,
+                 state_store: Optional[FeedStateStore] = None):
+        """
+        Initialize the scheduler.
+
+        Args:
+            logger: Logger instance for logging
+            min_interval: Shortest polling interval in seconds
+            max_interval: Longest polling interval in seconds
+            default_interval: Interval of feeds without any history
+            state_store: Store used to keep intervals across restarts
+        """
+        self.logger = logger
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.default_interval = self._clamp(default_interval)
+        self.state_store = state_store
+
+        self._lock = threading.Lock()
+        self._heap: List[Tuple[float, str]] = []
+        self._next_due: Dict[str, float] = {}
+        self._intervals: Dict[str, float] = {}
+        self._feeds: Dict[str, Tuple[int, str]] = {}
+
+    def _clamp(self, interval: float) -> float:
+        """Limit an interval to the configured bounds."""
+        return min(self.max_interval, max(self.min_interval, interval))
+
+    def sync(self, feeds: List[Tuple[str, str]]):
+        """
+        Add new feeds and drop feeds that are no longer configured.
+
+        New feeds resume their persisted schedule, or are due immediately.
+
+        Args:
+            feeds: List of tuples containing (feed_name, feed_url)
+        """
+        with self._lock:
+            self._feeds = {url: (index, name) for index, (name, url) in enumerate(feeds)}
+
+            for url in list(self._next_due):
+                if url not in self._feeds:
+                    del self._next_due[url]
+                    self._intervals.pop(url, None)
+
+            now = time.time()
+            for url in self._feeds:
+                if url in self._next_due:
+                    continue
+
+                state = self.state_store.get(url) if self.state_store else {}
+                self._intervals[url] = self._clamp(
+                    state.get('poll_interval', self.default_interval)
+                )
+                self._push(url, min(state.get('next_poll', now), now + self._intervals[url]))
+
+    def _push(self, feed_url: str, due: float):
+        """Queue a feed at its due time (older queue entries become stale)."""
+        self._next_due[feed_url] = due
+        heapq.heappush(self._heap, (due, feed_url))
+
+    def pop_due(self) -> List[Tuple[str, str]]:
+        """
+        Take every feed whose due time has passed off the queue.
+
+        Returns:
+            Due feeds as (feed_name, feed_url), in feed-file order
+        """
+        now = time.time()
+        due = []
+
+        with self._lock:
+            while self._heap and self._heap[0][0] <= now:
+                when, url = heapq.heappop(self._heap)
+                # Skip entries superseded by a later push or a removed feed
+                if self._next_due.get(url) != when:
+                    continue
+                del self._next_due[url]
+                due.append(url)
+
+        due.sort(key=lambda url: self._feeds[url][0])
+        return [(self._feeds[url][1], url) for url in due]
+
+    def seconds_until_next(self) -> Optional[float]:
+        """
+        Get the time until the next feed is due.
+
+        Returns:
+            Seconds to wait (0 if overdue), or None if nothing is queued
+        """
+        with self._lock:
+            if not self._next_due:
+                return None
+            return max(0.0, min(self._next_due.values()) - time.time())
+
+    def record_poll(self, feed_name: str, feed_url: str,
+                    headers: Optional[Dict] = None, hints: Optional[Dict] = None):
+        """
+        Compute a feed's next interval after a poll and requeue it.
+
+        The interval follows the median gap between the feed's recent
+        entries, smoothed over polls, and grows slowly while polls bring
+        nothing new. It never undercuts the feed's <ttl>, its
+        sy:updatePeriod/sy:updateFrequency or the HTTP freshness lifetime.
+
+        Args:
+            feed_name: Name of the feed source
+            feed_url: URL of the RSS/Atom feed
+            headers: Response headers of the poll (None if it failed)
+            hints: Schedule hints of the parsed feed (None if not parsed)
+        """
+        with self._lock:
+            if feed_url not in self._feeds:
+                return
+
+            interval = self._intervals.get(feed_url, self.default_interval)
+            observed = self._publish_gap(hints.get('entry_dates', [])) if hints else None
+
+            if observed is not None:
+                interval = SMOOTHING * observed + (1 - SMOOTHING) * interval
+            elif headers is not None:
+                interval *= IDLE_BACKOFF
+
+            # The publisher's own hints are lower bounds
+            floors = [http_cache_seconds(headers)]
+            if hints:
+                floors.extend([hints.get('ttl'), hints.get('update_period')])
+            interval = max([interval] + [f for f in floors if f])
+
+            interval = self._clamp(interval)
+            due = time.time() + interval
+            self._intervals[feed_url] = interval
+            self._push(feed_url, due)
+
+        if self.state_store is not None:
+            self.state_store.update(feed_url, poll_interval=round(interval, 1),
+                                    next_poll=round(due, 1))
+
+        self.logger.info(
+            f"Next poll of {feed_name} in {interval:.0f}s "
+            f"at {datetime.fromtimestamp(due).strftime('%H:%M:%S')}"
+        )
+
+    @staticmethod
+    def _publish_gap(entry_dates: List[datetime]) -> Optional[float]:
+        """
+        Estimate the time between two new entries of a feed.
+
+        Args:
+            entry_dates: Publication dates of the feed's entries
+
+        Returns:
+            Median gap in seconds, or None without enough dated entries
+        """
+        dates = sorted(entry_dates, reverse=True)[:RATE_SAMPLE]
+        if len(dates) < 2:
+            return None
+
+        # The silence since the newest entry counts as a gap, so feeds
+        # that stopped publishing slow down too
+        gaps = [(datetime.now() - dates[0]).total_seconds()]
+        gaps.extend((a - b).total_seconds() for a, b in zip(dates, dates[1:]))
+        return statistics.median(max(0.0, gap) for gap in gaps)
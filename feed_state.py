@@ -0,0 +1,147 @@
+"""
+Feed state module for persisting per-feed state between runs.
+Stores small JSON records keyed by feed URL (HTTP validators and the like).
+"""
+
+import json
+import os
+import threading
+from typing import Dict, Iterable, Optional
+
+from logger_utils import NewsLogger
+
+
+class FeedStateStore:
+    """Thread-safe on-disk store of per-feed state records."""
+
+    def __init__(self, state_file: str, logger: NewsLogger):
+        """
+        Initialize the state store and load any existing state.
+
+        Args:
+            state_file: Path to the JSON state file
+            logger: Logger instance for logging
+        """
+        self.state_file = state_file
+        self.logger = logger
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._state = self._load()
+
+    def _load(self) -> Dict[str, Dict]:
+        """
+        Load the state file.
+
+        Returns:
+            State records keyed by feed URL (empty if missing or unreadable)
+        """
+        try:
+            with open(self.state_file, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+            self.logger.debug(
+                f"Loaded state for {len(state)} feeds from {self.state_file}"
+            )
+            return state if isinstance(state, dict) else {}
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            # A corrupt state file only costs a full re-download
+            self.logger.warning(
+                f"Ignoring unreadable state file {self.state_file}: {str(e)}"
+            )
+            return {}
+
+    def get(self, feed_url: str) -> Dict:
+        """
+        Get a copy of the state record of a feed.
+
+        Args:
+            feed_url: URL of the feed
+
+        Returns:
+            State record (empty if the feed has no state yet)
+        """
+        with self._lock:
+            return dict(self._state.get(feed_url, {}))
+
+    def update(self, feed_url: str, **fields: Optional[object]):
+        """
+        Update fields of a feed's state record.
+
+        Fields set to None are removed from the record.
+
+        Args:
+            feed_url: URL of the feed
+            **fields: Fields to set
+        """
+        with self._lock:
+            record = self._state.setdefault(feed_url, {})
+            for key, value in fields.items():
+                if value is None:
+                    record.pop(key, None)
+                else:
+                    record[key] = value
+            self._dirty = True
+
+    def snapshot(self, fields: Iterable[str]) -> Dict[str, Dict]:
+        """
+        Copy some fields of every record, to undo later updates with restore.
+
+        Args:
+            fields: Names of the fields to copy
+
+        Returns:
+            Copied fields keyed by feed URL
+        """
+        with self._lock:
+            return {
+                feed_url: {key: record[key] for key in fields if key in record}
+                for feed_url, record in self._state.items()
+            }
+
+    def restore(self, snapshot: Dict[str, Dict], fields: Iterable[str],
+                feed_urls: Optional[Iterable[str]] = None):
+        """
+        Reset fields to the values they had when a snapshot was taken.
+
+        Fields missing from the snapshot are removed.
+
+        Args:
+            snapshot: Result of snapshot with the same fields
+            fields: Names of the fields to reset
+            feed_urls: Feeds to reset, all feeds if None
+        """
+        with self._lock:
+            for feed_url, record in self._state.items():
+                if feed_urls is not None and feed_url not in feed_urls:
+                    continue
+                saved = snapshot.get(feed_url, {})
+                for key in fields:
+                    if key in saved:
+                        record[key] = saved[key]
+                    else:
+                        record.pop(key, None)
+            self._dirty = True
+
+    def save(self):
+        """Write the state to disk if it changed since the last save."""
+        with self._lock:
+            if not self._dirty:
+                return
+
+            directory = os.path.dirname(self.state_file)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+            # Write to a temporary file first so a crash never leaves a
+            # truncated state file behind
+            temp_file = f"{self.state_file}.tmp"
+            try:
+                with open(temp_file, 'w', encoding='utf-8') as f:
+                    json.dump(self._state, f, indent=2, ensure_ascii=False)
+                os.replace(temp_file, self.state_file)
+                self._dirty = False
+            except OSError as e:
+                self.logger.error(
+                    f"Error saving state file {self.state_file}: {str(e)}"
+                )
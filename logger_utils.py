@@ -87,6 +87,29 @@ class NetworkError(FeedError):
     pass
 
 
+class RetryableError(NetworkError):
+    """Exception raised for network errors worth retrying."""
+    
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class RetryLater(NetworkError):
+    """Exception raised to hand a pending retry back to the caller."""
+    
+    def __init__(self, delay: float, attempt: int, deadline: Optional[float] = None):
+        super().__init__(f"Retry attempt {attempt} in {delay:.1f}s")
+        self.delay = delay
+        self.attempt = attempt
+        self.deadline = deadline
+
+
+class DeadlineExceeded(FeedError):
+    """Exception raised when a feed runs out of its time budget."""
+    pass
+
+
 class ParseError(FeedError):
     """Exception raised for parsing errors."""
     pass
@@ -0,0 +1,104 @@
+"""
+Newline-delimited JSON writer for the ndjson output format.
+Writes one article per line as articles arrive, with buffered writes and
+a flush and fsync policy, so memory use does not grow with the run.
+"""
+
+import json
+import os
+import time
+from typing import Dict, Iterable, Optional
+
+from logger_utils import NewsLogger
+from output_compression import open_output
+
+
+class NdjsonWriter:
+    """Streams articles to a file as one JSON object per line."""
+
+    def __init__(self, output_file: str, logger: NewsLogger,
+                 flush_every: int = 100, fsync_interval: float = 5.0,
+                 buffer_size: int = 1 << 20, compression: str = 'none',
+                 compression_level: Optional[int] = None):
+        """
+        Open the output file.
+
+        Args:
+            output_file: Path to the .ndjson file, with the codec suffix
+                when compressed
+            logger: Logger instance for logging
+            flush_every: Articles buffered before they are handed to the
+                operating system, so readers of the file see complete lines
+            fsync_interval: Seconds between fsyncs of flushed data
+                (0 to only fsync when the file is closed)
+            buffer_size: Size of the write buffer of an uncompressed file
+            compression: Codec the file is written through (none, gzip
+                or zstd); each flush also flushes the compressor
+            compression_level: Codec level, the codec default if None
+        """
+        self.output_file = output_file
+        self.logger = logger
+        self.flush_every = max(1, flush_every)
+        self.fsync_interval = fsync_interval
+
+        directory = os.path.dirname(output_file)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._file = open_output(output_file, compression, compression_level,
+                                 newline='\n', buffering=buffer_size)
+        self.count = 0
+        self._unflushed = 0
+        self._last_fsync = time.monotonic()
+
+    def write(self, article: Dict):
+        """
+        Append an article as one line.
+
+        Args:
+            article: Article dictionary
+        """
+        self._file.write(json.dumps(article, ensure_ascii=False))
+        self._file.write('\n')
+        self.count += 1
+        self._unflushed += 1
+        if self._unflushed >= self.flush_every:
+            self.flush()
+
+    def write_many(self, articles: Iterable[Dict]):
+        """
+        Append articles, one line each.
+
+        Args:
+            articles: Article dictionaries
+        """
+        for article in articles:
+            self.write(article)
+
+    def flush(self, sync: Optional[bool] = None):
+        """
+        Hand buffered lines to the operating system.
+
+        Args:
+            sync: Also fsync the file; by default only once fsync_interval
+                has passed since the last fsync
+        """
+        self._file.flush()
+        self._unflushed = 0
+
+        if sync is None:
+            sync = (self.fsync_interval > 0
+                    and time.monotonic() - self._last_fsync >= self.fsync_interval)
+        if sync:
+            os.fsync(self._file.fileno())
+            self._last_fsync = time.monotonic()
+
+    def close(self):
+        """Flush, fsync and close the file."""
+        if self._file.closed:
+            return
+        try:
+            self.flush(sync=True)
+        finally:
+            self._file.close()
+        self.logger.debug(f"Wrote {self.count} articles to {self.output_file}")
@@ -0,0 +1,263 @@
+"""
+Near-duplicate detection module for collapsing copies of a story.
+Fingerprints articles with SimHash over their title and summary and finds
+similar fingerprints through a banded LSH index, with tokenization that
+keeps Bengali words whole.
+"""
+
+import hashlib
+import re
+import unicodedata
+from collections import Counter, defaultdict
+from typing import Dict, List, Tuple
+
+from logger_utils import ConfigError
+
+
+FINGERPRINT_BITS = 64
+
+# SimHash bit counters are packed into one integer, FIELD_BITS per bit, so
+# a feature is added with one multiplication instead of 64 additions
+FIELD_BITS = 32
+FIELD_MASK = (1 << FIELD_BITS) - 1
+SPREAD = [
+    sum(1 << (FIELD_BITS * bit) for bit in range(8) if byte >> bit & 1)
+    for byte in range(256)
+]
+
+# Bengali words are runs of the Bengali block (U+0980-U+09FF), which
+# includes the vowel signs, virama and nukta that \w does not match
+TOKEN_PATTERN = re.compile(r'[\u0980-\u09FF]+|[^\W_]+')
+TAG_PATTERN = re.compile(r'<[^>]+>')
+
+# Zero-width (non-)joiners inside conjuncts such as র‍্য only affect
+# rendering, so spellings with and without them must match
+JOINERS = str.maketrans('', '', '\u200c\u200d')
+
+
+def normalize_text(text: str) -> str:
+    """
+    Normalize text for comparison and indexing.
+
+    HTML tags are removed, the text is NFC-normalized (which also unifies
+    precomposed and nukta spellings such as য়) and zero-width joiners are
+    dropped.
+
+    Args:
+        text: Title or summary text
+
+    Returns:
+        Normalized text
+    """
+    return unicodedata.normalize('NFC', TAG_PATTERN.sub(' ', text)).translate(JOINERS)
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split text into normalized words.
+
+    The text is normalized and case-folded, and Bengali words are kept
+    together with their combining marks.
+
+    Args:
+        text: Title or summary text
+
+    Returns:
+        Words in order of appearance
+    """
+    return TOKEN_PATTERN.findall(normalize_text(text).casefold())
+
+
+def simhash(tokens: List[str]) -> int:
+    """
+    Compute the 64-bit SimHash of a token list.
+
+    Words and adjacent word pairs are the features, so both the
+    vocabulary and the word order of a text count.
+
+    Args:
+        tokens: Words from tokenize
+
+    Returns:
+        Fingerprint as an unsigned integer (0 for no tokens)
+    """
+    features = Counter(tokens)
+    features.update(' '.join(pair) for pair in zip(tokens, tokens[1:]))
+
+    # Per fingerprint bit, the total weight of features with that bit set
+    counters = 0
+    total = 0
+    for feature, weight in features.items():
+        digest = hashlib.blake2b(feature.encode('utf-8'), digest_size=8).digest()
+        spread = 0
+        for index, byte in enumerate(digest):
+            spread |= SPREAD[byte] << (FIELD_BITS * 8 * index)
+        counters += weight * spread
+        total += weight
+
+    # A bit is set when features with it outweigh features without it
+    return sum(
+        1 << bit for bit in range(FINGERPRINT_BITS)
+        if 2 * (counters >> (FIELD_BITS * bit) & FIELD_MASK) > total
+    )
+
+
+def hamming_distance(a: int, b: int) -> int:
+    """Number of differing bits of two fingerprints."""
+    return bin(a ^ b).count('1')
+
+
+class NearDuplicateDetector:
+    """
+    Groups articles whose SimHash fingerprints differ in few bits.
+
+    Fingerprints are split into ``max_distance + 1`` bands. Two
+    fingerprints within ``max_distance`` bits of each other share at least
+    one band exactly, so only articles in a matching band bucket are
+    compared instead of every pair.
+    """
+
+    def __init__(self, max_distance: int = 6, min_tokens: int = 5):
+        """
+        Initialize the detector.
+
+        Args:
+            max_distance: Largest number of differing fingerprint bits of
+                two near-duplicates
+            min_tokens: Articles with fewer words are never collapsed, as
+                their fingerprints are too coarse
+
+        Raises:
+            ConfigError: If max_distance is out of range
+        """
+        if not 0 <= max_distance < FINGERPRINT_BITS // 2:
+            raise ConfigError(f"Invalid near-duplicate max_distance: {max_distance}")
+
+        self.max_distance = max_distance
+        self.min_tokens = min_tokens
+
+        band_count = max_distance + 1
+        width, extra = divmod(FINGERPRINT_BITS, band_count)
+        self.bands = []
+        shift = 0
+        for band in range(band_count):
+            size = width + (1 if band < extra else 0)
+            self.bands.append((shift, (1 << size) - 1))
+            shift += size
+
+    def band_keys(self, fingerprint: int) -> List[tuple]:
+        """
+        Get the LSH bucket keys of a fingerprint.
+
+        Args:
+            fingerprint: SimHash value
+
+        Returns:
+            One (band, value) key per band
+        """
+        return [
+            (band, fingerprint >> shift & mask)
+            for band, (shift, mask) in enumerate(self.bands)
+        ]
+
+    def fingerprint(self, article: Dict) -> int:
+        """
+        Fingerprint the title and summary of an article.
+
+        Args:
+            article: Article dictionary
+
+        Returns:
+            SimHash value, or -1 if the article is too short to compare
+        """
+        tokens = tokenize(f"{article.get('title', '')} {article.get('summary', '')}")
+        if len(tokens) < self.min_tokens:
+            return -1
+        return simhash(tokens)
+
+    def collapse(self, articles: List[Dict]) -> List[Dict]:
+        """
+        Collapse near-duplicate articles into canonical ones.
+
+        The first article of a group, in list order, is kept as the
+        canonical article; the others are removed and listed in its
+        ``duplicates`` as feed_name/link/canonical_link/guid
+        dictionaries. Only copies from other feeds are collapsed, as
+        similar items within one feed are usually distinct updates. Every
+        returned article has a ``duplicates`` list, empty if it has none.
+
+        Args:
+            articles: Articles in output order
+
+        Returns:
+            Canonical articles in the same order
+        """
+        groups = DuplicateGroups(self)
+        canonical = []
+
+        for article in articles:
+            index, new = groups.add(article)
+            if new:
+                canonical.append({**article, 'duplicates': []})
+            else:
+                canonical[index]['duplicates'].append({
+                    'feed_name': article.get('feed_name', ''),
+                    'link': article.get('link', ''),
+                    'canonical_link': article.get('canonical_link', ''),
+                    'guid': article.get('guid', '')
+                })
+
+        return canonical
+
+
+class DuplicateGroups:
+    """
+    Stories seen so far, for finding near-duplicates one article at a time.
+
+    Only fingerprints and feed names are kept, not the articles, so
+    articles can be written out as soon as they are known to be new.
+    """
+
+    def __init__(self, detector: NearDuplicateDetector):
+        """
+        Initialize an empty set of groups.
+
+        Args:
+            detector: Detector providing the fingerprints and thresholds
+        """
+        self.detector = detector
+        self.buckets = defaultdict(list)
+        self.fingerprints: List[int] = []
+        self.group_feeds: List[set] = []
+
+    def add(self, article: Dict) -> Tuple[int, bool]:
+        """
+        Add an article to the group of its story.
+
+        Args:
+            article: Article dictionary
+
+        Returns:
+            Index of the article's group, and whether the article started
+            it (False for a copy of an earlier article from another feed)
+        """
+        detector = self.detector
+        fingerprint = detector.fingerprint(article)
+        feed_name = article.get('feed_name', '')
+
+        if fingerprint >= 0:
+            for key in detector.band_keys(fingerprint):
+                for index in self.buckets[key]:
+                    if (feed_name not in self.group_feeds[index]
+                            and hamming_distance(fingerprint, self.fingerprints[index])
+                            <= detector.max_distance):
+                        self.group_feeds[index].add(feed_name)
+                        return index, False
+
+        index = len(self.fingerprints)
+        self.fingerprints.append(fingerprint)
+        self.group_feeds.append({feed_name})
+        if fingerprint >= 0:
+            for key in detector.band_keys(fingerprint):
+                self.buckets[key].append(index)
+        return index, True
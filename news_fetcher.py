@@ -3,16 +3,245 @@ Main news fetcher application.
 Fetches news from RSS/Atom feeds based on configuration.
 """
 
+import argparse
+import asyncio
+import heapq
+import logging
 import os
+import signal
+import time
 import sys
 import json
 import csv
-from datetime import datetime
-from typing import List, Dict
+import queue
+import threading
+from collections import Counter
+from concurrent.futures import (
+    FIRST_COMPLETED, ThreadPoolExecutor, ProcessPoolExecutor, wait,
+    TimeoutError as FutureTimeoutError
+)
+from datetime import datetime, timedelta, timezone
+from typing import List, Dict, Optional, Tuple
 import yaml
 
-from logger_utils import NewsLogger, FeedError, NetworkError, ParseError, ConfigError
-from feed_parser import FeedParser
+from logger_utils import (
+    NewsLogger, FeedError, NetworkError, ParseError, ConfigError, RetryLater,
+    DeadlineExceeded
+)
+from feed_parser import FeedParser, VALIDATOR_FIELDS, init_parse_worker, parse_and_extract
+from feed_state import FeedStateStore
+from feed_scheduler import FeedScheduler
+from feed_health import FeedHealthTracker
+from rate_limiter import HostRateLimiter
+from seen_index import SeenArticleIndex, article_key
+from near_duplicates import NearDuplicateDetector, DuplicateGroups
+from url_canonicalizer import UrlCanonicalizer
+from article_store import ArticleStore
+from search_index import SearchIndex
+from ndjson_writer import NdjsonWriter
+from parquet_writer import ParquetWriter
+from output_compression import SUFFIXES, check_compression, open_output
+from async_feed_parser import AsyncFeedParser
+
+
+class OutputSink:
+    """Destination of the articles streamed during a run."""
+    
+    def write(self, articles: List[Dict], copies: Optional[List[Dict]] = None):
+        """
+        Write articles.
+        
+        Args:
+            articles: Articles in delivery order
+            copies: Near-duplicates of written articles, which count as
+                delivered once these articles are written
+        """
+        raise NotImplementedError
+    
+    def close(self):
+        """Finish the output."""
+
+
+class NdjsonSink(OutputSink):
+    """
+    Writes streamed articles to an ndjson file and the search index.
+    
+    Articles are marked as seen only once they are written, so articles
+    lost to a failed write are fetched again by the next run.
+    """
+    
+    def __init__(self, writer: NdjsonWriter, search_index: Optional[SearchIndex] = None,
+                 seen_index: Optional[SeenArticleIndex] = None):
+        """
+        Initialize the sink.
+        
+        Args:
+            writer: Open ndjson writer, closed with the sink
+            search_index: Index the articles are added to, if enabled
+            seen_index: Index the written articles are marked seen in,
+                if deduplication is enabled
+        """
+        self.writer = writer
+        self.search_index = search_index
+        self.seen_index = seen_index
+        self.output_file = writer.output_file
+    
+    def write(self, articles: List[Dict], copies: Optional[List[Dict]] = None):
+        self.writer.write_many(articles)
+        if self.search_index is not None:
+            self.search_index.add(articles)
+        if self.seen_index is not None:
+            self.seen_index.mark_seen(articles + (copies or []))
+    
+    def close(self):
+        self.writer.close()
+
+
+class QueuedSink(OutputSink):
+    """
+    Writes to another sink on a background thread.
+    
+    Articles pass through a bounded queue, so a slow disk delays fetching
+    only once the queue is full. The writer thread takes whatever is
+    queued, up to batch_size articles, per write to the wrapped sink.
+    """
+    
+    STOP = object()
+    
+    def __init__(self, sink: OutputSink, logger: NewsLogger,
+                 queue_size: int = 10000, batch_size: int = 500):
+        """
+        Start the writer thread.
+        
+        Args:
+            sink: Sink written on the writer thread, closed with this one
+            logger: Logger instance for logging
+            queue_size: Articles queued before write() blocks
+            batch_size: Largest number of articles per write to the sink
+        """
+        self.sink = sink
+        self.logger = logger
+        self.output_file = getattr(sink, 'output_file', '')
+        self.queue_size = max(1, queue_size)
+        self.batch_size = max(1, batch_size)
+        self.queue = queue.Queue(maxsize=self.queue_size)
+        self.error: Optional[Exception] = None
+        self.closed = False
+        
+        # Reported after the run
+        self.high_water = 0
+        self.batches = 0
+        self.write_seconds = 0.0
+        self.max_write_seconds = 0.0
+        self.blocked_seconds = 0.0
+        
+        self.thread = threading.Thread(target=self._run, name="output-writer",
+                                       daemon=True)
+        self.thread.start()
+    
+    def write(self, articles: List[Dict], copies: Optional[List[Dict]] = None):
+        """
+        Queue articles, waiting while the queue is full.
+        
+        Args:
+            articles: Articles in delivery order
+            copies: Near-duplicates of the articles, handed to the wrapped
+                sink together with the batch that follows them
+            
+        Raises:
+            Exception: The error that stopped the writer thread, if any
+        """
+        if self.error is not None:
+            raise self.error
+        
+        # Queue items are (article, is_copy)
+        items = [(article, False) for article in articles]
+        items.extend((copy, True) for copy in copies or [])
+        for item in items:
+            try:
+                self.queue.put_nowait(item)
+            except queue.Full:
+                # Backpressure: the producer waits for the writer
+                started = time.monotonic()
+                self.queue.put(item)
+                self.blocked_seconds += time.monotonic() - started
+            self.high_water = max(self.high_water, self.queue.qsize())
+    
+    def _run(self):
+        """Write queued articles in batches until the stop marker."""
+        stopping = False
+        while not stopping:
+            batch = [self.queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            # The stop marker is queued last, after every article
+            if batch[-1] is self.STOP:
+                batch.pop()
+                stopping = True
+            
+            # After an error the queue is still drained, so producers
+            # never wait on a writer that stopped writing
+            if not batch or self.error is not None:
+                continue
+            
+            articles = [article for article, is_copy in batch if not is_copy]
+            copies = [article for article, is_copy in batch if is_copy]
+            started = time.monotonic()
+            try:
+                self.sink.write(articles, copies)
+            except Exception as e:
+                self.error = e
+                self.logger.error(f"Output writer failed: {str(e)}", exc_info=True)
+                continue
+            elapsed = time.monotonic() - started
+            self.batches += 1
+            self.write_seconds += elapsed
+            self.max_write_seconds = max(self.max_write_seconds, elapsed)
+    
+    def close(self):
+        """
+        Wait for the queued articles to be written, then close the sink.
+        
+        Raises:
+            Exception: The error that stopped the writer thread, if any
+        """
+        if self.closed:
+            return
+        self.closed = True
+        
+        # The writer thread only exits at the stop marker, but a sink that
+        # failed must still be closed to flush and release its file
+        if self.thread.is_alive():
+            queued = self.queue.qsize()
+            if queued:
+                self.logger.info(f"Waiting for the output writer to write {queued} queued articles")
+            self.queue.put(self.STOP)
+            self.thread.join()
+        
+        try:
+            self.sink.close()
+        finally:
+            if self.error is not None:
+                raise self.error
+    
+    def stats(self) -> str:
+        """
+        Describe the queue and write latency of the run.
+        
+        Returns:
+            One-line summary for the run log
+        """
+        average = self.write_seconds / self.batches if self.batches else 0.0
+        return (
+            f"queue high-water mark {self.high_water}/{self.queue_size} articles, "
+            f"{self.batches} batches, write latency {average * 1000:.1f} ms avg "
+            f"{self.max_write_seconds * 1000:.1f} ms max, "
+            f"producers blocked {self.blocked_seconds:.2f}s"
+        )
 
 
 class NewsFetcher:
@@ -42,24 +271,201 @@ class NewsFetcher:
         
         # Initialize feed parser
         network_config = self.config.get('network', {})
+        pool_config = network_config.get('connection_pool', {})
+        rate_config = network_config.get('rate_limit', {})
+        parser_config = self.config.get('parser', {})
+        
+        # Per-feed state persisted between runs (conditional GET validators
+        # and content hashes), kept next to the output directory by default
+        cache_config = self.config.get('cache', {})
+        self.state_store = None
+        if cache_config.get('enabled', True):
+            output_directory = self.config.get('output', {}).get(
+                'output_directory', 'downloaded_news'
+            )
+            default_state_file = os.path.join(
+                os.path.dirname(os.path.normpath(output_directory)),
+                'feed_state.json'
+            )
+            self.state_store = FeedStateStore(
+                cache_config.get('state_file') or default_state_file,
+                self.logger
+            )
+        # Validators at the start of the run, restored if it fails
+        self.validator_snapshot = None
+        
+        # Politeness limits shared by every request to the same host
+        self.rate_limiter = HostRateLimiter(
+            self.logger,
+            requests_per_second=rate_config.get('requests_per_second', 0),
+            burst=rate_config.get('burst', 1),
+            max_connections=rate_config.get('max_connections_per_host', 0),
+            domains=rate_config.get('domains', {})
+        )
+        
+        # Canonical article links for deduplication
+        url_config = self.config.get('url_canonicalization', {})
+        url_canonicalizer = None
+        if url_config.get('enabled', True):
+            url_canonicalizer = UrlCanonicalizer(
+                force_https=url_config.get('force_https', True),
+                strip_www=url_config.get('strip_www', True),
+                strip_params=url_config.get('strip_params'),
+                path_suffixes=url_config.get('path_suffixes'),
+                domains=url_config.get('domains', {})
+            )
+        
         self.parser = FeedParser(
             logger=self.logger,
             timeout=network_config.get('timeout_seconds', 30),
             max_retries=network_config.get('max_retries', 3),
-            retry_delay=network_config.get('retry_delay_seconds', 5)
+            retry_delay=network_config.get('retry_delay_seconds', 5),
+            max_retry_delay=network_config.get('max_retry_delay_seconds', 60),
+            pool_connections=pool_config.get('max_hosts', 10),
+            pool_maxsize=pool_config.get('connections_per_host', 10),
+            host_pool_sizes=pool_config.get('hosts', {}),
+            state_store=self.state_store,
+            content_hash=cache_config.get('content_hash', True),
+            parser_engine=parser_config.get('engine', 'auto'),
+            early_stop_entries=parser_config.get('early_stop_entries', 0),
+            rate_limiter=self.rate_limiter,
+            max_body_bytes=network_config.get('max_body_bytes', 10485760),
+            url_canonicalizer=url_canonicalizer
         )
+        self.max_workers = network_config.get('max_workers', 1)
+        
+        # Time limits of a whole run and of each feed in it (0 = none)
+        self.run_deadline_seconds = network_config.get('run_deadline_seconds', 0)
+        self.feed_budget_seconds = network_config.get('feed_budget_seconds', 0)
+        self.run_deadline = None
+        self.cut_off_feeds: List[str] = []
+        self.fetch_backend = network_config.get('fetch_backend', 'threads')
+        if self.fetch_backend not in ('threads', 'asyncio'):
+            raise ConfigError(f"Unsupported fetch backend: {self.fetch_backend}")
+        self.async_parser = None
+        self.event_loop = None
+        
+        # Optional process pool for the parse stage
+        self.use_process_pool = parser_config.get('process_pool', False)
+        self.process_workers = parser_config.get('process_workers') or os.cpu_count() or 1
+        self.process_pool = None
+        self.process_pool_lock = threading.Lock()
+        
+        # Per-run counters reported in the run summary
+        self.run_stats = Counter()
+        self.stats_lock = threading.Lock()
         
         # Get configuration values
         self.feed_file = self.config.get('feed_file', 'news_feeds.txt')
         self.time_window_minutes = self.config.get('time_window_minutes', 30)
+        self.feeds = None
+        self.feeds_mtime = None
+        
+        # Daemon configuration
+        daemon_config = self.config.get('daemon', {})
+        self.poll_interval = daemon_config.get('poll_interval_seconds', 300)
+        self.stop_event = threading.Event()
+        # Set when the run deadline abandons the feeds still in flight
+        self.run_cancelled = threading.Event()
+        
+        # Adaptive per-feed polling in daemon mode
+        scheduler_config = self.config.get('scheduler', {})
+        self.scheduler = None
+        if scheduler_config.get('enabled', False):
+            self.scheduler = FeedScheduler(
+                self.logger,
+                min_interval=scheduler_config.get('min_interval_seconds', 60),
+                max_interval=scheduler_config.get('max_interval_seconds', 3600),
+                default_interval=self.poll_interval,
+                state_store=self.state_store
+            )
+        
+        # Circuit breaker skipping feeds that keep failing
+        breaker_config = self.config.get('circuit_breaker', {})
+        self.health = FeedHealthTracker(
+            self.logger,
+            failure_threshold=(breaker_config.get('failure_threshold', 5)
+                               if breaker_config.get('enabled', True) else 0),
+            open_seconds=breaker_config.get('open_seconds', 1800),
+            max_open_seconds=breaker_config.get('max_open_seconds', 86400),
+            state_store=self.state_store
+        )
         
         # Output configuration
         output_config = self.config.get('output', {})
         self.save_to_file = output_config.get('save_to_file', True)
         self.output_directory = output_config.get('output_directory', 'downloaded_news')
         self.output_format = output_config.get('output_format', 'json')
+        # Applies to the json, ndjson, csv and txt files
+        self.compression = output_config.get('compression', 'none')
+        self.compression_level = output_config.get('compression_level')
+        check_compression(self.compression, self.compression_level)
+        self.sqlite_file = output_config.get('sqlite_file') or os.path.join(
+            self.output_directory, 'news.db'
+        )
+        self.sqlite_batch_size = output_config.get('sqlite_batch_size', 1000)
+        self.article_store = None
+        
+        # pyarrow is only imported when the parquet format is selected
+        self.parquet_directory = output_config.get('parquet_directory') or os.path.join(
+            self.output_directory, 'parquet'
+        )
+        self.parquet_writer = None
+        if self.output_format == 'parquet':
+            self.parquet_writer = ParquetWriter(
+                self.parquet_directory,
+                self.logger,
+                compression=output_config.get('parquet_compression', 'zstd'),
+                compression_level=output_config.get('parquet_compression_level'),
+                row_group_size=output_config.get('parquet_row_group_size', 100000)
+            )
+        
+        # ndjson is written feed by feed while the run is still fetching
+        self.streaming = self.save_to_file and self.output_format == 'ndjson'
+        self.ndjson_flush_every = output_config.get('ndjson_flush_every', 100)
+        self.fsync_interval = output_config.get('fsync_interval', 5.0)
+        self.background_writer = output_config.get('background_writer', True)
+        self.writer_queue_size = output_config.get('writer_queue_size', 10000)
+        self.writer_batch_size = output_config.get('writer_batch_size', 500)
+        self.output_sink: Optional[OutputSink] = None
+        self.writer_stats = None
+        self.duplicate_groups = None
+        self.streamed_keys = set()
+        
+        # Full-text index of saved articles for the search subcommand
+        search_config = self.config.get('search', {})
+        self.search_index = None
+        if search_config.get('enabled', False):
+            self.search_index = SearchIndex(self.search_index_file(self.config), self.logger)
+        
+        # Articles emitted by earlier runs, skipped when time windows overlap
+        dedup_config = self.config.get('dedup', {})
+        self.seen_index = None
+        if dedup_config.get('enabled', True):
+            default_index_file = os.path.join(
+                os.path.dirname(os.path.normpath(self.output_directory)),
+                'seen_articles.db'
+            )
+            self.seen_index = SeenArticleIndex(
+                dedup_config.get('index_file') or default_index_file,
+                self.logger,
+                retention_days=dedup_config.get('retention_days', 7),
+                backend=dedup_config.get('backend', 'exact'),
+                bloom_capacity=dedup_config.get('bloom_capacity', 1000000),
+                bloom_error_rate=dedup_config.get('bloom_error_rate', 0.001)
+            )
+        
+        # Copies of the same story published by several feeds
+        near_dup_config = self.config.get('near_duplicates', {})
+        self.near_duplicates = None
+        if near_dup_config.get('enabled', False):
+            self.near_duplicates = NearDuplicateDetector(
+                max_distance=near_dup_config.get('max_distance', 6),
+                min_tokens=near_dup_config.get('min_tokens', 5)
+            )
     
-    def load_config(self, config_file: str) -> Dict:
+    @staticmethod
+    def load_config(config_file: str) -> Dict:
         """
         Load configuration from YAML file.
         
@@ -85,90 +491,334 @@ class NewsFetcher:
         except Exception as e:
             raise ConfigError(f"Error loading config: {str(e)}")
     
-    def fetch_all_news(self) -> List[Dict]:
+    @staticmethod
+    def search_index_file(config: Dict) -> str:
         """
-        Fetch news from all configured feeds.
+        Get the path of the search index.
+        
+        Args:
+            config: Configuration dictionary
+            
+        Returns:
+            Configured search.index_file, or search.db in the output directory
+        """
+        output_directory = config.get('output', {}).get('output_directory', 'downloaded_news')
+        return (config.get('search', {}).get('index_file')
+                or os.path.join(output_directory, 'search.db'))
+    
+    def fetch_all_news(self, feeds: Optional[List[Tuple[str, str]]] = None) -> List[Dict]:
+        """
+        Fetch news from all configured feeds, or from the given ones.
+        
+        Feeds are fetched concurrently when ``network.max_workers`` is
+        greater than one, on threads or on an asyncio event loop depending
+        on ``network.fetch_backend``. Articles are always returned in
+        feed-file order. With deduplication enabled, articles emitted by
+        an earlier run() are left out, and with near-duplicate detection
+        enabled, copies of a story from later feeds are collapsed into the
+        first one.
+        
+        Feed state is not saved here: run() saves it once the articles
+        are written, and other callers call save_state() themselves.
+        
+        Args:
+            feeds: Feeds to fetch as (feed_name, feed_url), defaults to
+                every feed in the feed file
         
         Returns:
             List of news articles
         """
+        if self.fetch_backend == 'asyncio':
+            # A long-lived loop keeps the aiohttp session and its pooled
+            # connections usable across daemon polling cycles
+            if self.event_loop is None:
+                self.event_loop = asyncio.new_event_loop()
+            return self.event_loop.run_until_complete(self.fetch_all_news_async(feeds))
+        
         all_news = []
+        self.start_run()
         
         try:
             # Read feed file
-            feeds = self.parser.read_feed_file(self.feed_file)
+            if feeds is None:
+                feeds = self.load_feeds()
             
             if not feeds:
                 self.logger.warning("No feeds found in feed file")
                 return all_news
             
-            # Process each feed
-            for feed_name, feed_url in feeds:
-                self.logger.info(f"Processing feed: {feed_name}")
+            if self.max_workers > 1 and len(feeds) > 1:
+                workers = min(self.max_workers, len(feeds))
+                self.logger.info(f"Fetching {len(feeds)} feeds with {workers} workers")
                 
-                try:
-                    # Fetch feed
-                    feed = self.parser.fetch_feed(feed_url)
-                    
-                    if not feed:
-                        self.logger.error(f"Failed to fetch feed: {feed_name}")
+                # Results are collected by feed index, which keeps the
+                # article order identical to the sequential mode
+                for articles in self.fetch_feeds_threaded(feeds, workers):
+                    all_news.extend(articles)
+            else:
+                for feed_name, feed_url in feeds:
+                    if self.time_left(self.run_deadline) == 0:
+                        self.cut_off(feed_name, "run deadline reached")
                         continue
+                    all_news.extend(self.deliver(self.process_feed(feed_name, feed_url)))
+            
+            all_news = self.collapse_duplicates(self.drop_seen(all_news))
+            self.logger.info(
+                f"Total articles fetched: {len(all_news) + self.run_stats['streamed']}"
+            )
+            return all_news
+            
+        except FileNotFoundError:
+            self.logger.error(f"Feed file not found: {self.feed_file}")
+            raise
+        except Exception as e:
+            self.logger.error(
+                f"Error fetching news: {str(e)}",
+                exc_info=True
+            )
+            raise
+    
+    def fetch_feeds_threaded(self, feeds: List[Tuple[str, str]],
+                             workers: int) -> List[List[Dict]]:
+        """
+        Fetch feeds on a thread pool without letting retries hold workers.
+        
+        A feed that must be retried is handed back with its backoff delay
+        and resubmitted once the delay has passed, so the wait never
+        occupies a worker that could be fetching another feed.
+        
+        When the run deadline passes, feeds that already finished are still
+        collected, queued feeds are cancelled and feeds still in flight are
+        abandoned; their requests time out at the deadline as well. The
+        abandoned feeds keep their validators and health from before the
+        run, since their articles are never delivered.
+        
+        Args:
+            feeds: Feeds to fetch as (feed_name, feed_url)
+            workers: Number of worker threads
+            
+        Returns:
+            Articles of each feed, in the order of the feeds
+        """
+        results: List[List[Dict]] = [[] for _ in feeds]
+        retries: List[Tuple[float, int, int, Optional[float]]] = []
+        pending = {}
+        
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="feed")
+        
+        def submit(index: int, attempt: int, deadline: Optional[float] = None):
+            feed_name, feed_url = feeds[index]
+            future = executor.submit(self.process_feed, feed_name, feed_url,
+                                     attempt, True, deadline)
+            pending[future] = index
+        
+        def collect(done):
+            for future in done:
+                index = pending.pop(future)
+                try:
+                    results[index] = self.deliver(future.result())
+                except RetryLater as retry:
+                    heapq.heappush(retries, (
+                        time.monotonic() + retry.delay, index,
+                        retry.attempt, retry.deadline
+                    ))
+        
+        try:
+            for index in range(len(feeds)):
+                submit(index, 1)
+            
+            while pending or retries:
+                now = time.monotonic()
+                if self.time_left(self.run_deadline) == 0:
+                    # From here on, abandoned feeds fail before storing
+                    # validators or health
+                    with self.stats_lock:
+                        self.run_cancelled.set()
+                    collect([future for future in pending if future.done()])
                     
-                    # Get entries
-                    entries = feed.get('entries', [])
-                    self.logger.info(f"Found {len(entries)} total entries in {feed_name}")
-                    
-                    # Filter by time window
-                    filtered_entries = self.parser.filter_entries_by_time(
-                        entries,
-                        self.time_window_minutes
-                    )
-                    self.logger.info(
-                        f"Filtered to {len(filtered_entries)} entries "
-                        f"within last {self.time_window_minutes} minutes"
-                    )
-                    
-                    # Extract data from each entry
-                    for entry in filtered_entries:
+                    cut = sorted([*pending.values(), *(r[1] for r in retries)])
+                    for index in cut:
+                        self.cut_off(feeds[index][0], "run deadline reached")
+                    # Undo validators stored before the flag was set by
+                    # feeds that had not returned yet
+                    self.discard_validators([feeds[index][1] for index in cut])
+                    break
+                
+                while retries and retries[0][0] <= now:
+                    _, index, attempt, deadline = heapq.heappop(retries)
+                    submit(index, attempt, deadline)
+                
+                # Wake up for the next due retry, and at least every second
+                # so a shutdown does not wait out long backoff delays
+                timeouts = [retries[0][0] - now, 1.0] if retries else []
+                if self.run_deadline is not None:
+                    timeouts.append(self.run_deadline - now)
+                done, _ = wait(pending, timeout=min(timeouts, default=None),
+                               return_when=FIRST_COMPLETED)
+                collect(done)
+        finally:
+            # Only wait for the workers if nothing was abandoned
+            executor.shutdown(wait=not pending, cancel_futures=True)
+        
+        return results
+    
+    def process_feed(self, feed_name: str, feed_url: str, attempt: int = 1,
+                     defer_retries: bool = False,
+                     deadline: Optional[float] = None) -> List[Dict]:
+        """
+        Fetch, filter and extract the articles of a single feed.
+        
+        Errors are logged and isolated to the feed, so one failing feed
+        never affects the others.
+        
+        Args:
+            feed_name: Name of the feed source
+            feed_url: URL of the RSS/Atom feed
+            attempt: Number of the first download attempt
+            defer_retries: Raise RetryLater instead of sleeping before a retry
+            deadline: Deadline of the feed carried over from a deferred
+                retry (by default the feed budget starts now)
+            
+        Returns:
+            List of news articles from this feed
+            
+        Raises:
+            RetryLater: If defer_retries is set and the download must be
+                retried
+        """
+        if self.stop_event.is_set():
+            self.logger.info(f"Skipping feed during shutdown: {feed_name}")
+            return []
+        
+        self.log_feed_start(feed_name, attempt)
+        download = result = None
+        retrying = False
+        cancelled = self.run_cancelled
+        if deadline is None:
+            deadline = self.feed_deadline()
+        
+        try:
+            if attempt == 1 and not self.health.allow(feed_name, feed_url):
+                self.count_stat('circuit_open')
+                return []
+            
+            # Download stage
+            started = time.monotonic()
+            # Without the process pool the body is parsed as it arrives
+            download = self.parser.download_feed(feed_url, attempt,
+                                                 wait=not defer_retries,
+                                                 deadline=deadline,
+                                                 incremental=not self.use_process_pool,
+                                                 cutoff_time=self.cutoff_time())
+            latency = time.monotonic() - started
+            
+            if not download:
+                self.logger.error(f"Failed to fetch feed: {feed_name}")
+                return []
+            
+            # Parse stage, in a worker process when the pool is enabled
+            self.check_deadline(deadline)
+            if self.use_process_pool and 'content' in download:
+                future = self.get_process_pool().submit(
+                    *self.parse_job(feed_name, feed_url, download)
+                )
+                try:
+                    result = future.result(timeout=self.time_left(deadline))
+                except FutureTimeoutError:
+                    future.cancel()
+                    raise DeadlineExceeded("Time budget exhausted while parsing")
+            
+            result = self.process_download(feed_name, feed_url, download, result,
+                                           cancelled)
+            if not cancelled.is_set():
+                self.health.record_success(feed_name, feed_url, latency)
+            return result['articles']
+            
+        except RetryLater:
+            retrying = True
+            raise
+        except DeadlineExceeded as e:
+            self.cut_off(feed_name, str(e))
+            return []
+        except Exception as e:
+            self.log_feed_error(feed_name, e)
+            if isinstance(e, (NetworkError, ParseError)) and not cancelled.is_set():
+                self.health.record_failure(feed_name, feed_url, e)
+            return []
+        finally:
+            # A feed waiting for a retry is scheduled once it is done
+            if not retrying:
+                self.schedule_next_poll(feed_name, feed_url, download, result)
+    
+    async def fetch_all_news_async(self,
+                                   feeds: Optional[List[Tuple[str, str]]] = None) -> List[Dict]:
+        """
+        Fetch news from all configured feeds on the running event loop.
+        
+        At most ``network.max_workers`` feeds are in flight at once.
+        Articles are returned in feed-file order. As with fetch_all_news,
+        the caller saves the feed state with save_state().
+        
+        Args:
+            feeds: Feeds to fetch as (feed_name, feed_url), defaults to
+                every feed in the feed file
+        
+        Returns:
+            List of news articles
+        """
+        all_news = []
+        self.start_run()
+        
+        try:
+            # Read feed file
+            if feeds is None:
+                feeds = self.load_feeds()
+            
+            if not feeds:
+                self.logger.warning("No feeds found in feed file")
+                return all_news
+            
+            if self.async_parser is None:
+                self.async_parser = AsyncFeedParser(self.parser, self.logger)
+            semaphore = asyncio.Semaphore(max(1, self.max_workers))
+            
+            async def bounded(feed_name: str, feed_url: str) -> List[Dict]:
+                attempt, deadline = 1, None
+                while True:
+                    async with semaphore:
                         try:
-                            article_data = self.parser.extract_entry_data(
-                                entry,
-                                feed_name
-                            )
-                            all_news.append(article_data)
-                            self.logger.debug(
-                                f"Extracted article: {article_data['title']}"
-                            )
-                        except ParseError as e:
-                            self.logger.error(
-                                f"Error parsing entry from {feed_name}: {str(e)}"
-                            )
-                            continue
-                        except Exception as e:
-                            self.logger.error(
-                                f"Unexpected error parsing entry from {feed_name}: {str(e)}",
-                                exc_info=True
-                            )
-                            continue
-                    
-                except NetworkError as e:
-                    self.logger.error(
-                        f"Network error fetching {feed_name}: {str(e)}"
-                    )
-                    continue
-                except ParseError as e:
-                    self.logger.error(
-                        f"Parse error for {feed_name}: {str(e)}"
-                    )
-                    continue
-                except Exception as e:
-                    self.logger.error(
-                        f"Unexpected error processing {feed_name}: {str(e)}",
-                        exc_info=True
-                    )
-                    continue
+                            return self.deliver(await self.process_feed_async(
+                                feed_name, feed_url, attempt, True, deadline
+                            ))
+                        except RetryLater as retry:
+                            attempt, deadline = retry.attempt, retry.deadline
+                            delay = retry.delay
+                    # Back off outside the semaphore so other feeds can run
+                    await asyncio.sleep(delay)
+            
+            tasks = [
+                asyncio.ensure_future(bounded(feed_name, feed_url))
+                for feed_name, feed_url in feeds
+            ]
+            _, unfinished = await asyncio.wait(
+                tasks, timeout=self.time_left(self.run_deadline)
+            )
             
-            self.logger.info(f"Total articles fetched: {len(all_news)}")
+            # Cancel whatever is still running at the run deadline
+            for task in unfinished:
+                task.cancel()
+            await asyncio.gather(*unfinished, return_exceptions=True)
+            
+            for (feed_name, _), task in zip(feeds, tasks):
+                if task in unfinished:
+                    self.cut_off(feed_name, "run deadline reached")
+                else:
+                    all_news.extend(task.result())
+            
+            all_news = self.collapse_duplicates(self.drop_seen(all_news))
+            self.logger.info(
+                f"Total articles fetched: {len(all_news) + self.run_stats['streamed']}"
+            )
             return all_news
             
         except FileNotFoundError:
@@ -181,6 +831,317 @@ class NewsFetcher:
             )
             raise
     
+    async def process_feed_async(self, feed_name: str, feed_url: str,
+                                 attempt: int = 1,
+                                 defer_retries: bool = False,
+                                 deadline: Optional[float] = None) -> List[Dict]:
+        """
+        Async variant of process_feed used by the asyncio backend.
+        
+        Args:
+            feed_name: Name of the feed source
+            feed_url: URL of the RSS/Atom feed
+            attempt: Number of the first download attempt
+            defer_retries: Raise RetryLater instead of sleeping before a retry
+            deadline: Deadline of the feed carried over from a deferred
+                retry (by default the feed budget starts now)
+            
+        Returns:
+            List of news articles from this feed
+            
+        Raises:
+            RetryLater: If defer_retries is set and the download must be
+                retried
+        """
+        if self.stop_event.is_set():
+            self.logger.info(f"Skipping feed during shutdown: {feed_name}")
+            return []
+        
+        self.log_feed_start(feed_name, attempt)
+        download = result = None
+        retrying = False
+        if deadline is None:
+            deadline = self.feed_deadline()
+        
+        try:
+            if attempt == 1 and not self.health.allow(feed_name, feed_url):
+                self.count_stat('circuit_open')
+                return []
+            
+            # Download stage
+            started = time.monotonic()
+            download = await self.async_parser.download_feed(
+                feed_url, attempt, wait=not defer_retries, deadline=deadline,
+                incremental=not self.use_process_pool, cutoff_time=self.cutoff_time()
+            )
+            latency = time.monotonic() - started
+            
+            if not download:
+                self.logger.error(f"Failed to fetch feed: {feed_name}")
+                return []
+            
+            # Parse stage, in a worker process when the pool is enabled
+            self.check_deadline(deadline)
+            if self.use_process_pool and 'content' in download:
+                try:
+                    result = await asyncio.wait_for(
+                        asyncio.get_running_loop().run_in_executor(
+                            self.get_process_pool(),
+                            *self.parse_job(feed_name, feed_url, download)
+                        ),
+                        self.time_left(deadline)
+                    )
+                except asyncio.TimeoutError:
+                    raise DeadlineExceeded("Time budget exhausted while parsing")
+            
+            result = self.process_download(feed_name, feed_url, download, result)
+            self.health.record_success(feed_name, feed_url, latency)
+            return result['articles']
+            
+        except RetryLater:
+            retrying = True
+            raise
+        except DeadlineExceeded as e:
+            self.cut_off(feed_name, str(e))
+            return []
+        except Exception as e:
+            self.log_feed_error(feed_name, e)
+            if isinstance(e, (NetworkError, ParseError)):
+                self.health.record_failure(feed_name, feed_url, e)
+            return []
+        finally:
+            if not retrying:
+                self.schedule_next_poll(feed_name, feed_url, download, result)
+    
+    def start_run(self):
+        """Reset the per-run counters and start the run deadline clock."""
+        self.run_stats.clear()
+        self.cut_off_feeds = []
+        # A new flag, so threads abandoned by an earlier run stay cancelled
+        self.run_cancelled = threading.Event()
+        self.validator_snapshot = (self.state_store.snapshot(VALIDATOR_FIELDS)
+                                   if self.state_store is not None else None)
+        if self.parser.url_canonicalizer is not None:
+            self.parser.url_canonicalizer.clear_cache()
+        if self.streaming and self.near_duplicates is not None:
+            self.duplicate_groups = DuplicateGroups(self.near_duplicates)
+        self.streamed_keys = set()
+        self.writer_stats = None
+        self.run_deadline = (time.monotonic() + self.run_deadline_seconds
+                             if self.run_deadline_seconds else None)
+    
+    def feed_deadline(self) -> Optional[float]:
+        """
+        Get the deadline of a feed starting now.
+        
+        Returns:
+            time.monotonic() value by which the feed must be done (the
+            earlier of its budget and the run deadline), or None
+        """
+        deadlines = [self.run_deadline]
+        if self.feed_budget_seconds:
+            deadlines.append(time.monotonic() + self.feed_budget_seconds)
+        return min((d for d in deadlines if d is not None), default=None)
+    
+    @staticmethod
+    def time_left(deadline: Optional[float]) -> Optional[float]:
+        """Get the seconds left until a deadline (None without a deadline)."""
+        if deadline is None:
+            return None
+        return max(0.0, deadline - time.monotonic())
+    
+    def check_deadline(self, deadline: Optional[float]):
+        """
+        Stop processing a feed whose deadline has passed.
+        
+        Raises:
+            DeadlineExceeded: If the deadline has passed
+        """
+        if self.time_left(deadline) == 0:
+            raise DeadlineExceeded("Time budget exhausted")
+    
+    def cut_off(self, feed_name: str, reason: str):
+        """
+        Record a feed that was stopped by the run deadline or its budget.
+        
+        Args:
+            feed_name: Name of the feed source
+            reason: Why the feed was stopped
+        """
+        with self.stats_lock:
+            if feed_name in self.cut_off_feeds:
+                return
+            self.cut_off_feeds.append(feed_name)
+        self.logger.warning(f"Feed cut off: {feed_name} ({reason})")
+    
+    def log_feed_start(self, feed_name: str, attempt: int):
+        """Log the start of a feed's processing or of a deferred retry."""
+        if attempt == 1:
+            self.logger.info(f"Processing feed: {feed_name}")
+        else:
+            self.logger.info(f"Retrying feed: {feed_name} (attempt {attempt})")
+    
+    def get_process_pool(self) -> ProcessPoolExecutor:
+        """
+        Return the parse process pool, starting it on first use.
+        
+        Feed workers call this concurrently, so the pool is created under
+        a lock to start only one.
+        
+        Returns:
+            Process pool running parse_and_extract
+        """
+        with self.process_pool_lock:
+            if self.process_pool is None:
+                self.process_pool = ProcessPoolExecutor(
+                    max_workers=self.process_workers,
+                    initializer=init_parse_worker,
+                    initargs=(self.parser.parser_engine, self.parser.url_canonicalizer)
+                )
+                self.logger.info(f"Started {self.process_workers} parse worker processes")
+            return self.process_pool
+    
+    def parse_job(self, feed_name: str, feed_url: str, download: Dict) -> Tuple:
+        """
+        Build the arguments of a parse_and_extract call for a downloaded feed.
+        
+        Args:
+            feed_name: Name of the feed source
+            feed_url: URL of the RSS/Atom feed
+            download: Download dictionary holding the feed body
+            
+        Returns:
+            Tuple of the worker function and its arguments
+        """
+        return (
+            parse_and_extract,
+            feed_name,
+            download['content'],
+            self.cutoff_time(),
+            self.parser.early_stop_limit(feed_url),
+            self.time_window_minutes
+        )
+    
+    def log_feed_error(self, feed_name: str, error: Exception):
+        """
+        Log an error that aborted the processing of a feed.
+        
+        Args:
+            feed_name: Name of the feed source
+            error: Exception raised while processing the feed
+        """
+        if isinstance(error, NetworkError):
+            self.logger.error(
+                f"Network error fetching {feed_name}: {str(error)}"
+            )
+        elif isinstance(error, ParseError):
+            self.logger.error(
+                f"Parse error for {feed_name}: {str(error)}"
+            )
+        else:
+            self.logger.error(
+                f"Unexpected error processing {feed_name}: {str(error)}",
+                exc_info=True
+            )
+    
+    def process_download(self, feed_name: str, feed_url: str, download: Dict,
+                         result: Optional[Dict] = None,
+                         cancelled: Optional[threading.Event] = None) -> Dict:
+        """
+        Filter the entries of a downloaded feed and extract article data.
+        
+        Args:
+            feed_name: Name of the feed source
+            feed_url: URL of the RSS/Atom feed
+            download: Result of download_feed
+            result: Result of parse_and_extract if the body was already
+                processed in a worker process
+            cancelled: Run cancellation flag; once set, the feed was
+                abandoned and its validators are not stored
+            
+        Returns:
+            Result of FeedParser.extract_articles (only ``articles`` for
+            feeds that did not change)
+            
+        Raises:
+            DeadlineExceeded: If the feed was abandoned by the run deadline
+        """
+        # A 304 answer means nothing changed since the last run
+        if download['status'] == 304:
+            self.logger.info(f"Feed not modified since last run: {feed_name}")
+            self.count_stat('not_modified')
+            return {'articles': []}
+        
+        # An identical body was already parsed on a previous run
+        if download.get('unchanged'):
+            self.logger.info(f"Feed content unchanged since last run: {feed_name}")
+            self.count_stat('unchanged')
+            return {'articles': []}
+        
+        if result is None:
+            feed = self.parser.parse_feed_content(
+                download['content'], feed_url, self.cutoff_time(),
+                parsed=download.get('feed')
+            )
+            result = self.parser.extract_articles(feed, feed_name, self.time_window_minutes)
+        else:
+            self.parser.record_ordering(feed_url, result['in_order'])
+        
+        # Checked under the lock the flag is set with, so validators are
+        # never stored after the run gave up on the feed
+        with self.stats_lock:
+            if cancelled is not None and cancelled.is_set():
+                raise DeadlineExceeded("run deadline reached")
+            self.parser.remember_validators(feed_url, download['headers'],
+                                            download['body_hash'])
+        self.report_feed_result(feed_name, result)
+        return result
+    
+    def schedule_next_poll(self, feed_name: str, feed_url: str,
+                           download: Optional[Dict], result: Optional[Dict]):
+        """
+        Let the scheduler plan the next poll of a feed.
+        
+        Args:
+            feed_name: Name of the feed source
+            feed_url: URL of the RSS/Atom feed
+            download: Result of download_feed (None if it failed)
+            result: Result of process_download (None if it failed)
+        """
+        if self.scheduler is None:
+            return
+        
+        self.scheduler.record_poll(
+            feed_name,
+            feed_url,
+            headers=download.get('headers') if download else None,
+            hints=result.get('schedule_hints') if result else None
+        )
+    
+    def report_feed_result(self, feed_name: str, result: Dict):
+        """
+        Log the entry counts of a processed feed.
+        
+        Args:
+            feed_name: Name of the feed source
+            result: Result of FeedParser.extract_articles
+        """
+        if result['truncated']:
+            self.logger.info(
+                f"Parsed {result['entry_count']} entries in {feed_name} "
+                f"(stopped at entries older than the time window)"
+            )
+            self.count_stat('truncated')
+        else:
+            self.logger.info(
+                f"Found {result['entry_count']} total entries in {feed_name}"
+            )
+        
+        self.logger.info(
+            f"Filtered to {result['filtered_count']} entries "
+            f"within last {self.time_window_minutes} minutes"
+        )
+    
     def save_news(self, news_articles: List[Dict]):
         """
         Save news articles to file.
@@ -200,31 +1161,30 @@ class NewsFetcher:
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
             
             if self.output_format == 'json':
-                output_file = os.path.join(
-                    self.output_directory,
-                    f'news_{timestamp}.json'
-                )
-                with open(output_file, 'w', encoding='utf-8') as f:
+                output_file = self.output_file_path(timestamp, 'json')
+                with self.open_output_file(output_file) as f:
                     json.dump(news_articles, f, indent=2, ensure_ascii=False)
                     
+            elif self.output_format == 'ndjson':
+                output_file = self.output_file_path(timestamp, 'ndjson')
+                writer = self.ndjson_writer(output_file)
+                try:
+                    writer.write_many(news_articles)
+                finally:
+                    writer.close()
+                    
             elif self.output_format == 'csv':
-                output_file = os.path.join(
-                    self.output_directory,
-                    f'news_{timestamp}.csv'
-                )
+                output_file = self.output_file_path(timestamp, 'csv')
                 if news_articles:
                     keys = news_articles[0].keys()
-                    with open(output_file, 'w', newline='', encoding='utf-8') as f:
+                    with self.open_output_file(output_file, newline='') as f:
                         writer = csv.DictWriter(f, fieldnames=keys)
                         writer.writeheader()
                         writer.writerows(news_articles)
                         
             elif self.output_format == 'txt':
-                output_file = os.path.join(
-                    self.output_directory,
-                    f'news_{timestamp}.txt'
-                )
-                with open(output_file, 'w', encoding='utf-8') as f:
+                output_file = self.output_file_path(timestamp, 'txt')
+                with self.open_output_file(output_file) as f:
                     for i, article in enumerate(news_articles, 1):
                         f.write(f"{'=' * 80}\n")
                         f.write(f"Article {i}\n")
@@ -235,13 +1195,30 @@ class NewsFetcher:
                         f.write(f"Published: {article['published']}\n")
                         f.write(f"Author: {article['author']}\n")
                         f.write(f"Categories: {', '.join(article['categories'])}\n")
+                        if article.get('duplicates'):
+                            f.write("Also published by: " + ', '.join(
+                                f"{dup['feed_name']} ({dup['link']})"
+                                for dup in article['duplicates']
+                            ) + "\n")
                         f.write(f"\nSummary:\n{article['summary']}\n\n")
+            elif self.output_format == 'sqlite':
+                output_file = self.sqlite_file
+                self.get_article_store().upsert(news_articles)
+                
+            elif self.output_format == 'parquet':
+                output_file = self.parquet_directory
+                self.parquet_writer.write(news_articles, f'news_{timestamp}')
+                
             else:
                 self.logger.error(f"Unsupported output format: {self.output_format}")
                 return
             
             self.logger.info(f"News articles saved to: {output_file}")
             
+            if self.search_index is not None:
+                indexed = self.search_index.add(news_articles)
+                self.logger.info(f"Indexed {indexed} articles for search")
+            
         except Exception as e:
             self.logger.error(
                 f"Error saving news articles: {str(e)}",
@@ -249,18 +1226,196 @@ class NewsFetcher:
             )
             raise
     
-    def run(self):
-        """Run the news fetcher application."""
+    def deliver(self, articles: List[Dict]) -> List[Dict]:
+        """
+        Hand over the articles of a finished feed.
+        
+        Without streaming, the articles are kept for save_news at the end
+        of the run. With the ndjson format, articles already seen and
+        copies of articles written earlier in the run are dropped, and the
+        rest are written and indexed for search right away. The sink marks
+        them as seen once they are written.
+        
+        Args:
+            articles: Articles of one feed
+            
+        Returns:
+            Articles to keep for the end of the run (none when streaming)
+        """
+        if not self.streaming or not articles:
+            return articles
+        
+        articles = self.drop_seen(articles)
+        if self.seen_index is not None:
+            # Articles streamed earlier in the run may still be queued,
+            # so the seen index does not know them yet
+            fresh = []
+            for article in articles:
+                key = article_key(article)
+                if key is None or key not in self.streamed_keys:
+                    fresh.append(article)
+                    if key is not None:
+                        self.streamed_keys.add(key)
+            self.count_stat('already_seen', len(articles) - len(fresh))
+            articles = fresh
+        
+        copies = []
+        if self.duplicate_groups is not None:
+            new_articles = []
+            for article in articles:
+                _, new = self.duplicate_groups.add(article)
+                (new_articles if new else copies).append(article)
+            self.count_stat('near_duplicates', len(copies))
+            articles = new_articles
+        
+        if not articles and not copies:
+            return []
+        
+        # A copy's original was streamed before, so the sink exists then
+        if self.output_sink is None:
+            self.output_sink = self.open_stream()
+        self.output_sink.write(articles, copies)
+        self.count_stat('streamed', len(articles))
+        return []
+    
+    def open_stream(self) -> OutputSink:
+        """
+        Create the ndjson file of the run and the sink writing it.
+        
+        Returns:
+            Sink writing on a background thread, unless
+            ``output.background_writer`` is disabled
+        """
+        os.makedirs(self.output_directory, exist_ok=True)
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        writer = self.ndjson_writer(self.output_file_path(timestamp, 'ndjson'))
+        sink = NdjsonSink(writer, self.search_index, self.seen_index)
+        if not self.background_writer:
+            return sink
+        return QueuedSink(sink, self.logger, queue_size=self.writer_queue_size,
+                          batch_size=self.writer_batch_size)
+    
+    def close_stream(self):
+        """Finish the output streamed during the run, if any."""
+        if self.output_sink is None:
+            return
+        
+        sink, self.output_sink = self.output_sink, None
+        try:
+            sink.close()
+        except Exception as e:
+            self.logger.error(f"Error saving news articles: {str(e)}")
+            raise
+        finally:
+            if isinstance(sink, QueuedSink):
+                self.writer_stats = sink.stats()
+        self.logger.info(
+            f"News articles saved to: {sink.output_file} "
+            f"({self.run_stats['streamed']} articles)"
+        )
+    
+    def output_file_path(self, timestamp: str, extension: str) -> str:
+        """
+        Get the path of an output file of a run.
+        
+        Args:
+            timestamp: Timestamp of the run
+            extension: Extension of the output format
+            
+        Returns:
+            Path in the output directory, with the suffix of the
+            configured compression (such as .json.gz)
+        """
+        return os.path.join(
+            self.output_directory,
+            f'news_{timestamp}.{extension}{SUFFIXES[self.compression]}'
+        )
+    
+    def open_output_file(self, output_file: str, newline: Optional[str] = None):
+        """
+        Open an output file through the configured compressor.
+        
+        Args:
+            output_file: Path from output_file_path
+            newline: Newline translation, as for open()
+            
+        Returns:
+            Text stream to write the file with
+        """
+        return open_output(output_file, self.compression, self.compression_level,
+                           newline=newline)
+    
+    def ndjson_writer(self, output_file: str) -> NdjsonWriter:
+        """
+        Open an ndjson output file with the configured flush and
+        compression settings.
+        
+        Args:
+            output_file: Path from output_file_path
+            
+        Returns:
+            Open ndjson writer
+        """
+        return NdjsonWriter(
+            output_file,
+            self.logger,
+            flush_every=self.ndjson_flush_every,
+            fsync_interval=self.fsync_interval,
+            compression=self.compression,
+            compression_level=self.compression_level
+        )
+    
+    def get_article_store(self) -> ArticleStore:
+        """
+        Return the article database of the sqlite output format, opening
+        it on first use.
+        
+        Returns:
+            Article store kept open across runs
+        """
+        if self.article_store is None:
+            self.article_store = ArticleStore(
+                self.sqlite_file, self.logger, batch_size=self.sqlite_batch_size
+            )
+        return self.article_store
+    
+    def run(self, feeds: Optional[List[Tuple[str, str]]] = None):
+        """
+        Run the news fetcher application.
+        
+        Args:
+            feeds: Feeds to fetch as (feed_name, feed_url), defaults to
+                every feed in the feed file
+        """
         try:
             self.logger.info(f"Feed file: {self.feed_file}")
             self.logger.info(f"Time window: {self.time_window_minutes} minutes")
             
-            # Fetch news
-            news_articles = self.fetch_all_news()
+            try:
+                # Fetch news
+                try:
+                    news_articles = self.fetch_all_news(feeds)
+                finally:
+                    # Streamed articles are complete on disk even if the run failed
+                    self.close_stream()
+                
+                # Save to file if configured
+                if self.save_to_file and news_articles:
+                    self.save_news(news_articles)
+            except Exception:
+                # Unsaved articles must not be skipped as unchanged next time
+                self.discard_validators()
+                self.save_state()
+                raise
+            
+            # Validators only advance once the articles are written
+            self.save_state()
             
-            # Save to file if configured
-            if self.save_to_file and news_articles:
-                self.save_news(news_articles)
+            # Only delivered articles count as seen
+            self.mark_seen(news_articles)
+            
+            self.log_run_summary()
+            self.log_health_summary(feeds)
             
             self.logger.info("=" * 60)
             self.logger.info("News Fetcher Application Completed Successfully")
@@ -274,17 +1429,348 @@ class NewsFetcher:
                 exc_info=True
             )
             raise
+    
+    def run_forever(self):
+        """
+        Poll all feeds on a fixed interval until SIGTERM or SIGINT.
+        
+        Configuration, connection pools and per-feed state stay in memory
+        between cycles. On shutdown, feeds already being fetched are
+        finished and saved while feeds not yet started are skipped.
+        """
+        def request_stop(signum, frame):
+            self.logger.info(f"Received signal {signum}, shutting down after in-flight fetches")
+            self.stop_event.set()
+        
+        signal.signal(signal.SIGTERM, request_stop)
+        signal.signal(signal.SIGINT, request_stop)
+        
+        if self.scheduler is not None:
+            self.logger.info("Daemon mode: adaptive per-feed polling")
+        else:
+            self.logger.info(f"Daemon mode: polling every {self.poll_interval} seconds")
+        
+        while not self.stop_event.is_set():
+            started = time.monotonic()
+            wait = self.poll_interval
+            
+            try:
+                if self.scheduler is not None:
+                    self.scheduler.sync(self.load_feeds())
+                    due_feeds = self.scheduler.pop_due()
+                    if due_feeds:
+                        self.run(due_feeds)
+                    next_due = self.scheduler.seconds_until_next()
+                    wait = next_due if next_due is not None else self.poll_interval
+                else:
+                    self.run()
+                    wait = self.poll_interval - (time.monotonic() - started)
+            except Exception as e:
+                # Keep polling; run() has already logged its own errors
+                self.logger.error(f"Polling cycle failed: {str(e)}")
+            
+            self.stop_event.wait(max(0, wait))
+        
+        self.logger.info("Daemon stopped")
+    
+    def load_feeds(self) -> List[Tuple[str, str]]:
+        """
+        Read the feed file, reusing the last result while it is unchanged.
+        
+        Returns:
+            List of tuples containing (feed_name, feed_url)
+        """
+        mtime = os.path.getmtime(self.feed_file)
+        
+        if self.feeds is None or mtime != self.feeds_mtime:
+            self.feeds = self.parser.read_feed_file(self.feed_file)
+            self.feeds_mtime = mtime
+        
+        return self.feeds
+    
+    def cutoff_time(self) -> datetime:
+        """
+        Get the start of the time window.
+        
+        Returns:
+            Oldest publication time still considered new
+        """
+        return datetime.now() - timedelta(minutes=self.time_window_minutes)
+    
+    def count_stat(self, name: str, amount: int = 1):
+        """
+        Increment a per-run counter (safe to call from worker threads).
+        
+        Args:
+            name: Counter name
+            amount: Value to add
+        """
+        with self.stats_lock:
+            self.run_stats[name] += amount
+    
+    def drop_seen(self, articles: List[Dict]) -> List[Dict]:
+        """
+        Remove articles that were already emitted or appear twice.
+        
+        Args:
+            articles: Articles in feed-file order
+            
+        Returns:
+            Articles never seen before; of duplicates within the run the
+            first one is kept
+        """
+        if self.seen_index is None:
+            return articles
+        
+        new_articles = self.seen_index.filter_new(articles)
+        self.count_stat('already_seen', len(articles) - len(new_articles))
+        return new_articles
+    
+    def collapse_duplicates(self, articles: List[Dict]) -> List[Dict]:
+        """
+        Collapse copies of a story from several feeds into one article.
+        
+        Args:
+            articles: Articles in feed-file order
+            
+        Returns:
+            Canonical articles, each with a ``duplicates`` list
+        """
+        if self.near_duplicates is None:
+            return articles
+        
+        canonical = self.near_duplicates.collapse(articles)
+        self.count_stat('near_duplicates', len(articles) - len(canonical))
+        return canonical
+    
+    def mark_seen(self, articles: List[Dict]):
+        """
+        Record delivered articles in the seen-article index.
+        
+        Collapsed duplicates count as delivered with their canonical article.
+        
+        Args:
+            articles: Articles returned by fetch_all_news
+        """
+        if self.seen_index is None:
+            return
+        
+        delivered = list(articles)
+        for article in articles:
+            delivered.extend(article.get('duplicates', []))
+        
+        self.seen_index.mark_seen(delivered)
+        self.seen_index.save()
+    
+    def discard_validators(self, feed_urls: Optional[List[str]] = None):
+        """
+        Reset the ETags, Last-Modified dates and content hashes of feeds
+        to their values at the start of the run, so the next run
+        downloads and parses the feeds again.
+        
+        Args:
+            feed_urls: Feeds to reset, all feeds if None
+        """
+        if self.state_store is None or self.validator_snapshot is None:
+            return
+        self.state_store.restore(self.validator_snapshot, VALIDATOR_FIELDS, feed_urls)
+        if feed_urls is None:
+            self.logger.warning("Output not saved; feeds will be fetched again next run")
+    
+    def save_state(self):
+        """Persist per-feed state gathered during the run."""
+        if self.state_store is not None:
+            self.state_store.save()
+    
+    def log_run_summary(self):
+        """Log the counters gathered during the last run."""
+        self.logger.info(
+            f"Feeds not modified (HTTP 304): {self.run_stats['not_modified']}"
+        )
+        self.logger.info(
+            f"Feeds with unchanged content: {self.run_stats['unchanged']}"
+        )
+        self.logger.info(
+            f"Feeds parsed partially (early termination): {self.run_stats['truncated']}"
+        )
+        self.logger.info(
+            f"Feeds skipped (circuit open): {self.run_stats['circuit_open']}"
+        )
+        if self.seen_index is not None:
+            self.logger.info(
+                f"Articles skipped (already seen): {self.run_stats['already_seen']}"
+            )
+        if self.near_duplicates is not None:
+            self.logger.info(
+                f"Articles collapsed (near-duplicates): {self.run_stats['near_duplicates']}"
+            )
+        if self.streaming:
+            self.logger.info(f"Articles streamed to ndjson: {self.run_stats['streamed']}")
+        if self.writer_stats:
+            self.logger.info(f"Output writer: {self.writer_stats}")
+        if self.cut_off_feeds:
+            self.logger.warning(
+                f"Feeds cut off by time limits ({len(self.cut_off_feeds)}): "
+                f"{', '.join(self.cut_off_feeds)}"
+            )
+        else:
+            self.logger.info("Feeds cut off by time limits: 0")
+        self.log_connection_stats()
+        self.log_host_queue_stats()
+    
+    def log_health_summary(self, feeds: Optional[List[Tuple[str, str]]] = None):
+        """
+        Log a table with the health of the fetched feeds.
+        
+        Args:
+            feeds: Feeds of the run, defaults to every feed in the feed file
+        """
+        if feeds is None:
+            try:
+                feeds = self.load_feeds()
+            except FileNotFoundError:
+                return
+        
+        self.logger.info("Feed health:")
+        for line in self.health.summary(feeds):
+            self.logger.info(f"  {line}")
+    
+    def log_connection_stats(self):
+        """Log how many HTTP connections were opened and reused this run."""
+        if self.async_parser is not None:
+            new, reused = self.async_parser.connection_stats()
+        else:
+            new, reused = self.parser.connection_stats()
+        self.logger.info(f"HTTP connections: {new} new, {reused} reused")
+    
+    def log_host_queue_stats(self):
+        """Log the time requests spent waiting for each host's limits."""
+        stats = self.rate_limiter.queue_stats()
+        for host, (requests, queued) in sorted(
+            stats.items(), key=lambda item: item[1][1], reverse=True
+        ):
+            self.logger.info(
+                f"Host {host}: {requests} requests, {queued:.2f}s queued "
+                f"({queued / requests:.2f}s avg)"
+            )
+    
+    def close(self):
+        """Release network resources and worker processes held across runs."""
+        self.parser.close()
+        self.close_stream()
+        
+        if self.seen_index is not None:
+            self.seen_index.close()
+            self.seen_index = None
+        
+        if self.article_store is not None:
+            self.article_store.close()
+            self.article_store = None
+        
+        if self.search_index is not None:
+            self.search_index.close()
+            self.search_index = None
+        
+        if self.process_pool is not None:
+            self.process_pool.shutdown()
+            self.process_pool = None
+        
+        if self.event_loop is not None:
+            if self.async_parser is not None:
+                self.event_loop.run_until_complete(self.async_parser.close())
+            self.event_loop.close()
+            self.event_loop = None
+
+
+def search_main(argv: List[str]) -> int:
+    """
+    Entry point of the search subcommand.
+    
+    Args:
+        argv: Arguments after ``search``
+        
+    Returns:
+        Exit code
+    """
+    arg_parser = argparse.ArgumentParser(
+        prog='news_fetcher.py search',
+        description="Search the titles and summaries of saved articles"
+    )
+    arg_parser.add_argument('words', nargs='+', help='words that must all match')
+    arg_parser.add_argument('--config', default='config.yaml',
+                            help='path to the configuration file')
+    arg_parser.add_argument('--feed', help='only articles of this feed')
+    arg_parser.add_argument('--hours', type=float,
+                            help='only articles published in the last N hours')
+    arg_parser.add_argument('--since', help='only articles published at or after '
+                            'this UTC time (ISO 8601)')
+    arg_parser.add_argument('--until', help='only articles published before '
+                            'this UTC time (ISO 8601)')
+    arg_parser.add_argument('--limit', type=int, default=20,
+                            help='maximum number of results (default: 20)')
+    arg_parser.add_argument('--exact', action='store_true',
+                            help='match whole words only, not words starting with them')
+    args = arg_parser.parse_args(argv)
+    
+    try:
+        index_file = NewsFetcher.search_index_file(NewsFetcher.load_config(args.config))
+        if not os.path.exists(index_file):
+            print(f"No search index at {index_file}; enable search in the "
+                  f"configuration and run the fetcher first")
+            return 1
+        
+        since = args.since
+        if args.hours is not None:
+            # Publication times are stored as naive UTC
+            now = datetime.now(timezone.utc).replace(tzinfo=None)
+            since = (now - timedelta(hours=args.hours)).isoformat(timespec='seconds')
+        
+        index = SearchIndex(index_file, logging.getLogger("NewsFetcher"))
+        try:
+            started = time.perf_counter()
+            results = index.search(' '.join(args.words), feed_name=args.feed,
+                                   since=since, until=args.until,
+                                   limit=args.limit, prefix=not args.exact)
+            elapsed = time.perf_counter() - started
+        finally:
+            index.close()
+        
+        for result in results:
+            print(f"{result['published'] or '-'}  {result['feed_name']}  {result['title']}")
+            print(f"    {result['link']}")
+        print(f"{len(results)} results in {elapsed * 1000:.0f} ms")
+        return 0
+        
+    except Exception as e:
+        print(f"Search failed: {str(e)}")
+        return 1
 
 
 def main():
     """Main entry point for the application."""
+    if sys.argv[1:2] == ['search']:
+        return search_main(sys.argv[2:])
+    
+    arg_parser = argparse.ArgumentParser(
+        description="Fetch news from RSS/Atom feeds",
+        epilog="Use 'news_fetcher.py search --help' to search saved articles."
+    )
+    arg_parser.add_argument('config_file', nargs='?', default='config.yaml',
+                            help='path to the configuration file')
+    arg_parser.add_argument('--daemon', action='store_true',
+                            help='keep running and poll the feeds on an interval')
+    args = arg_parser.parse_args()
+    
     try:
-        # Check for config file argument
-        config_file = sys.argv[1] if len(sys.argv) > 1 else "config.yaml"
-        
         # Create and run fetcher
-        fetcher = NewsFetcher(config_file)
-        fetcher.run()
+        fetcher = NewsFetcher(args.config_file)
+        try:
+            if args.daemon:
+                fetcher.run_forever()
+            else:
+                fetcher.run()
+        finally:
+            fetcher.close()
         
         return 0
         
@@ -0,0 +1,81 @@
+"""
+Output compression module for the file output formats.
+Opens output files through a gzip or zstd compressor, so articles are
+compressed as they are written instead of in a second pass.
+"""
+
+import gzip
+from typing import IO, Optional
+
+from logger_utils import ConfigError
+
+try:
+    import zstandard
+except ImportError:  # optional dependency, only needed for zstd output
+    zstandard = None
+
+
+# File name suffix of each codec
+SUFFIXES = {'none': '', 'gzip': '.gz', 'zstd': '.zst'}
+
+# Levels used when none is configured: zlib's and zstd's own defaults,
+# which compress text well at a fraction of the time of the top levels
+DEFAULT_LEVELS = {'gzip': 6, 'zstd': 3}
+
+LEVEL_RANGES = {'gzip': (0, 9), 'zstd': (1, 22)}
+
+
+def check_compression(compression: str, level: Optional[int] = None):
+    """
+    Validate an output compression setting.
+
+    Args:
+        compression: Codec name, one of SUFFIXES
+        level: Compression level, the codec default if None
+
+    Raises:
+        ConfigError: If the codec is unknown or not installed, or the
+            level is out of range
+    """
+    if compression not in SUFFIXES:
+        raise ConfigError(f"Unsupported output compression: {compression}")
+    if compression == 'zstd' and zstandard is None:
+        raise ConfigError(
+            "zstd output compression requires zstandard "
+            "(pip install -r requirements-optional.txt)"
+        )
+    if level is not None and compression in LEVEL_RANGES:
+        low, high = LEVEL_RANGES[compression]
+        if not low <= level <= high:
+            raise ConfigError(
+                f"Invalid {compression} compression level {level} "
+                f"(expected {low}-{high})"
+            )
+
+
+def open_output(path: str, compression: str = 'none', level: Optional[int] = None,
+                newline: Optional[str] = None, buffering: int = -1) -> IO[str]:
+    """
+    Open a text file for writing through a compressor.
+
+    Args:
+        path: Path of the file, including the codec suffix
+        compression: Codec name, one of SUFFIXES
+        level: Compression level, the codec default if None
+        newline: Newline translation, as for open()
+        buffering: Buffer size of an uncompressed file, as for open()
+
+    Returns:
+        UTF-8 text stream; flushing it also flushes the compressor, and
+        fileno() is the file descriptor of the compressed file
+    """
+    if compression == 'gzip':
+        return gzip.open(path, 'wt', encoding='utf-8', newline=newline,
+                         compresslevel=DEFAULT_LEVELS['gzip'] if level is None else level)
+    if compression == 'zstd':
+        compressor = zstandard.ZstdCompressor(
+            level=DEFAULT_LEVELS['zstd'] if level is None else level
+        )
+        return zstandard.open(path, 'wt', cctx=compressor, encoding='utf-8',
+                              newline=newline)
+    return open(path, 'w', encoding='utf-8', newline=newline, buffering=buffering)
@@ -0,0 +1,222 @@
+"""
+Parquet writer module for the parquet output format.
+Writes articles as compressed, dictionary-encoded columnar files in a
+feed_name=/date= partitioned directory tree that pandas, pyarrow and
+query engines read as one dataset.
+"""
+
+import os
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import quote
+
+from logger_utils import NewsLogger, ConfigError
+
+
+# Columns that repeat few distinct values, by Parquet column path (list
+# values are in <column>.list.element); feed_name is stored in the
+# directory names instead of the files
+DICTIONARY_COLUMNS = [
+    'author', 'categories.list.element', 'duplicates.list.element.feed_name'
+]
+
+COMPRESSIONS = ('zstd', 'snappy', 'gzip', 'brotli', 'lz4', 'none')
+
+
+def import_pyarrow() -> Tuple:
+    """
+    Import pyarrow, which is only loaded when the parquet format is used.
+
+    Returns:
+        The pyarrow and pyarrow.parquet modules
+
+    Raises:
+        ConfigError: If pyarrow is not installed
+    """
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:  # optional dependency, only needed for parquet output
+        raise ConfigError(
+            "The parquet output format requires pyarrow "
+            "(pip install -r requirements-optional.txt)"
+        )
+    return pyarrow, pyarrow.parquet
+
+
+def parse_timestamp(value: Optional[str]) -> Optional[datetime]:
+    """
+    Parse an ISO timestamp of an article.
+
+    Args:
+        value: ISO 8601 string
+
+    Returns:
+        Datetime, None if the value is missing or malformed
+    """
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+class ParquetWriter:
+    """Writes articles to a Hive-partitioned Parquet dataset."""
+
+    def __init__(self, dataset_directory: str, logger: NewsLogger,
+                 compression: str = 'zstd', compression_level: Optional[int] = None,
+                 row_group_size: int = 100000):
+        """
+        Initialize the writer.
+
+        Args:
+            dataset_directory: Root directory of the dataset
+            logger: Logger instance for logging
+            compression: Parquet compression codec, one of COMPRESSIONS
+            compression_level: Codec level, the codec default if None
+            row_group_size: Most articles per row group
+
+        Raises:
+            ConfigError: If pyarrow is not installed or the codec is unknown
+        """
+        if compression not in COMPRESSIONS:
+            raise ConfigError(f"Unsupported parquet compression: {compression}")
+
+        self.pa, self.pq = import_pyarrow()
+        self.dataset_directory = dataset_directory
+        self.logger = logger
+        self.compression = compression
+        self.compression_level = compression_level
+        self.row_group_size = max(1, row_group_size)
+
+        pa = self.pa
+        self.schema = pa.schema([
+            ('title', pa.string()),
+            ('link', pa.string()),
+            ('canonical_link', pa.string()),
+            ('guid', pa.string()),
+            ('summary', pa.string()),
+            # Publication times are UTC, fetch times local as in the
+            # other formats
+            ('published', pa.timestamp('s', tz='UTC')),
+            ('author', pa.string()),
+            ('categories', pa.list_(pa.string())),
+            ('duplicates', pa.list_(pa.struct([
+                ('feed_name', pa.string()),
+                ('link', pa.string()),
+                ('canonical_link', pa.string()),
+                ('guid', pa.string())
+            ]))),
+            ('fetched_at', pa.timestamp('us'))
+        ])
+
+    @staticmethod
+    def partition(article: Dict) -> Tuple[str, str]:
+        """
+        Get the partition of an article.
+
+        Args:
+            article: Article dictionary
+
+        Returns:
+            Feed name and the publication date (the fetch date for
+            articles without one) as YYYY-MM-DD
+        """
+        day = (parse_timestamp(article.get('published'))
+               or parse_timestamp(article.get('fetched_at'))
+               or datetime.now())
+        return article.get('feed_name', ''), day.date().isoformat()
+
+    def partition_path(self, feed_name: str, day: str) -> str:
+        """
+        Get the directory of a partition.
+
+        Values are percent-encoded like pyarrow does, so names with
+        slashes or spaces stay one directory level.
+
+        Args:
+            feed_name: Feed name
+            day: Date as YYYY-MM-DD
+
+        Returns:
+            Path of the partition directory
+        """
+        return os.path.join(
+            self.dataset_directory,
+            f"feed_name={quote(feed_name, safe='')}",
+            f"date={day}"
+        )
+
+    def table(self, articles: List[Dict]):
+        """
+        Convert articles to an Arrow table.
+
+        Args:
+            articles: Articles of one partition
+
+        Returns:
+            pyarrow.Table with the writer's schema
+        """
+        columns = defaultdict(list)
+        for article in articles:
+            columns['title'].append(article.get('title'))
+            columns['link'].append(article.get('link'))
+            columns['canonical_link'].append(article.get('canonical_link', article.get('link')))
+            columns['guid'].append(article.get('guid'))
+            columns['summary'].append(article.get('summary'))
+            published = parse_timestamp(article.get('published'))
+            if published is not None and published.tzinfo is None:
+                published = published.replace(tzinfo=timezone.utc)
+            columns['published'].append(published)
+            columns['author'].append(article.get('author') or None)
+            columns['categories'].append(article.get('categories') or [])
+            columns['duplicates'].append(article.get('duplicates') or [])
+            columns['fetched_at'].append(parse_timestamp(article.get('fetched_at')))
+
+        return self.pa.Table.from_pydict(
+            {name: columns[name] for name in self.schema.names}, schema=self.schema
+        )
+
+    def write(self, articles: List[Dict], file_stem: str) -> List[str]:
+        """
+        Write articles, one new file per partition.
+
+        Files are written under a temporary name and renamed when complete,
+        so readers never see a partial file.
+
+        Args:
+            articles: Articles to write
+            file_stem: Name of the files without extension, unique per run
+
+        Returns:
+            Paths of the written files
+        """
+        partitions = defaultdict(list)
+        for article in articles:
+            partitions[self.partition(article)].append(article)
+
+        written = []
+        for (feed_name, day), partition_articles in partitions.items():
+            directory = self.partition_path(feed_name, day)
+            os.makedirs(directory, exist_ok=True)
+            path = os.path.join(directory, f"{file_stem}.parquet")
+            temp_path = os.path.join(directory, f".{file_stem}.parquet.tmp")
+
+            self.pq.write_table(
+                self.table(partition_articles),
+                temp_path,
+                row_group_size=self.row_group_size,
+                compression=self.compression,
+                compression_level=self.compression_level,
+                use_dictionary=DICTIONARY_COLUMNS
+            )
+            os.replace(temp_path, path)
+            written.append(path)
+
+        self.logger.debug(
+            f"Wrote {len(articles)} articles to {len(written)} parquet partitions"
+        )
+        return written
@@ -0,0 +1,227 @@
+"""
+Rate limiter module for polite parallel fetching.
+Limits requests per host with a token bucket and caps concurrent
+connections per host, for both threads and asyncio.
+"""
+
+import asyncio
+import threading
+import time
+from collections import defaultdict
+from contextlib import asynccontextmanager, contextmanager
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+from logger_utils import NewsLogger, DeadlineExceeded
+
+
+class HostRateLimiter:
+    """Per-host token bucket and connection limit shared by all fetches."""
+
+    def __init__(self, logger: NewsLogger, requests_per_second: float = 0,
+                 burst: int = 1, max_connections: int = 0,
+                 domains: Optional[Dict[str, Dict]] = None):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            logger: Logger instance for logging
+            requests_per_second: Sustained request rate per host (0 = unlimited)
+            burst: Requests a host may receive back to back
+            max_connections: Concurrent requests per host (0 = unlimited)
+            domains: Per-domain overrides of the three limits, keyed by
+                domain (also applied to its subdomains)
+        """
+        self.logger = logger
+        self.defaults = {
+            'requests_per_second': requests_per_second,
+            'burst': burst,
+            'max_connections_per_host': max_connections
+        }
+        self.domains = domains or {}
+
+        self._lock = threading.Lock()
+        self._buckets: Dict[str, Tuple[float, float]] = {}
+        self._semaphores: Dict[str, threading.BoundedSemaphore] = {}
+        self._async_semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._queued = defaultdict(float)
+        self._requests = defaultdict(int)
+
+    def limits_for(self, host: str) -> Dict:
+        """
+        Get the limits that apply to a host.
+
+        Args:
+            host: Host name
+
+        Returns:
+            Dictionary with requests_per_second, burst and
+            max_connections_per_host
+        """
+        limits = dict(self.defaults)
+
+        # The most specific matching domain wins
+        matches = [
+            domain for domain in self.domains
+            if host == domain or host.endswith('.' + domain)
+        ]
+        if matches:
+            limits.update(self.domains[max(matches, key=len)])
+
+        return limits
+
+    def _reserve_token(self, host: str) -> float:
+        """
+        Take a token from a host's bucket.
+
+        A missing token is borrowed, so concurrent callers queue up one
+        interval apart.
+
+        Returns:
+            Seconds to wait before sending the request
+        """
+        limits = self.limits_for(host)
+        rate = limits['requests_per_second']
+        if not rate:
+            return 0.0
+
+        burst = max(1, limits['burst'])
+        now = time.monotonic()
+
+        with self._lock:
+            tokens, last = self._buckets.get(host, (burst, now))
+            tokens = min(burst, tokens + (now - last) * rate) - 1
+            self._buckets[host] = (tokens, now)
+
+        return -tokens / rate if tokens < 0 else 0.0
+
+    def _return_token(self, host: str):
+        """Give back a token reserved by a request that was not sent."""
+        with self._lock:
+            if host in self._buckets:
+                tokens, last = self._buckets[host]
+                self._buckets[host] = (tokens + 1, last)
+
+    @staticmethod
+    def _time_left(deadline: Optional[float]) -> Optional[float]:
+        """Get the seconds left until a deadline (None without a deadline)."""
+        if deadline is None:
+            return None
+        return max(0.0, deadline - time.monotonic())
+
+    def _check_delay(self, host: str, delay: float, deadline: Optional[float]):
+        """
+        Give up on a request whose token comes due after its deadline.
+
+        Raises:
+            DeadlineExceeded: If the delay does not fit before the deadline
+        """
+        time_left = self._time_left(deadline)
+        if time_left is not None and delay > time_left:
+            self._return_token(host)
+            raise DeadlineExceeded(f"Time budget exhausted waiting for {host}")
+
+    def _semaphore(self, host: str) -> Optional[threading.BoundedSemaphore]:
+        """Get the connection semaphore of a host (None if unlimited)."""
+        limit = self.limits_for(host)['max_connections_per_host']
+        if not limit:
+            return None
+
+        with self._lock:
+            if host not in self._semaphores:
+                self._semaphores[host] = threading.BoundedSemaphore(limit)
+            return self._semaphores[host]
+
+    def _async_semaphore(self, host: str) -> Optional[asyncio.Semaphore]:
+        """Get the asyncio connection semaphore of a host (None if unlimited)."""
+        limit = self.limits_for(host)['max_connections_per_host']
+        if not limit:
+            return None
+
+        if host not in self._async_semaphores:
+            self._async_semaphores[host] = asyncio.Semaphore(limit)
+        return self._async_semaphores[host]
+
+    def _record(self, host: str, waited: float):
+        """Add a request and its queueing time to the host statistics."""
+        with self._lock:
+            self._requests[host] += 1
+            self._queued[host] += waited
+
+    @contextmanager
+    def slot(self, url: str, deadline: Optional[float] = None):
+        """
+        Wait until a request to the URL's host is allowed (blocking).
+
+        Args:
+            url: URL about to be requested
+            deadline: time.monotonic() value the wait must end by
+
+        Raises:
+            DeadlineExceeded: If the request cannot be sent before the deadline
+        """
+        host = urlparse(url).hostname or ''
+        semaphore = self._semaphore(host)
+        started = time.monotonic()
+
+        if semaphore is not None:
+            if not semaphore.acquire(timeout=self._time_left(deadline)):
+                raise DeadlineExceeded(f"Time budget exhausted waiting for {host}")
+        try:
+            delay = self._reserve_token(host)
+            self._check_delay(host, delay, deadline)
+            if delay:
+                time.sleep(delay)
+            self._record(host, time.monotonic() - started)
+            yield
+        finally:
+            if semaphore is not None:
+                semaphore.release()
+
+    @asynccontextmanager
+    async def async_slot(self, url: str, deadline: Optional[float] = None):
+        """
+        Wait until a request to the URL's host is allowed (asyncio).
+
+        Args:
+            url: URL about to be requested
+            deadline: time.monotonic() value the wait must end by
+
+        Raises:
+            DeadlineExceeded: If the request cannot be sent before the deadline
+        """
+        host = urlparse(url).hostname or ''
+        semaphore = self._async_semaphore(host)
+        started = time.monotonic()
+
+        if semaphore is not None:
+            try:
+                await asyncio.wait_for(semaphore.acquire(), self._time_left(deadline))
+            except asyncio.TimeoutError:
+                raise DeadlineExceeded(f"Time budget exhausted waiting for {host}")
+        try:
+            delay = self._reserve_token(host)
+            self._check_delay(host, delay, deadline)
+            if delay:
+                await asyncio.sleep(delay)
+            self._record(host, time.monotonic() - started)
+            yield
+        finally:
+            if semaphore is not None:
+                semaphore.release()
+
+    def queue_stats(self) -> Dict[str, Tuple[int, float]]:
+        """
+        Get and reset the per-host request counts and queueing times.
+
+        Returns:
+            Dictionary mapping host to (requests, seconds_queued)
+        """
+        with self._lock:
+            stats = {
+                host: (self._requests[host], self._queued[host])
+                for host in self._requests
+            }
+            self._requests.clear()
+            self._queued.clear()
+        return stats
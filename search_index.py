@@ -0,0 +1,222 @@
+"""
+Search index module for full-text search over saved articles.
+Keeps the title and summary of every saved article in an SQLite FTS5
+index with a tokenizer that keeps Bengali words whole, and runs ranked
+queries with feed and time filters.
+"""
+
+import os
+import sqlite3
+from typing import Dict, List, Optional
+
+from logger_utils import NewsLogger, ConfigError
+from near_duplicates import normalize_text, tokenize
+from seen_index import article_key
+
+
+# unicode61 treats combining marks as separators by default, which splits
+# Bengali words at every vowel sign; adding M* keeps them in the token
+TOKENIZER = "unicode61 remove_diacritics 0 categories 'L* N* Co M*'"
+
+# Title matches rank ten times higher than summary matches
+RANKING = "bm25(documents_fts, 10.0, 1.0)"
+
+# Shorter words are matched exactly; as prefixes they would match so many
+# index terms that queries get slow
+MIN_PREFIX_LENGTH = 3
+
+SCHEMA = [
+    """CREATE TABLE IF NOT EXISTS documents (
+        id INTEGER PRIMARY KEY,
+        article_key TEXT NOT NULL UNIQUE,
+        feed_name TEXT NOT NULL,
+        published TEXT,
+        link TEXT,
+        title TEXT,
+        summary TEXT
+    )""",
+    "CREATE INDEX IF NOT EXISTS documents_feed_published ON documents (feed_name, published)",
+    "CREATE INDEX IF NOT EXISTS documents_published ON documents (published)",
+    f"""CREATE VIRTUAL TABLE IF NOT EXISTS documents_fts USING fts5(
+        title, summary,
+        content='documents', content_rowid='id',
+        tokenize="{TOKENIZER}"
+    )""",
+    # Keep the index in step with the documents table
+    """CREATE TRIGGER IF NOT EXISTS documents_ai AFTER INSERT ON documents BEGIN
+        INSERT INTO documents_fts (rowid, title, summary)
+        VALUES (new.id, new.title, new.summary);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS documents_ad AFTER DELETE ON documents BEGIN
+        INSERT INTO documents_fts (documents_fts, rowid, title, summary)
+        VALUES ('delete', old.id, old.title, old.summary);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS documents_au AFTER UPDATE ON documents BEGIN
+        INSERT INTO documents_fts (documents_fts, rowid, title, summary)
+        VALUES ('delete', old.id, old.title, old.summary);
+        INSERT INTO documents_fts (rowid, title, summary)
+        VALUES (new.id, new.title, new.summary);
+    END""",
+]
+
+UPSERT = (
+    "INSERT INTO documents (article_key, feed_name, published, link, title, summary) "
+    "VALUES (?, ?, ?, ?, ?, ?) "
+    "ON CONFLICT (article_key) DO UPDATE SET "
+    "feed_name = excluded.feed_name, published = excluded.published, "
+    "link = excluded.link, title = excluded.title, summary = excluded.summary"
+)
+
+
+def build_query(text: str, prefix: bool = True) -> str:
+    """
+    Turn free text into an FTS5 query.
+
+    Every word must match. Words are quoted so FTS5 syntax in the input is
+    taken literally.
+
+    Args:
+        text: Search words
+        prefix: Also match words starting with each search word of at
+            least MIN_PREFIX_LENGTH characters, which finds inflected
+            Bengali forms (বাংলাদেশ finds বাংলাদেশের)
+
+    Returns:
+        FTS5 MATCH expression (empty if the text has no words)
+    """
+    return ' '.join(
+        f'"{word}"*' if prefix and len(word) >= MIN_PREFIX_LENGTH else f'"{word}"'
+        for word in tokenize(text)
+    )
+
+
+class SearchIndex:
+    """Incrementally built FTS5 index of saved articles."""
+
+    def __init__(self, index_file: str, logger: NewsLogger, batch_size: int = 1000):
+        """
+        Open the index, creating it if needed.
+
+        Args:
+            index_file: Path to the SQLite index file
+            logger: Logger instance for logging
+            batch_size: Articles indexed per transaction
+
+        Raises:
+            ConfigError: If SQLite lacks FTS5 or the index cannot be opened
+        """
+        self.index_file = index_file
+        self.logger = logger
+        self.batch_size = max(1, batch_size)
+
+        directory = os.path.dirname(index_file)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        try:
+            # Streamed articles are indexed on the output writer thread;
+            # the index is only ever used by one thread at a time
+            self._db = sqlite3.connect(index_file, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode = WAL")
+            self._db.execute("PRAGMA synchronous = NORMAL")
+            with self._db:
+                for statement in SCHEMA:
+                    self._db.execute(statement)
+        except sqlite3.OperationalError as e:
+            if 'fts5' in str(e):
+                raise ConfigError("Search requires SQLite built with FTS5")
+            raise ConfigError(f"Cannot open search index {index_file}: {str(e)}")
+        except sqlite3.Error as e:
+            raise ConfigError(f"Cannot open search index {index_file}: {str(e)}")
+
+    @staticmethod
+    def row(article: Dict) -> tuple:
+        """
+        Convert an article to the values of its document row.
+
+        Args:
+            article: Article dictionary
+
+        Returns:
+            Values in UPSERT order, with normalized title and summary
+        """
+        key = article_key(article) or f"{article.get('feed_name', '')}\n{article.get('title', '')}"
+        return (
+            key,
+            article.get('feed_name', ''),
+            article.get('published'),
+            article.get('canonical_link') or article.get('link'),
+            normalize_text(article.get('title') or ''),
+            normalize_text(article.get('summary') or '')
+        )
+
+    def add(self, articles: List[Dict]) -> int:
+        """
+        Index articles, replacing earlier versions of the same article.
+
+        Args:
+            articles: Saved articles
+
+        Returns:
+            Number of articles indexed
+        """
+        indexed = 0
+        try:
+            for start in range(0, len(articles), self.batch_size):
+                batch = articles[start:start + self.batch_size]
+                with self._db:
+                    self._db.executemany(UPSERT, map(self.row, batch))
+                indexed += len(batch)
+        except sqlite3.Error as e:
+            # The articles are saved already, only search misses them
+            self.logger.error(
+                f"Error updating search index {self.index_file}: {str(e)}"
+            )
+        return indexed
+
+    def search(self, text: str, feed_name: Optional[str] = None,
+               since: Optional[str] = None, until: Optional[str] = None,
+               limit: int = 20, prefix: bool = True) -> List[Dict]:
+        """
+        Find the articles best matching the search words.
+
+        Args:
+            text: Search words, all of which must match
+            feed_name: Only return articles of this feed
+            since: Only articles published at or after this ISO time (UTC)
+            until: Only articles published before this ISO time (UTC)
+            limit: Maximum number of results
+            prefix: Match words starting with the search words
+
+        Returns:
+            Results, best first, with feed_name, published, title, link
+            and rank (lower is better)
+        """
+        query = build_query(text, prefix)
+        if not query:
+            return []
+
+        sql = (
+            f"SELECT d.feed_name, d.published, d.title, d.link, {RANKING} AS rank "
+            f"FROM documents_fts JOIN documents d ON d.id = documents_fts.rowid "
+            f"WHERE documents_fts MATCH ?"
+        )
+        params: List = [query]
+        if feed_name:
+            sql += " AND d.feed_name = ?"
+            params.append(feed_name)
+        if since:
+            sql += " AND d.published >= ?"
+            params.append(since)
+        if until:
+            sql += " AND d.published < ?"
+            params.append(until)
+        sql += " ORDER BY rank LIMIT ?"
+        params.append(limit)
+
+        columns = ('feed_name', 'published', 'title', 'link', 'rank')
+        return [dict(zip(columns, row)) for row in self._db.execute(sql, params)]
+
+    def close(self):
+        """Close the index."""
+        self._db.close()
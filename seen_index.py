@@ -0,0 +1,273 @@
+"""
+Seen-article index module for deduplicating articles across runs.
+Remembers every emitted article by its normalized GUID or link in an
+in-memory hash table, or memory-mapped Bloom filters at large scale,
+backed by a SQLite file, forgetting articles that have not been seen for
+the retention period.
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, List, Optional
+
+from logger_utils import NewsLogger, ConfigError
+from bloom_filter import RotatingBloomFilter
+from url_canonicalizer import normalize_url
+
+
+def article_key(article: Dict) -> Optional[str]:
+    """
+    Get the identity of an article.
+
+    Args:
+        article: Article dictionary as built by FeedParser.extract_entry_data
+
+    Returns:
+        Normalized GUID, or the canonical link if the feed has no GUIDs;
+        None if the article has neither. GUIDs that are not URLs, such
+        as numeric IDs, are prefixed with the feed name and a newline.
+    """
+    guid = (article.get('guid') or '').strip()
+    if guid:
+        identity = normalize_url(guid)
+        if identity.startswith(('http://', 'https://')):
+            return identity
+        # Opaque GUIDs are only unique within their feed
+        return f"{article.get('feed_name', '')}\n{guid}"
+
+    link = article.get('canonical_link') or article.get('link')
+    return normalize_url(link) if link else None
+
+
+class SeenArticleIndex:
+    """
+    Persistent set of articles already emitted.
+
+    Keys are 64-bit hashes of the article identity, stored with their
+    last-seen time in SQLite. The ``exact`` backend holds every key in a
+    dictionary ordered by last-seen time: membership tests are O(1) and
+    expired keys are evicted from the front of the dictionary. The
+    ``bloom`` backend keeps only rotating Bloom filters in memory-mapped
+    files and looks a key up in SQLite when the filters report a hit.
+    """
+
+    def __init__(self, index_file: str, logger: NewsLogger,
+                 retention_days: float = 7, backend: str = 'exact',
+                 bloom_capacity: int = 1000000, bloom_error_rate: float = 0.001):
+        """
+        Initialize the index and load the articles seen within the
+        retention period.
+
+        Args:
+            index_file: Path to the SQLite index file
+            logger: Logger instance for logging
+            retention_days: Forget articles not seen for this many days
+            backend: 'exact' (in-memory set) or 'bloom' (memory-mapped
+                Bloom filters next to the index file)
+            bloom_capacity: Articles per Bloom filter generation
+            bloom_error_rate: False-positive rate of a full generation
+
+        Raises:
+            ConfigError: If the backend is unknown or the index file
+                cannot be opened
+        """
+        if backend not in ('exact', 'bloom'):
+            raise ConfigError(f"Unsupported dedup backend: {backend}")
+
+        self.index_file = index_file
+        self.logger = logger
+        self.retention_seconds = retention_days * 86400
+        self.backend = backend
+
+        self._lock = threading.Lock()
+        self._seen: Dict[int, int] = {}
+        self._pending: Dict[int, int] = {}
+
+        directory = os.path.dirname(index_file)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        try:
+            self._db = sqlite3.connect(index_file)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS seen ("
+                "key INTEGER PRIMARY KEY, seen_at INTEGER NOT NULL)"
+            )
+            self._db.execute(
+                "CREATE INDEX IF NOT EXISTS seen_at_idx ON seen (seen_at)"
+            )
+            self._db.commit()
+            if backend == 'exact':
+                self._load()
+        except sqlite3.Error as e:
+            raise ConfigError(f"Cannot open seen-article index {index_file}: {str(e)}")
+
+        self.bloom = None
+        if backend == 'bloom':
+            self.bloom = RotatingBloomFilter(
+                index_file, logger,
+                capacity=bloom_capacity,
+                error_rate=bloom_error_rate,
+                retention_seconds=self.retention_seconds
+            )
+
+    def _load(self):
+        """Load the unexpired keys, oldest first."""
+        rows = self._db.execute(
+            "SELECT key, seen_at FROM seen WHERE seen_at >= ? ORDER BY seen_at",
+            (self._expiry(),)
+        )
+        self._seen = dict(rows)
+        self.logger.debug(
+            f"Loaded {len(self._seen)} seen articles from {self.index_file}"
+        )
+
+    def _expiry(self) -> int:
+        """Oldest last-seen time that has not expired yet."""
+        return int(time.time() - self.retention_seconds)
+
+    @staticmethod
+    def hash_key(key: str) -> int:
+        """
+        Hash an article identity to the 64-bit key stored in the index.
+
+        Args:
+            key: Article identity from article_key
+
+        Returns:
+            Signed 64-bit integer (an SQLite INTEGER PRIMARY KEY)
+        """
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=8).digest()
+        return int.from_bytes(digest, 'big', signed=True)
+
+    @staticmethod
+    def key_bytes(hashed: int) -> bytes:
+        """Bloom filter key of a hashed article identity."""
+        return hashed.to_bytes(8, 'big', signed=True)
+
+    def _is_seen(self, hashed: int) -> bool:
+        """Check whether a hashed key was seen within the retention period."""
+        if self.bloom is None:
+            return hashed in self._seen
+
+        if hashed in self._pending:
+            return True
+        if self.key_bytes(hashed) not in self.bloom:
+            return False
+
+        # Bloom filters give false positives, so confirm with the exact store
+        row = self._db.execute(
+            "SELECT 1 FROM seen WHERE key = ? AND seen_at >= ?",
+            (hashed, self._expiry())
+        ).fetchone()
+        return row is not None
+
+    def filter_new(self, articles: Iterable[Dict]) -> List[Dict]:
+        """
+        Drop articles seen in earlier runs or earlier in the same list.
+
+        Articles without a GUID or link are always kept. Seen articles
+        that are still in a feed have their retention period restarted;
+        new ones are only recorded by mark_seen, once delivered.
+
+        Args:
+            articles: Articles in output order
+
+        Returns:
+            Articles never seen before, in the same order
+        """
+        new_articles = []
+        batch = set()
+        now = int(time.time())
+
+        with self._lock:
+            for article in articles:
+                key = article_key(article)
+                if key is None:
+                    new_articles.append(article)
+                    continue
+
+                hashed = self.hash_key(key)
+                if self._is_seen(hashed):
+                    self._touch(hashed, now)
+                    continue
+                if hashed in batch:
+                    continue
+                batch.add(hashed)
+                new_articles.append(article)
+
+        return new_articles
+
+    def mark_seen(self, articles: Iterable[Dict]):
+        """
+        Record articles as seen now.
+
+        Articles already in the index are moved to the back, so their
+        retention period starts over.
+
+        Args:
+            articles: Delivered articles
+        """
+        now = int(time.time())
+
+        with self._lock:
+            for article in articles:
+                key = article_key(article)
+                if key is None:
+                    continue
+
+                self._touch(self.hash_key(key), now)
+
+    def _touch(self, hashed: int, now: int):
+        """Move a key to the back of the index with a new last-seen time."""
+        if self.bloom is None:
+            self._seen.pop(hashed, None)
+            self._seen[hashed] = now
+        else:
+            self.bloom.add(self.key_bytes(hashed))
+        self._pending[hashed] = now
+
+    def save(self):
+        """Write newly seen articles to disk and evict expired ones."""
+        expiry = self._expiry()
+
+        with self._lock:
+            # The dictionary is ordered by last-seen time
+            evicted = 0
+            while self._seen:
+                hashed, seen_at = next(iter(self._seen.items()))
+                if seen_at >= expiry:
+                    break
+                del self._seen[hashed]
+                evicted += 1
+
+            try:
+                with self._db:
+                    self._db.executemany(
+                        "INSERT OR REPLACE INTO seen (key, seen_at) VALUES (?, ?)",
+                        self._pending.items()
+                    )
+                    self._db.execute("DELETE FROM seen WHERE seen_at < ?", (expiry,))
+                self._pending.clear()
+            except sqlite3.Error as e:
+                self.logger.error(
+                    f"Error saving seen-article index {self.index_file}: {str(e)}"
+                )
+                return
+
+            if self.bloom is not None:
+                self.bloom.flush()
+                self.bloom.expire()
+
+        if evicted:
+            self.logger.debug(f"Evicted {evicted} expired articles from the seen index")
+
+    def close(self):
+        """Save pending changes and close the index file."""
+        self.save()
+        self._db.close()
+        if self.bloom is not None:
+            self.bloom.close()
@@ -0,0 +1,271 @@
+"""
+URL canonicalization module for article links.
+Rewrites the many spellings of an article URL (tracking parameters,
+http/https, www, trailing slashes, AMP variants) to one canonical form,
+with rules configurable per domain.
+"""
+
+import fnmatch
+import re
+from typing import Dict, List, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from logger_utils import ConfigError
+
+
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+# Query parameters added by newsletters, social networks and ad trackers
+DEFAULT_STRIP_PARAMS = [
+    'utm_*', 'fbclid', 'gclid', 'dclid', 'msclkid', 'yclid', 'igshid',
+    'mc_cid', 'mc_eid', '_ga', 'ocid', 'amp'
+]
+
+# Path endings of AMP versions of an article
+DEFAULT_PATH_SUFFIXES = ['/amp', '.amp']
+
+AMP_CACHE_SUFFIX = '.cdn.ampproject.org'
+
+
+def normalize_url(url: str) -> str:
+    """
+    Normalize the spelling of a URL without changing what it points to.
+
+    The scheme and host are lowercased, default ports, fragments and a
+    trailing slash are removed. Anything that is not an http(s) URL is
+    only stripped of surrounding whitespace.
+
+    Args:
+        url: URL or opaque identifier
+
+    Returns:
+        Normalized URL
+    """
+    url = url.strip()
+    try:
+        parts = urlsplit(url)
+        port = parts.port
+    except ValueError:
+        return url
+
+    scheme = parts.scheme.lower()
+    if scheme not in DEFAULT_PORTS or not parts.hostname:
+        return url
+
+    netloc = parts.hostname
+    if port and port != DEFAULT_PORTS[scheme]:
+        netloc = f"{netloc}:{port}"
+    path = parts.path.rstrip('/') or '/'
+
+    return urlunsplit((scheme, netloc, path, parts.query, ''))
+
+
+def compile_patterns(patterns: List[str]) -> Optional[re.Pattern]:
+    """
+    Compile shell-style parameter name patterns into one regex.
+
+    Args:
+        patterns: Patterns such as ``utm_*``
+
+    Returns:
+        Case-insensitive regex matching any pattern, None if none given
+    """
+    if not patterns:
+        return None
+    return re.compile(
+        '|'.join(fnmatch.translate(pattern) for pattern in patterns),
+        re.IGNORECASE
+    )
+
+
+class UrlCanonicalizer:
+    """
+    Canonicalizes article URLs with global and per-domain rules.
+
+    Rules are compiled once per host and results are memoized, so links
+    repeated within a run are canonicalized once.
+    """
+
+    def __init__(self, force_https: bool = True, strip_www: bool = True,
+                 strip_params: Optional[List[str]] = None,
+                 path_suffixes: Optional[List[str]] = None,
+                 domains: Optional[Dict[str, Dict]] = None,
+                 cache_size: int = 100000):
+        """
+        Initialize the canonicalizer.
+
+        Args:
+            force_https: Rewrite http links to https
+            strip_www: Remove a leading ``www.`` from host names
+            strip_params: Query parameter name patterns to remove
+                (defaults to common tracking parameters)
+            path_suffixes: Path endings removed from AMP links
+            domains: Per-domain rules, keyed by domain (also applied to its
+                subdomains). Each may set force_https, strip_www,
+                path_suffixes, strip_params (added to the global ones) and
+                keep_params (only these parameters are kept)
+            cache_size: Memoized results kept before the memo is reset
+
+        Raises:
+            ConfigError: If a domain rule is not a mapping
+        """
+        self.defaults = {
+            'force_https': force_https,
+            'strip_www': strip_www,
+            'strip_params': list(DEFAULT_STRIP_PARAMS if strip_params is None
+                                 else strip_params),
+            'path_suffixes': list(DEFAULT_PATH_SUFFIXES if path_suffixes is None
+                                  else path_suffixes)
+        }
+        self.domains = domains or {}
+        for domain, rules in self.domains.items():
+            if not isinstance(rules, dict):
+                raise ConfigError(f"URL rules for {domain} must be a mapping")
+
+        self.cache_size = cache_size
+        self._cache: Dict[str, str] = {}
+        self._host_rules: Dict[str, Dict] = {}
+
+    def rules_for(self, host: str) -> Dict:
+        """
+        Get the compiled rules that apply to a host.
+
+        The most specific matching domain overrides the global rules.
+
+        Args:
+            host: Lowercase host name
+
+        Returns:
+            Dictionary with force_https, strip_www, path_suffixes and the
+            compiled strip_params and keep_params patterns
+        """
+        rules = self._host_rules.get(host)
+        if rules is not None:
+            return rules
+
+        merged = dict(self.defaults)
+        matches = [
+            domain for domain in self.domains
+            if host == domain or host.endswith('.' + domain)
+        ]
+        if matches:
+            overrides = self.domains[max(matches, key=len)]
+            merged.update(
+                (key, value) for key, value in overrides.items()
+                if key != 'strip_params'
+            )
+            merged['strip_params'] = (self.defaults['strip_params']
+                                      + list(overrides.get('strip_params', [])))
+
+        rules = {
+            'force_https': merged['force_https'],
+            'strip_www': merged['strip_www'],
+            'path_suffixes': tuple(merged['path_suffixes']),
+            'strip_params': compile_patterns(merged['strip_params']),
+            'keep_params': compile_patterns(merged.get('keep_params'))
+        }
+        self._host_rules[host] = rules
+        return rules
+
+    def canonicalize(self, url: str) -> str:
+        """
+        Get the canonical form of a URL.
+
+        Args:
+            url: Article URL
+
+        Returns:
+            Canonical URL; anything that is not an http(s) URL is returned
+            stripped of surrounding whitespace
+        """
+        canonical = self._cache.get(url)
+        if canonical is None:
+            canonical = self._canonicalize(url)
+            if len(self._cache) >= self.cache_size:
+                self._cache.clear()
+            self._cache[url] = canonical
+        return canonical
+
+    def clear_cache(self):
+        """Forget memoized results, e.g. at the start of a run."""
+        self._cache.clear()
+
+    def _canonicalize(self, url: str) -> str:
+        """Canonicalize a URL without the memo."""
+        url = self._unwrap_amp_cache(url.strip())
+        try:
+            parts = urlsplit(url)
+            port = parts.port
+        except ValueError:
+            return url
+
+        scheme = parts.scheme.lower()
+        host = parts.hostname
+        if scheme not in DEFAULT_PORTS or not host:
+            return url
+
+        rules = self.rules_for(host)
+
+        if port == DEFAULT_PORTS[scheme]:
+            port = None
+        if rules['force_https'] and scheme == 'http':
+            scheme = 'https'
+        if rules['strip_www'] and host.startswith('www.'):
+            host = host[4:]
+        netloc = f"{host}:{port}" if port else host
+
+        path = parts.path
+        for suffix in rules['path_suffixes']:
+            if path.endswith(suffix):
+                path = path[:-len(suffix)]
+                break
+        path = path.rstrip('/') or '/'
+
+        query = parts.query
+        if query:
+            params = [
+                (name, value)
+                for name, value in parse_qsl(query, keep_blank_values=True)
+                if self._keep_param(name, rules)
+            ]
+            query = urlencode(sorted(params))
+
+        return urlunsplit((scheme, netloc, path, query, ''))
+
+    @staticmethod
+    def _keep_param(name: str, rules: Dict) -> bool:
+        """Check whether a query parameter is part of the canonical URL."""
+        if rules['keep_params'] is not None:
+            return bool(rules['keep_params'].match(name))
+        return not (rules['strip_params'] and rules['strip_params'].match(name))
+
+    @staticmethod
+    def _unwrap_amp_cache(url: str) -> str:
+        """
+        Turn a Google AMP cache URL back into the publisher's URL.
+
+        Args:
+            url: Any URL
+
+        Returns:
+            Original URL for AMP cache links such as
+            ``https://example-com.cdn.ampproject.org/c/s/example.com/a``,
+            the URL unchanged otherwise
+        """
+        try:
+            parts = urlsplit(url)
+        except ValueError:
+            return url
+
+        if not (parts.hostname or '').endswith(AMP_CACHE_SUFFIX):
+            return url
+
+        segments = parts.path.split('/', 3)
+        # ['', 'c' or 'v', 's' for https or the host, rest]
+        if len(segments) < 3 or segments[1] not in ('c', 'v'):
+            return url
+        if segments[2] == 's' and len(segments) == 4:
+            target = f"https://{segments[3]}"
+        else:
+            target = f"http://{'/'.join(segments[2:])}"
+        return f"{target}?{parts.query}" if parts.query else target